@@ -65,6 +65,7 @@ from ansys.dpf.core.elements import element_types
 from ansys.dpf.core.result_info import ResultInfo
 from ansys.dpf.core.collection import Collection
 from ansys.dpf.core.workflow import Workflow
+from ansys.dpf.core.server_pool import ServerPool, WarmServerPool
 from ansys.dpf.core.cyclic_support import CyclicSupport
 from ansys.dpf.core.element_descriptor import ElementDescriptor
 from ansys.dpf.core.data_tree import DataTree
@@ -80,6 +81,7 @@ from ansys.dpf.core import server
 from ansys.dpf.core import check_version
 from ansys.dpf.core import path_utilities
 from ansys.dpf.core import settings
+from ansys.dpf.core.profiler import profile
 from ansys.dpf.core.server_factory import ServerConfig, AvailableServerConfigs
 from ansys.dpf.core.server_context import (
     set_default_server_context,
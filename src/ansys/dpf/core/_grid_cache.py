@@ -0,0 +1,132 @@
+"""Persistent on-disk cache of the PyVista grids of meshes read from result files.
+
+The cache is disabled by default, see :func:`ansys.dpf.core.settings.enable_grid_cache`.
+Each entry is a directory named after a hash of the result files (path, size and
+modification time), of the conversion options and of the mesh size. It holds the
+arrays required to build the grid, which are memory-mapped when loaded.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import warnings
+
+import numpy as np
+
+# increase when the content of the entries changes
+_CACHE_FORMAT = 1
+_ARRAYS = ("cells", "celltypes", "points", "offsets")
+
+DEFAULT_MAX_SIZE = 2**30
+
+_directory = None
+_max_size = DEFAULT_MAX_SIZE
+
+
+def _default_directory():
+    return os.path.join(os.path.expanduser("~"), ".cache", "ansys-dpf-core", "grids")
+
+
+def enable(directory=None, max_size=DEFAULT_MAX_SIZE):
+    global _directory, _max_size
+    _directory = os.path.abspath(directory) if directory is not None else _default_directory()
+    _max_size = max_size
+
+
+def disable():
+    global _directory
+    _directory = None
+
+
+def is_enabled():
+    return _directory is not None
+
+
+def key(mesh, *options):
+    """Return the key of the grid of a mesh, or ``None`` if it cannot be cached.
+
+    Only meshes read from result files reachable from the client, and not modified
+    since, can be cached. ``options`` are the JSON serializable conversion options.
+    """
+    data_sources = mesh._origin_data_sources
+    if data_sources is None:
+        return None
+    result_files = data_sources.result_files
+    if not result_files:
+        return None
+    description = []
+    for path in result_files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # the file is on a remote server
+            return None
+        description.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    from ansys.dpf.core import __version__
+
+    description += [
+        *options,
+        mesh.nodes.n_nodes,
+        mesh.elements.n_elements,
+        __version__,
+        _CACHE_FORMAT,
+    ]
+    return hashlib.sha256(json.dumps(description).encode()).hexdigest()
+
+
+def load(entry_key):
+    """Return the memory-mapped arrays of an entry, or ``None`` if it is not cached."""
+    entry = os.path.join(_directory, entry_key)
+    if not os.path.isdir(entry):
+        return None
+    arrays = {}
+    try:
+        for name in _ARRAYS:
+            path = os.path.join(entry, name + ".npy")
+            if os.path.exists(path):
+                # copy-on-write, so that the grid can be modified in place
+                arrays[name] = np.load(path, mmap_mode="c")
+        # mark the entry as recently used
+        os.utime(entry)
+    except (OSError, ValueError):
+        return None
+    return arrays
+
+
+def store(entry_key, arrays):
+    """Write an entry and evict the least recently used ones above the maximum size."""
+    try:
+        os.makedirs(_directory, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=_directory, prefix=".tmp")
+        for name, array in arrays.items():
+            if array is not None:
+                np.save(os.path.join(tmp, name + ".npy"), np.ascontiguousarray(array))
+        try:
+            os.replace(tmp, os.path.join(_directory, entry_key))
+        except OSError:
+            # stored meanwhile by another process
+            shutil.rmtree(tmp, ignore_errors=True)
+        _evict()
+    except OSError as e:
+        warnings.warn(f"Unable to store the grid in the cache {_directory}: {e}")
+
+
+def _entry_size(entry):
+    return sum(entry_file.stat().st_size for entry_file in os.scandir(entry))
+
+
+def _evict():
+    entries = [
+        entry
+        for entry in os.scandir(_directory)
+        if entry.is_dir() and not entry.name.startswith(".")
+    ]
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    sizes = [_entry_size(entry) for entry in entries]
+    total = sum(sizes)
+    for entry, size in zip(entries, sizes):
+        if total <= _max_size:
+            break
+        shutil.rmtree(entry.path, ignore_errors=True)
+        total -= size
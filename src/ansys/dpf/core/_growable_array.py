@@ -0,0 +1,116 @@
+"""Contiguous NumPy buffer with amortized growth used by the local copies of DPF entities."""
+import numpy as np
+
+
+class _GrowableArray:
+    """One-dimensional contiguous NumPy buffer which can be appended to efficiently.
+
+    The buffer over-allocates its capacity by doubling it each time it is exhausted,
+    so that a sequence of ``append``/``extend`` calls costs amortized constant time
+    per value. The valid part of the buffer is exposed as a zero-copy view.
+
+    Parameters
+    ----------
+    data : numpy.ndarray, list, optional
+        Initial content of the buffer. It is copied into the buffer.
+    dtype : numpy.dtype, optional
+        Type of the values stored in the buffer.
+    """
+
+    _MIN_CAPACITY = 16
+
+    def __init__(self, data=None, dtype=np.float64):
+        self._dtype = np.dtype(dtype)
+        self._size = 0
+        self._buffer = np.empty(0, dtype=self._dtype)
+        if data is not None:
+            self.assign(data)
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def view(self):
+        """Zero-copy view on the valid part of the buffer.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self._buffer[: self._size]
+
+    @property
+    def capacity(self):
+        return self._buffer.size
+
+    def __len__(self):
+        return self._size
+
+    def _as_flat_array(self, data):
+        return np.ascontiguousarray(data, dtype=self._dtype).reshape(-1)
+
+    def reserve(self, capacity):
+        """Ensure that the buffer can hold at least ``capacity`` values without reallocation.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of values to reserve.
+        """
+        if capacity <= self._buffer.size:
+            return
+        new_capacity = max(capacity, 2 * self._buffer.size, self._MIN_CAPACITY)
+        new_buffer = np.empty(new_capacity, dtype=self._dtype)
+        new_buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = new_buffer
+
+    def resize(self, size, fill_value=0):
+        """Change the number of valid values, filling the new values with ``fill_value``.
+
+        Parameters
+        ----------
+        size : int
+            New number of values.
+        fill_value : int, float, optional
+            Value given to the values added at the end of the buffer.
+        """
+        self.reserve(size)
+        if size > self._size:
+            self._buffer[self._size : size] = fill_value
+        self._size = size
+
+    def assign(self, data):
+        """Replace the content of the buffer with a copy of ``data``.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, list
+            New content. Multi-dimensional data is flattened.
+        """
+        self._buffer = np.array(data, dtype=self._dtype, order="C").reshape(-1)
+        self._size = self._buffer.size
+
+    def append(self, value):
+        """Add a single value at the end of the buffer."""
+        if self._size == self._buffer.size:
+            self.reserve(self._size + 1)
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def extend(self, data):
+        """Add values at the end of the buffer.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, list
+            Values to add. Multi-dimensional data is flattened.
+        """
+        array = self._as_flat_array(data)
+        new_size = self._size + array.size
+        self.reserve(new_size)
+        self._buffer[self._size : new_size] = array
+        self._size = new_size
+
+    def tolist(self):
+        return self.view.tolist()
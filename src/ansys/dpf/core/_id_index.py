@@ -0,0 +1,70 @@
+"""Vectorized map from entity IDs to their indices, used for meshes and local scopings."""
+import numpy as np
+
+
+class _IdIndex:
+    """Map entity IDs to their indices with vectorized NumPy lookups.
+
+    When the IDs are compact, a dense lookup table indexed by ``id - min(ids)`` is used.
+    Otherwise, the IDs are sorted once and looked up with ``numpy.searchsorted``.
+    As with a dictionary built from the IDs, the last index wins for duplicated IDs.
+
+    Parameters
+    ----------
+    ids : numpy.ndarray, list[int]
+        IDs of the entities, ordered by index.
+    """
+
+    # a dense table is used when the IDs span at most this many times their count
+    _DENSE_FACTOR = 4
+
+    def __init__(self, ids):
+        ids = np.asarray(ids).reshape(-1)
+        self._size = ids.size
+        self._min = 0
+        self._lookup = None
+        self._sorted_ids = None
+        self._order = None
+        if ids.size == 0:
+            self._lookup = np.empty(0, dtype=np.int32)
+            return
+        self._min = int(ids.min())
+        span = int(ids.max()) - self._min + 1
+        if span <= self._DENSE_FACTOR * ids.size:
+            self._lookup = np.full(span, -1, dtype=np.int32)
+            self._lookup[ids - self._min] = np.arange(ids.size, dtype=np.int32)
+        else:
+            self._order = np.argsort(ids, kind="stable").astype(np.int32)
+            self._sorted_ids = ids[self._order]
+
+    def __len__(self):
+        return self._size
+
+    def indices(self, ids):
+        """Retrieve the indices of several IDs.
+
+        Parameters
+        ----------
+        ids : numpy.ndarray, list[int]
+            IDs to look up.
+
+        Returns
+        -------
+        indices : numpy.ndarray
+            Index of each ID, or ``-1`` for IDs which are not in the index.
+        """
+        ids = np.asarray(ids, dtype=np.int64).reshape(-1)
+        if self._lookup is not None:
+            positions = ids - self._min
+            valid = (positions >= 0) & (positions < self._lookup.size)
+            out = np.full(ids.size, -1, dtype=np.int32)
+            out[valid] = self._lookup[positions[valid]]
+            return out
+        positions = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+        positions = np.maximum(positions, 0)
+        found = self._sorted_ids[positions] == ids
+        return np.where(found, self._order[positions], -1).astype(np.int32)
+
+    def index(self, id):
+        """Retrieve the index of an ID, or ``-1`` if the ID is not in the index."""
+        return int(self.indices([id])[0])
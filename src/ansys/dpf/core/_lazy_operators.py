@@ -0,0 +1,109 @@
+"""Lazy loading of the generated operator modules.
+
+The operator packages only list the names of their submodules, which are
+imported on first attribute access through the module ``__getattr__``.
+Their ``__init__.py`` files are written by :func:`write_init_files` once the
+operators are generated.
+"""
+import importlib
+import os
+import sys
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Package whose submodules are imported on first access."""
+
+    _lazy_names = frozenset()
+    _lazy_classes = False
+
+    def __getattr__(self, name):
+        if name not in self._lazy_names:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        value = importlib.import_module(f".{name}", self.__name__)
+        # importing the submodule already bound it on the package, see __setattr__
+        return self.__dict__.get(name, value)
+
+    def __setattr__(self, name, value):
+        # The import system binds submodules on their package, whereas an
+        # operator package exposes the operator class of each submodule.
+        if (
+            self._lazy_classes
+            and name in self._lazy_names
+            and isinstance(value, types.ModuleType)
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | self._lazy_names)
+
+
+def make_lazy(module_name, names, classes=True):
+    """Make a package load its submodules lazily.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the package, usually ``__name__``.
+    names : list[str]
+        Names of the submodules of the package.
+    classes : bool, optional
+        Whether the package exposes, for each submodule, the class with the same
+        name defined in it (operator packages) rather than the submodule itself
+        (packages of operator packages). The default is ``True``.
+    """
+    module = sys.modules[module_name]
+    module.__class__ = type(
+        "_LazyModule", (_LazyModule,), {"_lazy_names": frozenset(names), "_lazy_classes": classes}
+    )
+    module.__all__ = list(names)
+
+
+_INIT_TEMPLATE = '''"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+{names}
+    ],{classes}
+)
+'''
+
+
+def _write_init_file(package_path, names, classes):
+    content = _INIT_TEMPLATE.format(
+        names="\n".join(f'        "{name}",' for name in names),
+        classes="" if classes else "\n    classes=False,",
+    )
+    with open(os.path.join(package_path, "__init__.py"), "w") as f:
+        f.write(content)
+
+
+def write_init_files(operators_path):
+    """Write the lazy ``__init__.py`` files of the generated operator packages.
+
+    The operator code generation writes ``__init__.py`` files importing all the
+    operator modules, they are replaced by files listing them.
+
+    Parameters
+    ----------
+    operators_path : str or os.PathLike
+        Path of the ``ansys.dpf.core.operators`` package. Its subdirectories with an
+        ``__init__.py`` file are the operator packages.
+    """
+    categories = []
+    for category in sorted(os.listdir(operators_path)):
+        category_path = os.path.join(operators_path, category)
+        if not os.path.isfile(os.path.join(category_path, "__init__.py")):
+            continue
+        names = sorted(
+            os.path.splitext(file_name)[0]
+            for file_name in os.listdir(category_path)
+            if file_name.endswith(".py") and not file_name.startswith("_")
+        )
+        _write_init_file(category_path, names, classes=True)
+        categories.append(category)
+    _write_init_file(operators_path, categories, classes=False)
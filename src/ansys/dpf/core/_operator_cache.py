@@ -0,0 +1,206 @@
+"""In-memory cache of the outputs of operators, keyed by a fingerprint of their inputs.
+
+The cache is disabled by default, see :func:`ansys.dpf.core.settings.enable_operator_cache`.
+The key of an output is made of the operator name, its configuration, the output pin
+and type, and of a fingerprint of each connected input: the values of the
+primitive inputs, the key, path, size and modification time of every file of
+the data sources, a hash of the IDs of the scopings and the keys of the upstream
+operators. Operators with other inputs, such as fields or meshes which can be
+modified after being connected, and data sources with upstreams or domains are not cached.
+Streams are never cached, since they keep the result files open.
+"""
+import collections
+import hashlib
+import itertools
+import os
+import threading
+from enum import Enum
+
+import numpy as np
+
+DEFAULT_MAX_SIZE = 2**30
+# the outputs without data on the client, such as supports or scalars, still hold
+# server objects: each entry counts for at least MIN_ENTRY_SIZE bytes
+MIN_ENTRY_SIZE = 2**10
+MAX_ENTRIES = 2**10
+
+_lock = threading.Lock()
+_enabled = False
+_max_size = DEFAULT_MAX_SIZE
+# key: (output, estimated size in bytes), from the least to the most recently used
+_entries = collections.OrderedDict()
+_size = 0
+_hits = 0
+_misses = 0
+# unique keys of the servers, never reused unlike their id
+_server_keys = itertools.count()
+
+MISSING = object()
+
+
+class Uncacheable(Exception):
+    """An input of the operator has no fingerprint."""
+
+
+def enable(max_size=DEFAULT_MAX_SIZE):
+    global _enabled, _max_size
+    with _lock:
+        _enabled = True
+        _max_size = max_size
+        _evict()
+
+
+def disable():
+    global _enabled
+    _enabled = False
+    clear()
+
+
+def is_enabled():
+    return _enabled
+
+
+def clear():
+    global _size, _hits, _misses
+    with _lock:
+        _entries.clear()
+        _size = 0
+        _hits = 0
+        _misses = 0
+
+
+def stats():
+    with _lock:
+        return {
+            "hits": _hits,
+            "misses": _misses,
+            "entries": len(_entries),
+            "size": _size,
+            "max_size": _max_size,
+        }
+
+
+def get(key):
+    """Return the cached output of a key, or ``MISSING``."""
+    global _hits, _misses
+    with _lock:
+        entry = _entries.get(key)
+        if entry is None:
+            _misses += 1
+            return MISSING
+        _entries.move_to_end(key)
+        _hits += 1
+        return entry[0]
+
+
+def put(key, output):
+    global _size
+    from ansys.dpf.core.streams_container import StreamsContainer
+
+    if isinstance(output, StreamsContainer):
+        # the streams keep the result files open
+        return False
+    size = nbytes(output)
+    with _lock:
+        if not _enabled or size > _max_size:
+            return False
+        previous = _entries.pop(key, None)
+        if previous is not None:
+            _size -= previous[1]
+        _entries[key] = (output, size)
+        _size += size
+        _evict()
+    return True
+
+
+def invalidate(keys):
+    global _size
+    with _lock:
+        for key in keys:
+            entry = _entries.pop(key, None)
+            if entry is not None:
+                _size -= entry[1]
+
+
+def _evict():
+    global _size
+    while (_size > _max_size or len(_entries) > MAX_ENTRIES) and _entries:
+        _, (_, size) = _entries.popitem(last=False)
+        _size -= size
+
+
+def server_key(server):
+    """Return the key of a server in the cache, unique for the whole session."""
+    key = getattr(server, "_operator_cache_key", None)
+    if key is None:
+        with _lock:
+            key = getattr(server, "_operator_cache_key", None)
+            if key is None:
+                key = server._operator_cache_key = next(_server_keys)
+    return key
+
+
+def fingerprint(inpt, pin_out=0):
+    """Return a hashable fingerprint of an input connected to an operator.
+
+    Raises
+    ------
+    Uncacheable
+        If the input has no fingerprint.
+    """
+    from ansys.dpf.core.data_sources import DataSources
+    from ansys.dpf.core.dpf_operator import Operator
+    from ansys.dpf.core.scoping import Scoping
+
+    if isinstance(inpt, Enum):
+        inpt = inpt.value
+    if inpt is None or isinstance(inpt, (bool, int, float, str)):
+        return type(inpt).__name__, inpt
+    if isinstance(inpt, os.PathLike):
+        return "str", str(inpt)
+    if isinstance(inpt, (list, tuple)):
+        return "list", tuple(fingerprint(value) for value in inpt)
+    if isinstance(inpt, dict):
+        return "dict", tuple(sorted((key, fingerprint(value)) for key, value in inpt.items()))
+    if isinstance(inpt, Operator):
+        return "operator", inpt._cache_key(), pin_out
+    if isinstance(inpt, DataSources):
+        return _data_sources_fingerprint(inpt)
+    if isinstance(inpt, Scoping):
+        ids = np.ascontiguousarray(inpt._get_ids(np_array=True), dtype=np.int32)
+        return "scoping", inpt.location, hashlib.sha256(ids.tobytes()).hexdigest()
+    raise Uncacheable(type(inpt).__name__)
+
+
+def _data_sources_fingerprint(data_sources):
+    if not getattr(data_sources, "_paths_only", False):
+        # upstreams and domain IDs cannot be read back from the data sources
+        raise Uncacheable("data sources with upstreams, domains or created on the server")
+    files = []
+    for key, path in data_sources._paths_by_key():
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # the file is on a remote server, its modifications cannot be detected
+            raise Uncacheable(path)
+        files.append((key, os.path.abspath(path), stat.st_size, stat.st_mtime_ns))
+    if not files:
+        raise Uncacheable("data sources without files")
+    return "data_sources", data_sources.result_key, tuple(files)
+
+
+def nbytes(output):
+    """Estimate the size of an output in bytes, at least ``MIN_ENTRY_SIZE``."""
+    from ansys.dpf.core.collection import Collection
+    from ansys.dpf.core.field_base import _FieldBase
+    from ansys.dpf.core.meshed_region import MeshedRegion
+
+    size = 0
+    if isinstance(output, _FieldBase):
+        size = output.size * 8
+    elif isinstance(output, Collection):
+        size = sum(nbytes(entry) for entry in output)
+    elif isinstance(output, MeshedRegion):
+        # coordinates, and about 10 nodes and properties per element
+        size = output.nodes.n_nodes * 24 + output.elements.n_elements * 80
+    return max(size, MIN_ENTRY_SIZE)
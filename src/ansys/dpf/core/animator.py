@@ -5,11 +5,40 @@ This module contains the DPF animator class.
 
 Contains classes used to animate results based on workflows using PyVista.
 """
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from typing import Union, Sequence
 
 import ansys.dpf.core as core
+from ansys.dpf.core.common import locations
 from ansys.dpf.core.plotter import _sort_supported_kwargs, _PyVistaPlotter
+from ansys.dpf.core.server_types import LegacyGrpcServer
+
+
+_ANIMATED_SCALARS = "_dpf_animated_scalars"
+
+
+def _prefetched(function, items, depth):
+    """Yield ``function(item)`` for each item, evaluating up to ``depth`` items ahead
+    in a background thread.
+
+    A single worker is used so that the evaluations, which share the same workflow,
+    run one after another while the results are consumed.
+    """
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(function, item))
+                if len(pending) > depth:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 class _InternalAnimatorFactory:
@@ -36,6 +65,7 @@ class _PyVistaAnimator(_PyVistaPlotter):
         save_as="",
         mode_number=None,
         scale_factor=1.0,
+        prefetch_frames=4,
         **kwargs,
     ):
 
@@ -81,9 +111,7 @@ class _PyVistaAnimator(_PyVistaPlotter):
             if isinstance(cpos[0][0], float):
                 cpos = [cpos] * len(indices)
 
-        def render_frame(frame):
-            self._plotter.clear()
-
+        def evaluate_frame(frame):
             if mode_number is None:
                 workflow.connect(input_name, [frame])
 
@@ -94,13 +122,11 @@ class _PyVistaAnimator(_PyVistaPlotter):
             deform = None
             if "deform_by" in workflow.output_names:
                 deform = workflow.get_output("deform_by", core.types.field)
-            self.add_field(
-                field,
-                deform_by=deform,
-                scale_factor_legend=scale_factor[frame],
-                **kwargs,
-            )
+            return field, deform
+
+        def add_frame_text(frame, **text_kwargs):
             kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_text, **freq_kwargs)
+            kwargs_in.update(text_kwargs)
             if mode_number is None:
                 str_template = "t={0:{2}} {1}"
                 self._plotter.add_text(
@@ -112,9 +138,86 @@ class _PyVistaAnimator(_PyVistaPlotter):
                     str_template.format(mode_number, unit, freq_fmt), **kwargs_in
                 )
 
+        def render_frame(frame):
+            self._plotter.clear()
+            field, deform = evaluate_frame(frame)
+            self.add_field(
+                field,
+                deform_by=deform,
+                scale_factor_legend=scale_factor[frame],
+                **kwargs,
+            )
+            add_frame_text(frame)
+
             if cpos:
                 self._plotter.camera_position = cpos[frame]
 
+        # The pipelined mode adds the grid once and only updates its scalars and points,
+        # which does not support the labels of show_max and show_min.
+        pipelined = prefetch_frames > 0 and not (kwargs.get("show_max") or kwargs.get("show_min"))
+        animated = {}
+
+        def evaluate_frame_arrays(frame):
+            # May be called in the background: only uses the workflow and the
+            # cached mesh data, the plotter being updated by the main thread.
+            field, deform = evaluate_frame(frame)
+            data = self._map_field_data(field, animated["mesh_location"])
+            points = None
+            if deform is not None:
+                points = animated["meshed_region"]._deformed_points(deform)
+            return data, points
+
+        def update_frame(frame, data, points):
+            grid = animated["grid"]
+            animated["grid_data"][_ANIMATED_SCALARS] = data
+            if points is not None:
+                grid.points = points
+                frame_scale_factor = scale_factor[frame]
+                if (
+                    frame_scale_factor is not False
+                    and frame_scale_factor != scale_factor[frame - 1]
+                ):
+                    self.add_scale_factor_legend(
+                        frame_scale_factor, name="scale_factor_legend", **kwargs
+                    )
+            if "clim" not in kwargs:
+                values = np.linalg.norm(data, axis=1) if data.ndim > 1 else data
+                if not np.isnan(values).all():
+                    animated["actor"].GetMapper().SetScalarRange(
+                        np.nanmin(values), np.nanmax(values)
+                    )
+            if mode_number is None:
+                add_frame_text(frame, name="frame_text")
+            if cpos:
+                self._plotter.camera_position = cpos[frame]
+            self._plotter.render()
+
+        def render_first_frame():
+            field, deform = evaluate_frame(0)
+            meshed_region = field.meshed_region
+            animated["meshed_region"] = meshed_region
+            animated["mesh_location"] = self._get_mesh_location(field, meshed_region)
+            frame_kwargs = self._set_field_kwargs(field, dict(kwargs))
+            # Copy the grid of the mesh to update it in place
+            grid = meshed_region.grid.copy()
+            grid.set_active_scalars(None)
+            if deform is not None:
+                grid.points = meshed_region._deformed_points(deform)
+            if field.location == locations.nodal:
+                grid_data = grid.point_data
+            else:
+                grid_data = grid.cell_data
+            grid_data[_ANIMATED_SCALARS] = self._map_field_data(field, animated["mesh_location"])
+            kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_mesh, **frame_kwargs)
+            animated["actor"] = self._plotter.add_mesh(grid, scalars=_ANIMATED_SCALARS, **kwargs_in)
+            animated["grid"] = grid
+            animated["grid_data"] = grid_data
+            if deform is not None and scale_factor[0] is not False:
+                self.add_scale_factor_legend(scale_factor[0], name="scale_factor_legend", **kwargs)
+            add_frame_text(0, name="frame_text")
+            if cpos:
+                self._plotter.camera_position = cpos[0]
+
         try:
 
             def animation():
@@ -131,18 +234,34 @@ class _PyVistaAnimator(_PyVistaPlotter):
                             return result
                 # For each additional frame requested
                 if len(indices) > 1:
+                    arrays = None
+                    if pipelined and isinstance(workflow._server, LegacyGrpcServer):
+                        arrays = _prefetched(
+                            evaluate_frame_arrays, range(1, len(indices)), prefetch_frames
+                        )
+                    elif pipelined:
+                        # only the thread safe LegacyGrpcServer evaluates in the background
+                        arrays = (evaluate_frame_arrays(i) for i in range(1, len(indices)))
                     for frame in range(1, len(indices)):
                         try:
-                            render_frame(frame)
+                            if pipelined:
+                                update_frame(frame, *next(arrays))
+                            else:
+                                render_frame(frame)
                         except AttributeError as e:  # pragma: no cover
                             if "'NoneType' object has no attribute 'interactor'" in e.args[0]:
                                 print("Animation canceled.")
+                                if arrays is not None:
+                                    arrays.close()
                                 return result
                         if save_as:
                             self._plotter.write_frame()
 
             # Write initial frame
-            render_frame(0)
+            if pipelined:
+                render_first_frame()
+            else:
+                render_frame(0)
             # If not off_screen, enable the user to choose the camera position
             off_screen = kwargs.pop("off_screen", None)
             if off_screen is None:
@@ -241,6 +360,7 @@ class Animator:
         save_as: str = None,
         scale_factor: Union[float, Sequence[float]] = 1.0,
         freq_kwargs: dict = None,
+        prefetch_frames: int = 4,
         **kwargs,
     ):
         """
@@ -268,6 +388,13 @@ class Animator:
             Dictionary of kwargs given to the :func:`pyvista.Plotter.add_text` method, used to
             format the frequency information. Can also contain a "fmt" key,
             defining the format for the frequency displayed with a string such as ".3e".
+        prefetch_frames : int, optional
+            Number of frames evaluated in the background while the current frame
+            renders. The mesh is then added once and only its scalars and points are
+            updated at each frame. Defaults to 4. Use 0 to evaluate and add the mesh
+            again at each frame, which is always the case with ``show_max`` or ``show_min``.
+            Only the workflows of a ``LegacyGrpcServer``, which is thread safe, are
+            evaluated in the background, the frames are otherwise evaluated one at a time.
         **kwargs : optional
             Additional keyword arguments for the animator.
             Used by :func:`pyvista.Plotter` (off_screen, cpos, ...),
@@ -288,6 +415,7 @@ class Animator:
             save_as=save_as,
             scale_factor=scale_factor,
             freq_kwargs=freq_kwargs,
+            prefetch_frames=prefetch_frames,
             **kwargs,
         )
 
@@ -7,10 +7,11 @@ Contains classes associated with the DPF collection.
 import abc
 import warnings
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
-from ansys.dpf.core.server_types import BaseServer
+from ansys.dpf.core.server_types import BaseServer, LegacyGrpcServer
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.label_space import LabelSpace
 from ansys.dpf.core import server as server_module
@@ -40,7 +41,15 @@ class Collection:
 
     """
 
+    # number of entries requested at once when iterating over the collection
+    _ITER_CHUNK_SIZE = 100
+    # maximum number of concurrent requests sent to a LegacyGrpcServer for bulk retrieval
+    _MAX_CONCURRENT_REQUESTS = 8
+
     def __init__(self, collection=None, server: BaseServer = None):
+        # label spaces already retrieved, by entry index
+        self._label_spaces = {}
+
         # step 1: get server
         self._server = server_module.get_or_create_server(server)
 
@@ -157,6 +166,7 @@ class Collection:
             self._api.collection_add_label_with_default_value(self, label, default_value)
         else:
             self._api.collection_add_label(self, label)
+        self._label_spaces.clear()
 
     def _get_labels(self):
         """Retrieve labels scoping the collection.
@@ -220,21 +230,63 @@ class Collection:
                 label_space=label_space_or_index, obj=self, server=self._server
             )
             num = self._api.collection_get_num_obj_for_label_space(self, client_label_space)
-            out = []
-            for i in range(0, num):
-                out.append(
-                    self.create_subtype(
-                        self._api.collection_get_obj_by_index_for_label_space(
-                            self, client_label_space, i
-                        )
+            return self._map_requests(
+                lambda i: self.create_subtype(
+                    self._api.collection_get_obj_by_index_for_label_space(
+                        self, client_label_space, i
                     )
-                )
-            return out
+                ),
+                range(num),
+            )
         else:
             return self.create_subtype(
                 self._api.collection_get_obj_by_index(self, label_space_or_index)
             )
 
+    def _get_entries_bulk(self, label_space_or_indices):
+        """Retrieve several entries at once.
+
+        With a ``LegacyGrpcServer``, the entries are requested concurrently.
+
+        Parameters
+        ----------
+        label_space_or_indices : dict[str,int], list[int], range
+            Label space or indices of the requested entries. For example,
+            ``{"time": 1}`` or ``range(10, 20)``.
+
+        Returns
+        -------
+        entries : list[Scoping], list[Field], list[MeshedRegion]
+            Entries corresponding to the request, in the order of the indices.
+        """
+        if isinstance(label_space_or_indices, dict):
+            return self._get_entries(label_space_or_indices)
+        size = len(self)
+        indices = []
+        for index in label_space_or_indices:
+            index = int(index)
+            if index < 0:
+                index += size
+            if not 0 <= index < size:
+                raise IndexError(f"Index {index} is out of range for {size} entries.")
+            indices.append(index)
+        return self._map_requests(
+            lambda i: self.create_subtype(self._api.collection_get_obj_by_index(self, i)), indices
+        )
+
+    def _map_requests(self, request, items):
+        """Apply ``request`` to each item, concurrently when the server is a LegacyGrpcServer.
+
+        Only the servers using the Python gRPC stubs, which are thread-safe, are
+        queried concurrently. The results are returned in the order of ``items``.
+        """
+        items = list(items)
+        if len(items) > 1 and isinstance(self._server, LegacyGrpcServer):
+            n_workers = min(self._MAX_CONCURRENT_REQUESTS, len(items))
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                return list(executor.map(request, items))
+        return [request(item) for item in items]
+
     def _get_entry(self, label_space_or_index):
         """Retrieve the entry at a requested label space or index.
 
@@ -273,7 +325,46 @@ class Collection:
         label_space : dict(str:int)
             Scoping of the requested entry. For example,
             ``{"time": 1, "complex": 0}``.
+
+        Notes
+        -----
+        Label spaces are cached once retrieved. The cache is cleared when an entry
+        or a label is added through this collection.
+        """
+        label_space = self._label_spaces.get(index)
+        if label_space is None:
+            label_space = self._get_label_space_from_server(index)
+            self._label_spaces[index] = label_space
+        return dict(label_space)
+
+    def get_label_spaces(self, indices=None):
+        """Retrieve the label spaces of several entries.
+
+        The label spaces which are not cached yet are requested at once,
+        concurrently with a ``LegacyGrpcServer``.
+
+        Parameters
+        ----------
+        indices : list[int], range, optional
+            Indices of the entries. The default is ``None``, in which case the
+            label spaces of all the entries are returned.
+
+        Returns
+        -------
+        label_spaces : list[dict(str:int)]
+            Label spaces of the requested entries, in the order of the indices.
         """
+        if indices is None:
+            indices = range(len(self))
+        indices = [int(index) for index in indices]
+        missing = [index for index in dict.fromkeys(indices) if index not in self._label_spaces]
+        for index, label_space in zip(
+            missing, self._map_requests(self._get_label_space_from_server, missing)
+        ):
+            self._label_spaces[index] = label_space
+        return [dict(self._label_spaces[index]) for index in indices]
+
+    def _get_label_space_from_server(self, index):
         return LabelSpace(
             label_space=self._api.collection_get_obj_label_space_by_index(self, index),
             server=self._server,
@@ -362,6 +453,7 @@ class Collection:
         """
         client_label_space = LabelSpace(label_space=label_space, obj=self, server=self._server)
         self._api.collection_add_entry(self, client_label_space, entry)
+        self._label_spaces.clear()
 
     def _get_time_freq_support(self):
         """Retrieve time frequency support.
@@ -431,8 +523,11 @@ class Collection:
         return self._internal_obj
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        # entries are requested by chunks to limit the number of round trips
+        size = len(self)
+        for start in range(0, size, self._ITER_CHUNK_SIZE):
+            stop = min(start + self._ITER_CHUNK_SIZE, size)
+            yield from self._get_entries_bulk(range(start, stop))
 
 
 class IntegralCollection(Collection):
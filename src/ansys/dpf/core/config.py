@@ -13,7 +13,7 @@ from ansys.dpf.gate import (
     operator_config_grpcapi,
     operator_config_abstract_api,
 )
-from ansys.dpf.core.operator_specification import Specification
+from ansys.dpf.core.operator_specification import _get_specification
 
 
 class Config:
@@ -110,7 +110,7 @@ class Config:
     @property
     def _spec(self):
         if self._spec_instance is None and self._operator_name is not None:
-            self._spec_instance = Specification(self._operator_name, server=self._server)
+            self._spec_instance = _get_specification(self._operator_name, server=self._server)
         return self._spec_instance
 
     @property
@@ -10,6 +10,7 @@ import weakref
 from ansys.dpf.core import errors, misc
 from ansys.dpf.core import server as server_module
 from ansys.dpf.core.check_version import version_requires
+from ansys.dpf.core.operator_specification import clear_specification_cache
 from ansys.dpf.core.runtime_config import (
     RuntimeClientConfig,
     RuntimeCoreConfig,
@@ -366,6 +367,8 @@ class BaseService:
             self._internal_obj = self._api.data_processing_load_library(
                 name=name, dllPath=file_path, symbol=symbol
             )
+        # the new operators may override the specifications cached for this server
+        clear_specification_cache(self._server())
         if generate_operators:
             # TODO: fix code generation upload posix
             import os
@@ -404,6 +407,10 @@ class BaseService:
                 __generate_code(
                     TARGET_PATH=LOCAL_PATH, filename=file_path, name=name, symbol=symbol
                 )
+            # the generated __init__ files import all the operators
+            from ansys.dpf.core._lazy_operators import write_init_files
+
+            write_init_files(LOCAL_PATH)
 
     @version_requires("6.0")
     def apply_context(self, context):
@@ -19,8 +19,13 @@ from ansys.dpf.core import (
     operator_specification,
     dpf_operator,
     collection,
+    field,
+    fields_factory,
+    property_field,
     AvailableServerContexts,
 )
+from ansys.dpf.core.common import locations, natures
+from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core._custom_operators_helpers import (
     __operator_main__,
     functions_registry,
@@ -176,6 +181,88 @@ class CustomOperatorBase:
             return numpy.ctypeslib.as_array(out, shape=(int(size),))
         raise TypeError(f"{type} is not a supported operator input")
 
+    def get_input_array(self, index, type: type = field.Field) -> numpy.ndarray:
+        """
+        Method used to get the data of a Field or PropertyField input as a numpy array
+        in the ``run`` method.
+
+        The array is a view on the data of the input held by the server, no data is
+        copied. It must only be used during the ``run`` method.
+
+        Parameters
+        ----------
+        index : int
+            Index of the input.
+
+        type : type, optional
+            ``Field`` for ``float64`` data, or ``PropertyField`` for ``int32`` data.
+            The default is ``Field``.
+
+        Returns
+        -------
+        data : numpy.ndarray
+            Data of shape ``(n_entities,)`` or ``(n_entities, n_components)``.
+        """
+        type = dpf_operator._write_output_type_to_type(type)
+        if type not in (field.Field, property_field.PropertyField):
+            raise TypeError(f"{type} is not a Field or PropertyField type")
+        return self.get_input(index, type).data
+
+    def set_output_array(
+        self, index: int, array, scoping=None, location: str = locations.nodal
+    ) -> None:
+        """
+        Add a numpy array as a Field output, or as a PropertyField output for an
+        array of integers, at the given index.
+        To use in the ``run`` method.
+
+        The data is copied once into the output.
+
+        Parameters
+        ----------
+        index : int
+            Index of the output.
+
+        array : numpy.ndarray
+            Data of shape ``(n_entities,)`` or ``(n_entities, n_components)``.
+            Arrays of integers must be of shape ``(n_entities,)``, since the number
+            of components of a PropertyField cannot be set.
+
+        scoping : Scoping, numpy.ndarray, list[int], optional
+            Scoping or IDs of the entities. The default is ``None``, in which case
+            the IDs go from 1 to the number of entities.
+
+        location : str, optional
+            Location of the output. The default is ``"Nodal"``.
+
+        """
+        array = numpy.asarray(array)
+        if array.ndim not in (1, 2):
+            raise ValueError(f"An array of 1 or 2 dimensions is expected, not {array.ndim}.")
+        n_entities = array.shape[0]
+        n_components = 1 if array.ndim == 1 else array.shape[1]
+        if numpy.issubdtype(array.dtype, numpy.integer):
+            if array.ndim != 1:
+                raise ValueError(
+                    f"An array of integers of 1 dimension is expected, not {array.ndim}."
+                )
+            output = property_field.PropertyField(
+                nentities=n_entities, nature=natures.scalar, location=location, server=dpf.SERVER
+            )
+        else:
+            nature, ncomp_n = fields_factory._nature_of_components(n_components)
+            output = fields_factory._create_field(
+                dpf.SERVER, nature, n_entities, location, ncomp_n=ncomp_n
+            )
+        output.data = array
+        if isinstance(scoping, Scoping):
+            output.scoping = scoping
+        else:
+            if scoping is None:
+                scoping = numpy.arange(1, n_entities + 1, dtype=numpy.int32)
+            output.scoping.ids = scoping
+        self.set_output(index, output)
+
     def set_failed(self) -> None:
         """
         Set the Operator's status to "failed".
@@ -62,6 +62,11 @@ class DataSources:
         # step3: init environment
         self._api.init_data_sources_environment(self)  # creates stub when gRPC
 
+        # whether all the content of the data sources was set from this instance, only
+        # its keys and paths can be read back: upstreams, domain IDs and the result
+        # keys of the files added for a specified result cannot
+        self._paths_only = data_sources is None
+
         # step4: if object exists: take instance, else create it:
         # object_name -> protobuf.message, DPFObject*
         if data_sources is not None:
@@ -137,6 +142,7 @@ class DataSources:
 
         """
         self._api.data_sources_set_domain_result_file_path_utf8(self, str(path), domain_id)
+        self._paths_only = False
 
     def add_file_path(self, filepath, key="", is_domain: bool = False, domain_id=0):
         """Add a file path to the data sources.
@@ -175,6 +181,7 @@ class DataSources:
                 self._api.data_sources_add_domain_file_path_with_key_utf8(
                     self, str(filepath), key, domain_id
                 )
+                self._paths_only = False
         else:
             if key == "":
                 self._api.data_sources_add_file_path_utf8(self, str(filepath))
@@ -208,6 +215,7 @@ class DataSources:
         self._api.data_sources_add_file_path_for_specified_result_utf8(
             self, str(filepath), key, result_key
         )
+        self._paths_only = False
 
     def add_upstream(self, upstream_data_sources, result_key=""):
         """Add upstream data sources.
@@ -230,6 +238,7 @@ class DataSources:
             self._api.data_sources_add_upstream_data_sources_for_specified_result(
                 self, upstream_data_sources, result_key
             )
+        self._paths_only = False
 
     def add_upstream_for_domain(self, upstream_data_sources, domain_id):
         """Add an upstream data sources for a given domain.
@@ -249,6 +258,23 @@ class DataSources:
         self._api.data_sources_add_upstream_domain_data_sources(
             self, upstream_data_sources, domain_id
         )
+        self._paths_only = False
+
+    def _paths_by_key(self):
+        """List the files of the data sources.
+
+        Returns
+        -------
+        list[tuple(str, str)]
+            Key and path of each file.
+        """
+        files = []
+        for i_key in range(self._api.data_sources_get_num_keys(self)):
+            num_paths = integral_types.MutableInt32()
+            key = self._api.data_sources_get_key(self, i_key, num_paths)
+            for i_path in range(int(num_paths)):
+                files.append((key, self._api.data_sources_get_path(self, key, i_path)))
+        return files
 
     @property
     def result_key(self):
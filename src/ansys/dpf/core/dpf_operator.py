@@ -5,6 +5,7 @@ Operator
 ========
 """
 
+import asyncio
 import logging
 import os
 import traceback
@@ -19,7 +20,8 @@ from ansys.dpf.core.mapping_types import types
 from ansys.dpf.core.common import types_enum_to_types
 from ansys.dpf.core.outputs import Output, Outputs, _Outputs
 from ansys.dpf.core import server as server_module
-from ansys.dpf.core.operator_specification import Specification
+from ansys.dpf.core import _operator_cache
+from ansys.dpf.core.operator_specification import Specification, _get_specification
 from ansys.dpf.core.unit_system import UnitSystem
 from ansys.dpf.gate import (
     operator_capi,
@@ -100,6 +102,14 @@ class Operator:
         self._internal_obj = None
         self._description = None
         self._inputs = None
+        # connected inputs, which key the outputs in the evaluation cache with the configuration
+        self._connected_inputs = {}
+        # configuration set on the operator, and its key computed on first cache lookup
+        self._config = None
+        self._config_key = None
+        self._cached_keys = set()
+        # False once the inputs can be connected outside of connect, by a workflow
+        self._inputs_recorded = True
 
         # step 1: get server
         self._server = server_module.get_or_create_server(server)
@@ -123,7 +133,7 @@ class Operator:
                 f"in your Context (Entry/Premium) and in your loaded plugins."
             )
 
-        self._spec = Specification(operator_name=self.name, server=self._server)
+        self._spec = _get_specification(self.name, server=self._server)
         # add dynamic inputs
         if len(self._spec.inputs) > 0 and self._inputs is None:
             self._inputs = Inputs(self._spec.inputs, self)
@@ -229,7 +239,11 @@ class Operator:
         """
         if inpt is self:
             raise ValueError("Cannot connect to itself.")
-        elif isinstance(inpt, Operator):
+        self._connected_inputs[pin] = (
+            (inpt._operator, inpt._pin) if isinstance(inpt, Output) else (inpt, pin_out)
+        )
+        self._invalidate_cached_outputs()
+        if isinstance(inpt, Operator):
             self._api.operator_connect_operator_output(self, pin, inpt, pin_out)
         elif isinstance(inpt, Output):
             self._api.operator_connect_operator_output(self, pin, inpt._operator, inpt._pin)
@@ -431,6 +445,11 @@ class Operator:
         To activate the progress bar for server version higher or equal to 3.0,
         use ``my_op.progress_bar=True``
 
+        When the evaluation cache is enabled with
+        :func:`ansys.dpf.core.settings.enable_operator_cache`, operators with the same
+        name, configuration and inputs return the same output object, which must not
+        be modified.
+
         Parameters
         ----------
         pin : int, optional
@@ -444,6 +463,59 @@ class Operator:
             Output of the operator.
         """
         output_type = _write_output_type_to_type(output_type)
+        if output_type is not None and _operator_cache.is_enabled():
+            try:
+                key = (
+                    _operator_cache.server_key(self._server),
+                    self._cache_key(),
+                    pin,
+                    output_type,
+                )
+            except _operator_cache.Uncacheable:
+                key = None
+            if key is not None:
+                out = _operator_cache.get(key)
+                if out is _operator_cache.MISSING:
+                    out = self._get_output(pin, output_type)
+                    if _operator_cache.put(key, out):
+                        self._cached_keys.add(key)
+                return out
+        return self._get_output(pin, output_type)
+
+    def _invalidate_cached_outputs(self):
+        if self._cached_keys:
+            # the operator may reuse its outputs in its next evaluation
+            _operator_cache.invalidate(self._cached_keys)
+            self._cached_keys.clear()
+
+    def _unrecord_inputs(self):
+        """Stop caching the outputs of the operator, whose inputs can be connected
+        by a workflow without being recorded."""
+        self._inputs_recorded = False
+        self._invalidate_cached_outputs()
+
+    def _cache_key(self):
+        """Key of the operator in the evaluation cache, from its name, configuration
+        and connected inputs.
+
+        Raises
+        ------
+        Uncacheable
+            If an input has no fingerprint, or if the inputs were not all recorded.
+        """
+        if not self._inputs_recorded:
+            raise _operator_cache.Uncacheable(f"{self.name} in a workflow")
+        inputs = tuple(
+            (pin, _operator_cache.fingerprint(*self._connected_inputs[pin]))
+            for pin in sorted(self._connected_inputs)
+        )
+        if self._config_key is None:
+            # the options are only read when the cache is used, each one costs requests
+            options = self._config.options if self._config is not None else {}
+            self._config_key = tuple(sorted(options.items()))
+        return self.name, self._config_key, inputs
+
+    def _get_output(self, pin, output_type):
         if self._server.meet_version("3.0") and self.progress_bar:
             self._server.session.add_operator(self, pin, "operator")
             self._progress_thread = self._server.session.listen_to_progress()
@@ -510,6 +582,9 @@ class Operator:
         value : Config
         """
         self._api.operator_set_config(self, value)
+        self._config = value
+        self._config_key = None
+        self._invalidate_cached_outputs()
 
     @property
     def inputs(self):
@@ -645,6 +720,94 @@ class Operator:
                 if output._pin == pin:
                     return output()
 
+    def eval_async(self, pin=None):
+        """Evaluate this operator without blocking the calling thread.
+
+        The evaluation runs on the executor of the operator's server, see
+        :attr:`BaseServer.executor <ansys.dpf.core.server_types.BaseServer.executor>`.
+        The inputs of the operator must not be modified before the evaluation completes.
+        Cancelling the future only prevents an evaluation which has not started yet.
+
+        Parameters
+        ----------
+        pin : int
+            Number of the output pin. The default is ``None``.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the output returned by :func:`eval`, or raising its exception.
+
+        Examples
+        --------
+        Extract the displacement and the stress at the same time.
+
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> disp_future = model.results.displacement().eval_async()
+        >>> stress_future = model.results.stress().eval_async()
+        >>> disp, stress = disp_future.result(), stress_future.result()
+
+        """
+        return self._server.executor.submit(self.eval, pin)
+
+    def get_output_async(self, pin=0, output_type=None):
+        """Retrieve the output of the operator on the pin number without blocking
+        the calling thread.
+
+        See :func:`eval_async` for the execution of the request.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin. The default is ``0``.
+        output_type : :class:`ansys.dpf.core.common.types`, type,  optional
+            Requested type of the output. The default is ``None``.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the output returned by :func:`get_output`.
+        """
+        return self._server.executor.submit(self.get_output, pin, output_type)
+
+    async def aeval(self, pin=None):
+        """Evaluate this operator, awaitable from asyncio code.
+
+        The evaluation runs as in :func:`eval_async`. Cancelling the awaiting task cancels
+        the evaluation if it has not started yet.
+
+        Parameters
+        ----------
+        pin : int
+            Number of the output pin. The default is ``None``.
+
+        Returns
+        -------
+        output : FieldsContainer, Field, MeshedRegion, Scoping
+        """
+        return await asyncio.wrap_future(self.eval_async(pin))
+
+    async def aget_output(self, pin=0, output_type=None):
+        """Retrieve the output of the operator on the pin number, awaitable from asyncio code.
+
+        See :func:`aeval`.
+
+        Parameters
+        ----------
+        pin : int, optional
+            Number of the output pin. The default is ``0``.
+        output_type : :class:`ansys.dpf.core.common.types`, type,  optional
+            Requested type of the output. The default is ``None``.
+
+        Returns
+        -------
+        type
+            Output of the operator.
+        """
+        return await asyncio.wrap_future(self.get_output_async(pin, output_type))
+
     def _find_outputs_corresponding_pins(self, type_names, inpt, pin, corresponding_pins):
         from ansys.dpf.core.results import Result
 
@@ -743,7 +906,7 @@ class Operator:
     def operator_specification(op_name, server=None):
         """Documents an Operator with its description (what the Operator does),
         its inputs and outputs and some properties"""
-        return Specification(operator_name=op_name, server=server)
+        return _get_specification(op_name, server=server)
 
     @property
     def specification(self):
@@ -756,7 +919,7 @@ class Operator:
         if isinstance(self._spec, Specification):
             return self._spec
         else:
-            return Specification(operator_name=self.name, server=self._server)
+            return _get_specification(self.name, server=self._server)
 
     def __truediv__(self, inpt):
         if isinstance(inpt, Operator):
@@ -11,6 +11,7 @@ from ansys.dpf.core.common import locations, elemental_properties
 from ansys.dpf.core.element_descriptor import ElementDescriptor
 from ansys.dpf.gate import integral_types
 from ansys.dpf.core.check_version import version_requires
+from ansys.dpf.core._id_index import _IdIndex
 
 
 class Element:
@@ -29,8 +30,10 @@ class Element:
         Number (ID) of the element.
     index : int
         Fortran-based (1-based) index of the element in the result.
-    nodes : list
-        List of DPF nodes belonging to the element.
+    nodes : list, optional
+        List of DPF nodes belonging to the element. The default is ``None``,
+        in which case the nodes are built lazily from the mesh's cached
+        connectivity array.
 
     Examples
     --------
@@ -49,12 +52,18 @@ class Element:
 
     """
 
-    def __init__(self, mesh, elementid, index, nodes):
+    def __init__(self, mesh, elementid, index, nodes=None):
         self._id = elementid
         self._index = index
         self._nodes = nodes
         self._mesh = mesh
 
+    def _node_indices(self):
+        """Indices of the nodes of the element, read from the cached connectivity."""
+        if self._nodes is not None:
+            return [node.index for node in self._nodes]
+        return self._mesh.elements._connectivity_by_index(self._index).tolist()
+
     @property
     def node_ids(self):
         """
@@ -76,7 +85,10 @@ class Element:
         [1, 26, 14, 12, 2, 27, 15, 13, 33, 64, 59, 30, 37, 65, 61, 34, 28, 81, 63, 58]
 
         """
-        return [node.id for node in self._nodes]
+        if self._nodes is not None:
+            return [node.id for node in self._nodes]
+        node_ids = self._mesh.nodes._ids_array
+        return node_ids[self._mesh.elements._connectivity_by_index(self._index)].tolist()
 
     @property
     def id(self) -> int:
@@ -123,6 +135,12 @@ class Element:
         >>> first_node = element.nodes[0]
 
         """
+        if self._nodes is None:
+            node_ids = self._mesh.nodes._ids_array
+            self._nodes = [
+                nodes.Node(self._mesh, int(node_ids[node_index]), node_index)
+                for node_index in self._node_indices()
+            ]
         return self._nodes
 
     @property
@@ -136,7 +154,7 @@ class Element:
             Number of nodes.
 
         """
-        return len(self._nodes)
+        return len(self._node_indices())
 
     def __str__(self):
         txt = "DPF Element %d\n" % self.id
@@ -172,9 +190,7 @@ class Element:
 
     def _get_type(self):
         """Retrieve the Ansys element type."""
-        type = integral_types.MutableInt32()
-        self._mesh._api.meshed_region_get_element_type(self._mesh, self.id, type, self.index)
-        return element_types(int(type))
+        return element_types(int(self._mesh.elements._element_types_array[self.index]))
 
     @property
     def shape(self) -> str:
@@ -219,10 +235,7 @@ class Element:
             Ordered list of node indices.
 
         """
-        list = []
-        for node in self._nodes:
-            list.append(node.index)
-        return list
+        return self._node_indices()
 
 
 class Elements:
@@ -248,7 +261,12 @@ class Elements:
     def __init__(self, mesh):
         self._mesh = mesh
         self._server = mesh._server
-        self._mapping_id_to_index = None
+
+    def _clear_cache(self):
+        """Clear the arrays cached from the server when the elements of the mesh change."""
+        self._mesh._elements_arrays.clear()
+        # the mesh no longer matches the result files it was read from
+        self._mesh._origin_data_sources = None
 
     def __str__(self):
         return "DPF Elements object with %d elements" % len(self)
@@ -261,8 +279,8 @@ class Elements:
         return self.n_elements
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for index, element_id in enumerate(self._ids_array.tolist()):
+            yield Element(self._mesh, element_id, index)
 
     def element_by_id(self, id) -> Element:
         """
@@ -344,6 +362,7 @@ class Elements:
             self._mesh._api.meshed_region_add_element_by_shape(
                 self._mesh, add.id, len(add.connectivity), add.connectivity, shape_id
             )
+            self._clear_cache()
 
     def add_solid_element(self, id, connectivity):
         """
@@ -420,6 +439,7 @@ class Elements:
         self._mesh._api.meshed_region_add_element_by_shape(
             self._mesh, id, len(connectivity), connectivity, shape_id
         )
+        self._clear_cache()
 
     def __get_element(self, elementindex=None, elementid=None):
         """
@@ -439,30 +459,92 @@ class Elements:
         if elementindex is None:
             elementindex = self._mesh._api.meshed_region_get_element_index(self._mesh, elementid)
         elif elementid is None:
-            elementid = self._mesh._api.meshed_region_get_element_id(self._mesh, elementindex)
-        nodesOut = []
-        num_nodes = self._mesh._api.meshed_region_get_num_nodes_of_element(
-            self._mesh, index=elementindex
-        )
-        for i_node in range(num_nodes):
-            node_id = self._mesh._api.meshed_region_get_node_id_of_element(
-                self._mesh, elementindex, i_node
-            )
-            if node_id >= 0:
-                node_index = self._mesh._api.meshed_region_get_node_index(self._mesh, node_id)
-                node_coordinates = [
-                    self._mesh._api.meshed_region_get_node_coord(
-                        self._mesh, index=node_index, coordinate=0
-                    ),
-                    self._mesh._api.meshed_region_get_node_coord(
-                        self._mesh, index=node_index, coordinate=1
-                    ),
-                    self._mesh._api.meshed_region_get_node_coord(
-                        self._mesh, index=node_index, coordinate=2
-                    ),
-                ]
-                nodesOut.append(nodes.Node(self._mesh, node_id, node_index, node_coordinates))
-        return Element(self._mesh, elementid, elementindex, nodesOut)
+            elementid = int(self._ids_array[elementindex])
+        return Element(self._mesh, elementid, elementindex)
+
+    @property
+    def _ids_array(self):
+        """Array of the element IDs, retrieved once from the server and cached on the mesh."""
+        arrays = self._mesh._elements_arrays
+        if "ids" not in arrays:
+            element_scoping = self.scoping
+            if element_scoping is None:
+                arrays["ids"] = np.empty(0, dtype=np.int32)
+            else:
+                arrays["ids"] = element_scoping._get_ids(np_array=True)
+        return arrays["ids"]
+
+    @property
+    def _element_types_array(self):
+        """Array of the element types, retrieved once from the server and cached on the mesh."""
+        arrays = self._mesh._elements_arrays
+        if "types" not in arrays:
+            # keep the field alive as long as its data is used
+            arrays["types_field"] = self.element_types_field
+            arrays["types"] = arrays["types_field"].data
+        return arrays["types"]
+
+    def _connectivity_by_index(self, index):
+        """Indices of the nodes of an element, sliced from the cached connectivity."""
+        arrays = self._mesh._elements_arrays
+        if "connectivity" not in arrays:
+            # keep the field alive as long as its data is used
+            arrays["connectivities_field"] = self._get_connectivities_field()
+            arrays["connectivity"] = arrays["connectivities_field"].data
+            arrays["connectivity_pointer"] = arrays["connectivities_field"]._data_pointer
+        connectivity = arrays["connectivity"]
+        pointer = arrays["connectivity_pointer"]
+        first = pointer[index]
+        last = pointer[index + 1] if index + 1 < len(pointer) else len(connectivity)
+        node_indices = np.asarray(connectivity[first:last])
+        return node_indices[node_indices >= 0]
+
+    @property
+    def _id_index(self):
+        """Vectorized ID to index map, built once and cached on the mesh."""
+        arrays = self._mesh._elements_arrays
+        if "id_index" not in arrays:
+            arrays["id_index"] = _IdIndex(self._ids_array)
+        return arrays["id_index"]
+
+    def _indices_by_ids(self, ids):
+        """Retrieve the indices of the given element IDs."""
+        ids = np.asarray(ids)
+        indices = self._id_index.indices(ids)
+        missing = indices < 0
+        if missing.any():
+            raise ValueError(f"Element ID {ids.reshape(-1)[missing][0]} is not in the mesh.")
+        return indices
+
+    def connectivity_by_ids(self, ids):
+        """
+        Connectivities of several elements retrieved in bulk.
+
+        The connectivities of all the elements are transferred once from the server and
+        cached, so that this method does not make a server call per element.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the elements.
+
+        Returns
+        -------
+        connectivities : list[numpy.ndarray]
+            For each element, array of the indices of its nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> elements = model.metadata.meshed_region.elements
+        >>> connectivities = elements.connectivity_by_ids([5, 6])
+        >>> len(connectivities[0])
+        20
+
+        """
+        return [self._connectivity_by_index(index) for index in self._indices_by_ids(ids)]
 
     @property
     def scoping(self) -> scoping.Scoping:
@@ -605,7 +687,7 @@ class Elements:
 
     def _build_mapping_id_to_index(self):
         """Retrieve the mapping between the IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return dict(zip(self._ids_array.tolist(), range(len(self._ids_array))))
 
     @property
     def mapping_id_to_index(self) -> dict:
@@ -623,9 +705,10 @@ class Elements:
         >>> map = meshed_region.nodes.mapping_id_to_index
 
         """
-        if self._mapping_id_to_index is None:
-            self._mapping_id_to_index = self._build_mapping_id_to_index()
-        return self._mapping_id_to_index
+        arrays = self._mesh._elements_arrays
+        if "mapping_id_to_index" not in arrays:
+            arrays["mapping_id_to_index"] = self._build_mapping_id_to_index()
+        return arrays["mapping_id_to_index"]
 
     def map_scoping(self, external_scope):
         """
@@ -660,10 +743,9 @@ class Elements:
         """
         if external_scope.location in ["Nodal", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        indices = self._id_index.indices(external_scope.ids)
+        mask = indices >= 0
+        return indices[mask], mask
 
     @property
     def has_shell_elements(self) -> bool:
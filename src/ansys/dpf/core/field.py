@@ -403,10 +403,9 @@ class Field(_FieldBase):
         return data
 
     def _set_data(self, data):
-        if isinstance(data, list):
-            if all(isinstance(d, list) for d in data):
-                # Transform list of list to numpy_array
-                data = np.array(data)
+        if isinstance(data, (list, tuple)):
+            # one conversion instead of building a C array element by element
+            data = np.asarray(data, dtype=np.float64)
         if isinstance(data, (np.ndarray, np.generic)):
             if (
                 0 != self.size
@@ -417,10 +416,14 @@ class Field(_FieldBase):
                     f"An array of shape {self.shape} is expected and "
                     f"shape {data.shape} was input"
                 )
-            if data.dtype != np.float64:
-                copy = np.empty_like(data, shape=data.shape, dtype=np.float64)
-                copy[:] = data
-                data = copy
+            # the buffer is passed as is when it is already C-contiguous float64,
+            # otherwise it is converted once
+            data = np.ascontiguousarray(data, dtype=np.float64)
+            if hasattr(self._api, "csfield_raw_set_data"):
+                # stream the buffer by chunks to the gRPC server, without the flattened
+                # copy made by csfield_set_data
+                metadata = [("float_or_double", "double"), ("size_double", f"{data.size}")]
+                return self._api.csfield_raw_set_data(self, data.reshape(-1), metadata)
         size = _get_size_of_list(data)
         return self._api.csfield_set_data(self, size, data)
 
@@ -5,6 +5,7 @@ from abc import abstractmethod
 from ansys.dpf.gate.generated import field_abstract_api
 
 from ansys.dpf.core import scoping
+from ansys.dpf.core._growable_array import _GrowableArray
 from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core import errors
 from ansys.dpf.core import server as server_module
@@ -499,6 +500,8 @@ class _LocalFieldBase(_FieldBase):
     """Caches the internal data of the field so that it can be modified locally.
 
     A single update request is sent to the server when the local field is deleted.
+    The data, data pointer and entity data returned are views of the local copy,
+    which can be modified in place: the field is then sent back to the server.
 
     Parameters
     ----------
@@ -512,12 +515,20 @@ class _LocalFieldBase(_FieldBase):
 
     def __cache_data__(self, field):
         self._ncomp = super().component_count
-        self._data_copy = super().data_as_list
+        self._data_copy = _GrowableArray(super()._get_data(), dtype=self._local_dtype)
         self._num_entities_reserved = len(self._data_copy)
-        self._data_pointer_copy = super()._get_data_pointer().tolist()
+        self._data_pointer_copy = _GrowableArray(super()._get_data_pointer(), dtype=np.int32)
         self._scoping_copy = super().scoping.as_local_scoping()
         self._has_data_pointer = len(self._data_pointer_copy) > 0
 
+    @property
+    def _local_dtype(self):
+        return np.int32 if self._is_property_field else np.float64
+
+    def _check_data_type(self, data):
+        if self._is_property_field and data.size > 0 and not np.issubdtype(data.dtype, np.integer):
+            raise errors.InvalidTypeError("data", "list of int")
+
     @property
     def _num_entities(self):
         return len(self._scoping_copy)
@@ -578,18 +589,18 @@ class _LocalFieldBase(_FieldBase):
                 f"available indices {len(self._scoping_copy)}"
             )
         if self._has_data_pointer:
-            first_index = self._data_pointer_copy[index]
-            if index < len(self._data_pointer_copy) - 1:
-                last_index = self._data_pointer_copy[index + 1] - 1
+            data_pointer = self._data_pointer_copy.view
+            first_index = data_pointer[index]
+            if index < len(data_pointer) - 1:
+                last_index = data_pointer[index + 1]
             else:
-                last_index = len(self._data_copy) - 1
+                last_index = len(self._data_copy)
         else:
             first_index = self._ncomp * index
-            last_index = self._ncomp * (index + 1) - 1
-        if self._is_property_field:
-            array = np.array(self._data_copy[first_index : last_index + 1], dtype=np.int32)
-        else:
-            array = np.array(self._data_copy[first_index : last_index + 1])
+            last_index = self._ncomp * (index + 1)
+        array = self._data_copy.view[first_index:last_index]
+        # the view can be modified in place
+        self._is_set = True
 
         if self._ncomp > 1:
             return array.reshape((array.size // self._ncomp, self._ncomp))
@@ -661,28 +672,20 @@ class _LocalFieldBase(_FieldBase):
         ...         f.append([[0.1*i,0.2*i, 0.3*i],[0.1*i,0.2*i, 0.3*i]],i)
 
         """
-        if self._is_property_field:
-            if isinstance(data[0], np.int64):
-                data = np.array(data, dtype=np.int32)
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        if (len(data) > 0 and isinstance(data, list)) or isinstance(data, (np.ndarray, np.generic)):
-            data = np.array(data).flatten().tolist()
+        data = np.asarray(data)
+        self._check_data_type(data)
 
         data_size = len(self._data_copy)
         self._scoping_copy.append(scopingid)
-        if len(self._data_pointer_copy) > 0:
+        if self._has_data_pointer:
             self._data_pointer_copy.append(data_size)
 
         self._data_copy.extend(data)
-        if self._has_data_pointer == False:
-            if isinstance(data, (np.ndarray, np.generic)):
-                data_size = data.size
-            else:
-                data_size = len(data)
-            if data_size > self._ncomp:
-                self._data_pointer_copy = [i * self._ncomp for i in range(0, self._num_entities)]
-                self._has_data_pointer = True
+        if not self._has_data_pointer and data.size > self._ncomp:
+            self._data_pointer_copy.assign(
+                np.arange(self._num_entities, dtype=np.int32) * self._ncomp
+            )
+            self._has_data_pointer = True
 
     def data_as_list(self):
         """Retrieve the data in the field as a Python list.
@@ -705,7 +708,7 @@ class _LocalFieldBase(_FieldBase):
         ...     my_data_list = f.data_as_list
 
         """
-        return self._data_copy
+        return self._data_copy.tolist()
 
     @property
     def data(self):
@@ -736,32 +739,26 @@ class _LocalFieldBase(_FieldBase):
 
         """
 
+        data = self._data_copy.view
+        # the view can be modified in place
+        self._is_set = True
         if self._ncomp > 1:
-            return np.array(self._data_copy).reshape(
-                len(self._data_copy) // self._ncomp, self._ncomp
-            )
+            return data.reshape(len(data) // self._ncomp, self._ncomp)
         else:
-            return np.array(self._data_copy)
+            return data
 
     @data.setter
     @_setter
     def data(self, data):
         if self._is_property_field:
-            if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
-                raise errors.InvalidTypeError("data", "list of int")
-        else:
-            if isinstance(data, (np.ndarray, np.generic)):
-                if data.shape != self.shape and 0 != self.size:
-                    raise ValueError(
-                        f"An array of shape {self.shape} is expected and "
-                        f"shape {data.shape} was input"
-                    )
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_copy = data.flatten().tolist()
-        elif len(data) > 0 and isinstance(data, list):
-            self._data_copy = np.array(data).flatten().tolist()
-        else:
-            self._data_copy = data
+            self._check_data_type(np.asarray(data))
+        elif isinstance(data, (np.ndarray, np.generic)):
+            if data.shape != self.shape and 0 != self.size:
+                raise ValueError(
+                    f"An array of shape {self.shape} is expected and "
+                    f"shape {data.shape} was input"
+                )
+        self._data_copy.assign(data)
 
     @property
     def elementary_data_count(self):
@@ -774,7 +771,7 @@ class _LocalFieldBase(_FieldBase):
 
         """
         if hasattr(self, "_data_copy"):
-            return len(self._data_copy) / self._ncomp
+            return len(self._data_copy) // self._ncomp
         else:
             return super().elementary_data_count
 
@@ -799,7 +796,9 @@ class _LocalFieldBase(_FieldBase):
         numpy.ndarray
             Array of first indexes of each entity data.
         """
-        return np.array(self._data_pointer_copy)
+        # the view can be modified in place
+        self._is_set = True
+        return self._data_pointer_copy.view
 
     @property
     def _data_pointer_as_list(self):
@@ -810,16 +809,13 @@ class _LocalFieldBase(_FieldBase):
         List
             List of first indexes of each entity data.
         """
-        return self._data_pointer_copy
+        return self._data_pointer_copy.tolist()
 
     @_data_pointer.setter
     @_setter
     def _data_pointer(self, data):
-        if isinstance(data, (np.ndarray, np.generic)):
-            self._data_pointer_copy = data.tolist()
-        else:
-            self._data_pointer_copy = data
-        if self._has_data_pointer == False and len(data) > 0:
+        self._data_pointer_copy.assign(data)
+        if not self._has_data_pointer and len(self._data_pointer_copy) > 0:
             self._has_data_pointer = True
 
     @property
@@ -860,8 +856,8 @@ class _LocalFieldBase(_FieldBase):
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_data(self._data_copy)
-            super()._set_data_pointer(self._data_pointer_copy)
+            super()._set_data(self._data_copy.view)
+            super()._set_data_pointer(self._data_pointer_copy.view)
             super()._set_scoping(self._scoping_copy)
             self._scoping_copy = None
 
@@ -201,6 +201,38 @@ class FieldsContainer(Collection):
 
         return super()._get_entries(label_space)
 
+    def get_fields_bulk(self, label_space_or_indices):
+        """Retrieve several fields at once, by label space or by indices.
+
+        With a gRPC server, the fields are requested concurrently instead of
+        one after the other.
+
+        Parameters
+        ----------
+        label_space_or_indices : dict[str,int], list[int], range
+            Scoping of the requested fields, for example ``{"time": 1}``,
+            or indices of the requested fields.
+
+        Returns
+        -------
+        fields : list[Field]
+            Fields corresponding to the request, in the order of the indices.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> fc = dpf.fields_container_factory.over_time_freq_fields_container(
+        ...     [dpf.Field(nentities=10) for i in range(5)]
+        ... )
+        >>> fields = fc.get_fields_bulk(range(1, 4))
+        >>> len(fields)
+        3
+        >>> fc.get_label_spaces(range(1, 4))
+        [{'time': 2}, {'time': 3}, {'time': 4}]
+
+        """
+        return super()._get_entries_bulk(label_space_or_indices)
+
     def get_field(self, label_space_or_index):
         """Retrieves the field at a requested index or label space.
 
@@ -461,8 +493,8 @@ class FieldsContainer(Collection):
         """
         fc = FieldsContainer(server=server)
         fc.labels = self.labels
-        for i, f in enumerate(self):
-            fc.add_field(self.get_label_space(i), f.deep_copy(server))
+        for label_space, f in zip(self.get_label_spaces(), self):
+            fc.add_field(label_space, f.deep_copy(server))
         try:
             fc.time_freq_support = self.time_freq_support.deep_copy(server)
         except:
@@ -4,13 +4,183 @@ fields_container_factory
 
 Contains functions to simplify creating a fields container.
 """
+import numpy as np
 
 from ansys.dpf.core import FieldsContainer, TimeFreqSupport
 from ansys.dpf.core import errors as dpf_errors
 from ansys.dpf.core import fields_factory
+from ansys.dpf.core import server as server_module
 from ansys.dpf.core.common import locations
 
 
+class FieldsContainerBuilder:
+    """Build a fields container from arrays holding the data of all its fields.
+
+    The fields are described by a 2D data array, with one row per entity,
+    the offsets of the first row of each field and a table of label values with one
+    row per field. The client keeps views of the arrays until :func:`build`, which
+    creates, fills and adds all the fields. Each field costs a fixed number of
+    requests, the fields are created concurrently on a ``LegacyGrpcServer``,
+    the only thread-safe server type, and no intermediate Python object is
+    created per entity.
+
+    Parameters
+    ----------
+    labels : list[str]
+        Labels of the fields container. For example, ``["time", "body"]``.
+    server : ansys.dpf.core.server, optional
+        Server with the channel connected to the remote or local instance.
+        The default is ``None``, in which case an attempt is made to use the
+        global server.
+
+    Examples
+    --------
+    Create a fields container of one scalar field per time set and body.
+
+    >>> import numpy as np
+    >>> from ansys.dpf.core import fields_container_factory
+    >>> data = np.arange(10.0)
+    >>> offsets = [0, 3, 5, 10]
+    >>> label_values = [[1, 1], [1, 2], [2, 1]]
+    >>> builder = fields_container_factory.FieldsContainerBuilder(["time", "body"])
+    >>> builder.add_fields(data, offsets, label_values)
+    >>> fc = builder.build()
+    >>> len(fc)
+    3
+
+    """
+
+    def __init__(self, labels, server=None):
+        self._server = server_module.get_or_create_server(server)
+        self._labels = list(labels)
+        # (label space, Field or arguments of _create_field) in the order of the entries
+        self._entries = []
+
+    @property
+    def labels(self):
+        """Labels of the fields container.
+
+        Returns
+        -------
+        labels : list[str]
+        """
+        return list(self._labels)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add_field(self, label_space, field):
+        """Add an existing field.
+
+        Parameters
+        ----------
+        label_space : dict[str,int]
+            Label space of the field. For example, ``{"time": 1, "body": 2}``.
+        field : Field
+            DPF field to add.
+        """
+        self._entries.append((dict(label_space), field))
+
+    def add_fields(
+        self, data, offsets, label_spaces, ids=None, location=locations.nodal, unit=None
+    ):
+        """Add fields whose data are consecutive rows of an array.
+
+        Parameters
+        ----------
+        data : numpy.ndarray
+            Data of all the fields, with one row per entity and one column per
+            component, or 1D for scalar fields. Rows with 1, 3 and 6 components are
+            scalar, 3D vector and symmetrical matrix data, the others are vectors.
+        offsets : numpy.ndarray, list[int]
+            Index of the first row of each field, followed by the number of rows.
+            Field ``i`` holds the rows ``offsets[i]`` to ``offsets[i + 1]``.
+        label_spaces : numpy.ndarray, list[list[int]], list[dict[str,int]]
+            Label space of each field, either as a table with one row per field and
+            one column per label, in the order of :attr:`labels`, or as dictionaries.
+        ids : numpy.ndarray, list[int], optional
+            Scoping IDs of each row. The default is ``1`` to the number of entities
+            of each field.
+        location : str, optional
+            Location of the fields. The default is ``dpf.locations.nodal``.
+        unit : str, optional
+            Unit of the fields.
+        """
+        data = np.asarray(data)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        elif data.ndim != 2:
+            raise ValueError(f"data must have 1 or 2 dimensions, not {data.ndim}.")
+        # one conversion for all the fields, each field sends a view on it
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        n_fields = offsets.size - 1
+        if n_fields < 0 or offsets[-1] != data.shape[0] or np.any(np.diff(offsets) < 0):
+            raise ValueError(
+                "offsets must be increasing and end with the number of rows of data "
+                f"({data.shape[0]})."
+            )
+        if len(label_spaces) != n_fields:
+            raise ValueError(f"{len(label_spaces)} label spaces were given for {n_fields} fields.")
+        if ids is not None:
+            ids = np.ascontiguousarray(ids, dtype=np.int32)
+            if ids.shape != (data.shape[0],):
+                raise ValueError(f"ids must have one value per row of data ({data.shape[0]}).")
+        if not isinstance(label_spaces, np.ndarray) and all(
+            isinstance(label_space, dict) for label_space in label_spaces
+        ):
+            label_spaces = [dict(label_space) for label_space in label_spaces]
+        else:
+            label_spaces = np.asarray(label_spaces, dtype=np.int64).reshape(n_fields, -1)
+            if label_spaces.shape[1] != len(self._labels):
+                raise ValueError(
+                    f"The label table has {label_spaces.shape[1]} columns for the labels "
+                    f"{self._labels}."
+                )
+            label_spaces = [dict(zip(self._labels, row)) for row in label_spaces.tolist()]
+
+        n_components = data.shape[1]
+        for label_space, start, stop in zip(label_spaces, offsets[:-1], offsets[1:]):
+            field_ids = ids[start:stop] if ids is not None else None
+            self._entries.append(
+                (label_space, (data[start:stop], field_ids, n_components, location, unit))
+            )
+
+    def _create_field(self, entry):
+        data, ids, n_components, location, unit = entry
+        nature, ncomp_n = fields_factory._nature_of_components(n_components)
+        field = fields_factory._create_field(
+            self._server, nature, data.shape[0], location, ncomp_n=ncomp_n
+        )
+        field.data = data
+        if ids is None:
+            ids = np.arange(1, data.shape[0] + 1, dtype=np.int32)
+        field.scoping.ids = ids
+        if unit is not None:
+            field.unit = unit
+        return field
+
+    def build(self):
+        """Create the fields container with all the fields added.
+
+        Returns
+        -------
+        fields_container : FieldsContainer
+        """
+        fc = FieldsContainer(server=self._server)
+        fc.labels = self._labels
+        fields = [entry for _, entry in self._entries]
+        to_create = [index for index, entry in enumerate(fields) if isinstance(entry, tuple)]
+        # the fields are independent and can be created concurrently, but the entries
+        # are added in order
+        created = fc._map_requests(self._create_field, [fields[index] for index in to_create])
+        for index, field in zip(to_create, created):
+            fields[index] = field
+        for (label_space, _), field in zip(self._entries, fields):
+            fc.add_field(label_space, field)
+        return fc
+
+
 def over_time_freq_fields_container(fields, time_freq_unit=None, server=None):
     """Create a fields container with one field by time set.
 
@@ -48,16 +218,13 @@ def over_time_freq_fields_container(fields, time_freq_unit=None, server=None):
     """
     if not isinstance(fields, dict) and not isinstance(fields, list):
         raise dpf_errors.InvalidTypeError("dictionary/list", "fields")
-    fc = FieldsContainer(server=server)
-    fc.labels = {"time"}
-    i = 0
+    builder = FieldsContainerBuilder(["time"], server=server)
+    for i, field in enumerate(fields.values() if isinstance(fields, dict) else fields):
+        builder.add_field({"time": i + 1}, field)
+    fc = builder.build()
     # dict case
     if isinstance(fields, dict):
-        time_freq = []
-        for field_key in fields:
-            fc.add_field({"time": i + 1}, fields[field_key])
-            time_freq.append(field_key)
-            i += 1
+        time_freq = list(fields)
         time_freq_field = fields_factory.create_scalar_field(
             len(fields), location=locations.time_freq, server=server
         )
@@ -66,11 +233,6 @@ def over_time_freq_fields_container(fields, time_freq_unit=None, server=None):
         time_freq_support = TimeFreqSupport(server=server)
         time_freq_support.time_frequencies = time_freq_field
         fc.time_freq_support = time_freq_support
-    # list case
-    elif isinstance(fields, list):
-        for field in fields:
-            fc.add_field({"time": i + 1}, field)
-            i += 1
     return fc
 
 
@@ -114,22 +276,15 @@ def over_time_freq_complex_fields_container(
         if not isinstance(imaginary_fields, list):
             raise dpf_errors.DpfValueError(errorString)
 
-    fc = FieldsContainer(server=server)
-    fc.labels = ["time", "complex"]
-    i = 0
+    builder = FieldsContainerBuilder(["time", "complex"], server=server)
+    for complex_id, fields in enumerate((real_fields, imaginary_fields)):
+        for i, field in enumerate(fields.values() if isinstance(fields, dict) else fields):
+            builder.add_field({"time": i + 1, "complex": complex_id}, field)
+    fc = builder.build()
     # dict case
     if isinstance(real_fields, dict):
-        time_freq = []
-        for field_key in real_fields:
-            fc.add_field({"time": i + 1, "complex": 0}, real_fields[field_key])
-            time_freq.append(field_key)
-            i += 1
-        i = 0
-        im_time_freq = []
-        for field_key in imaginary_fields:
-            fc.add_field({"time": i + 1, "complex": 1}, imaginary_fields[field_key])
-            im_time_freq.append(field_key)
-            i += 1
+        time_freq = list(real_fields)
+        im_time_freq = list(imaginary_fields)
         time_freq_field = fields_factory.create_scalar_field(
             len(real_fields), locations.time_freq, server=server
         )
@@ -144,15 +299,6 @@ def over_time_freq_complex_fields_container(
         time_freq_support.time_frequencies = time_freq_field
         time_freq_support.complex_frequencies = im_time_freq_field
         fc.time_freq_support = time_freq_support
-    # list case
-    if isinstance(real_fields, list):
-        for field in real_fields:
-            fc.add_field({"time": i + 1, "complex": 0}, field)
-            i += 1
-        i = 0
-        for field in imaginary_fields:
-            fc.add_field({"time": i + 1, "complex": 1}, field)
-            i += 1
     return fc
 
 
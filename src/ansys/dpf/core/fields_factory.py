@@ -33,6 +33,7 @@ def field_from_array(arr, server=None):
     """
     from ansys.dpf.core import Field, natures
 
+    # no copy of float64 arrays, the field data setter converts the other types once
     arr = np.asarray(arr)
 
     if not np.issubdtype(arr.dtype, np.number):
@@ -59,7 +60,7 @@ def field_from_array(arr, server=None):
     n_entities = arr.shape[0]
     field = Field(nentities=n_entities, nature=nature, server=server)
     field.data = arr
-    field.scoping.ids = np.arange(1, n_entities + 1)
+    field.scoping.ids = np.arange(1, n_entities + 1, dtype=np.int32)
     return field
 
 
@@ -254,6 +255,15 @@ def create_vector_field(num_entities, num_comp, location=locations.nodal, server
     return _create_field(server, natures.vector, num_entities, location, ncomp_n=num_comp)
 
 
+def _nature_of_components(n_components):
+    """Nature and number of lines of a field with ``n_components`` components per entity."""
+    if n_components == 1:
+        return natures.scalar, 0
+    elif n_components == 6:
+        return natures.symmatrix, 0
+    return natures.vector, 0 if n_components == 3 else n_components
+
+
 def _create_field(server, nature, nentities, location=locations.nodal, ncomp_n=0, ncomp_m=0):
     """Create a specific :class:`ansys.dpf.core.Field`.
 
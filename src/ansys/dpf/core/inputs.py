@@ -5,6 +5,7 @@ Inputs
 ======
 """
 
+import functools
 import weakref
 from textwrap import wrap
 from ansys.dpf.core.mapping_types import map_types_to_python
@@ -139,7 +140,7 @@ class Input:
         self.connect(inpt)
 
     def _update_doc_str(self, docstr, class_name):
-        """Dynamically update the docstring of this instance by creating a class on the fly.
+        """Dynamically update the docstring of this instance by switching it to a documented class.
 
         Parameters
         ----------
@@ -147,8 +148,7 @@ class Input:
 
         class_name :
         """
-        child_class = type(class_name, (self.__class__,), {"__doc__": docstr})
-        self.__class__ = child_class
+        self.__class__ = _documented_class(self.__class__, class_name, docstr)
 
     def __str__(self):
         docstr = self._spec.name + " : "
@@ -171,6 +171,12 @@ class Input:
                 )
 
 
+@functools.lru_cache(maxsize=None)
+def _documented_class(base, class_name, docstr):
+    """Create, once per pin documentation, a subclass of ``base`` holding this documentation."""
+    return type(class_name, (base,), {"__doc__": docstr})
+
+
 class _Inputs:
     def __init__(self, dict_inputs, operator):
         self._dict_inputs = dict_inputs
@@ -5,11 +5,13 @@ MeshedRegion
 import traceback
 import warnings
 
+import numpy as np
+
 import ansys.dpf.core.errors
 
 from ansys.dpf.core import scoping, field, property_field
 from ansys.dpf.core.check_version import server_meet_version, version_requires
-from ansys.dpf.core.common import locations, types, nodal_properties
+from ansys.dpf.core.common import locations, types, nodal_properties, elemental_properties
 from ansys.dpf.core.elements import Elements, element_types
 from ansys.dpf.core.nodes import Nodes
 from ansys.dpf.core.plotter import DpfPlotter, Plotter
@@ -35,6 +37,29 @@ def update_grid(func):
     return wrapper
 
 
+def _copy_field(source, server):
+    """Copy a Field or PropertyField of a mesh on a server with whole-array transfers."""
+    source_scoping = source.scoping
+    if isinstance(source, property_field.PropertyField):
+        copy = property_field.PropertyField(
+            nentities=len(source_scoping), location=source.location, server=server
+        )
+    else:
+        copy = field.Field(
+            nentities=len(source_scoping),
+            location=source.location,
+            nature=source.field_definition.dimensionality.nature,
+            server=server,
+        )
+        copy.field_definition = source.field_definition.deep_copy(server)
+    copy.scoping = source_scoping.deep_copy(server)
+    copy.data = source.data
+    data_pointer = source._data_pointer
+    if data_pointer is not None and len(data_pointer):
+        copy._data_pointer = data_pointer
+    return copy
+
+
 @class_handling_cache
 class MeshedRegion:
     """
@@ -108,6 +133,10 @@ class MeshedRegion:
         self._full_grid = None
         self._elements = None
         self._nodes = None
+        self._nodes_arrays = {}
+        self._elements_arrays = {}
+        # data sources the mesh was read from, used to key the persistent grid cache
+        self._origin_data_sources = None
         self.as_linear = None
 
     def _get_scoping(self, loc=locations.nodal):
@@ -288,6 +317,7 @@ class MeshedRegion:
             self.set_coordinates_field(value)
         else:
             self._api.meshed_region_set_property_field(self, property_name, value)
+            self.elements._clear_cache()
 
     @update_grid
     @version_requires("3.0")
@@ -300,6 +330,7 @@ class MeshedRegion:
         coordinates_field : PropertyField or Field
         """
         self._api.meshed_region_set_coordinates_field(self, coordinates_field)
+        self.nodes._clear_cache()
 
     @property
     def available_named_selections(self):
@@ -375,6 +406,9 @@ class MeshedRegion:
     def _set_stream_provider(self, stream_provider):
         self._stream_provider = stream_provider
 
+    def _set_origin_data_sources(self, data_sources):
+        self._origin_data_sources = data_sources
+
     # NOTE: kept only for reference as the mesh operator is being moved out of dpf
     # def write_vtk(self, filename, skin_only=True):
     #     """Return a vtk mesh"""
@@ -432,7 +466,14 @@ class MeshedRegion:
         -------
 
         """
-        from ansys.dpf.core.operators.math import add, scale, unit_convert
+        from ansys.dpf.core.operators.math import add, scale
+
+        deform_by = self._deformation_field(deform_by)
+        scale_op = scale(field=deform_by, ponderation=scale_factor)
+        return add(fieldA=self.nodes.coordinates_field, fieldB=scale_op.outputs.field).eval()
+
+    def _deformation_field(self, deform_by):
+        from ansys.dpf.core.operators.math import unit_convert
 
         if hasattr(deform_by, "eval"):
             # If a Result or an Operator, eval and get the field.
@@ -442,19 +483,70 @@ class MeshedRegion:
             deform_by = deform_by[0]
         if deform_by.unit != self.unit:
             unit_convert(deform_by, self.unit)
-        scale_op = scale(field=deform_by, ponderation=scale_factor)
-        return add(fieldA=self.nodes.coordinates_field, fieldB=scale_op.outputs.field).eval()
+        return deform_by
+
+    def _deformed_points(self, deform_by, scale_factor=1.0):
+        """Same as ``deform_by``, computed with NumPy from the cached node coordinates.
 
-    def _as_vtk(self, coordinates=None, as_linear=True, include_ids=False):
+        Returns
+        -------
+        points : numpy.ndarray
+            Deformed coordinates, in the order of the nodes of the mesh.
+        """
+        deform_by = self._deformation_field(deform_by)
+        nodes = self.nodes
+        coordinates = nodes._coordinates_array
+        displacement = np.zeros(np.shape(coordinates))
+        ind, mask = nodes.map_scoping(deform_by.scoping)
+        displacement[ind] = np.asarray(deform_by.data).reshape(-1, 3)[mask]
+        if hasattr(scale_factor, "eval"):
+            scale_factor = scale_factor.eval()
+        if isinstance(scale_factor, ansys.dpf.core.fields_container.FieldsContainer):
+            scale_factor = scale_factor[0]
+        if isinstance(scale_factor, field.Field):
+            # nodes without a scale factor are not scaled
+            factors = np.ones(len(displacement))
+            ind, mask = nodes.map_scoping(scale_factor.scoping)
+            factors[ind] = np.asarray(scale_factor.data).reshape(-1)[mask]
+            displacement *= factors[:, np.newaxis]
+        else:
+            displacement *= scale_factor
+        return coordinates + displacement
+
+    def _deformed_grid(self, deform_by, scale_factor=1.0, as_linear=True):
+        """Grid deformed by a 3D vector field, sharing the cells of the cached grid."""
+        from ansys.dpf.core import vtk_helper
+
+        points = self._deformed_points(deform_by, scale_factor)
+        if as_linear != self.as_linear:
+            grid = self._as_vtk(self.nodes.coordinates_field, as_linear=as_linear)
+        else:
+            grid = self.grid
+        if grid.n_points != len(points):
+            return self._as_vtk(self.deform_by(deform_by, scale_factor), as_linear=as_linear)
+        return vtk_helper.vtk_deformed_copy(grid, points)
+
+    def _as_vtk(self, coordinates=None, as_linear=True, include_ids=False, use_cache=False):
         """Convert DPF mesh to a PyVista unstructured grid."""
         try:
-            from ansys.dpf.core.vtk_helper import dpf_mesh_to_vtk
+            from ansys.dpf.core import vtk_helper
         except ModuleNotFoundError:
             raise ModuleNotFoundError(
                 "To use plotting capabilities, please install pyvista "
                 "with :\n pip install pyvista>=0.24.0"
             )
-        grid = dpf_mesh_to_vtk(self, coordinates, as_linear)
+        from ansys.dpf.core import _grid_cache
+
+        cache_key = None
+        if use_cache and _grid_cache.is_enabled():
+            cache_key = _grid_cache.key(self, bool(as_linear), vtk_helper.VTK9)
+        arrays = _grid_cache.load(cache_key) if cache_key else None
+        if arrays is not None:
+            grid = vtk_helper._grid_from_arrays(arrays)
+        else:
+            grid = vtk_helper.dpf_mesh_to_vtk(self, coordinates, as_linear)
+            if cache_key:
+                _grid_cache.store(cache_key, vtk_helper._grid_to_arrays(grid))
 
         # consider adding this when scoping request is faster
         if include_ids:
@@ -493,7 +585,7 @@ class MeshedRegion:
 
         """
         if self._full_grid is None:
-            self._full_grid = self._as_vtk(self.nodes.coordinates_field)
+            self._full_grid = self._as_vtk(self.nodes.coordinates_field, use_cache=True)
         return self._full_grid
 
     def plot(
@@ -562,10 +654,14 @@ class MeshedRegion:
 
         This method is useful for passing data from one server instance to another.
 
+        The coordinates, the property fields (connectivity, element types,
+        materials...) and the named selections are transferred as whole arrays.
+
         .. warning::
-           Only nodes scoping and coordinates and elements scoping, connectivity,
-           and types are copied. The eventual property field for elemental properties
-           and named selection will not be copied.
+           With servers older than 3.0, only nodes scoping and coordinates and
+           elements scoping, connectivity, and types are copied, one entity at a time.
+           The eventual property field for elemental properties and named selection
+           will not be copied.
 
         Parameters
         ----------
@@ -590,6 +686,26 @@ class MeshedRegion:
         """
         if self.nodes.scoping is None:  # empty Mesh
             return MeshedRegion()
+        target_server = server_module.get_or_create_server(server)
+        if not server_meet_version("3.0", target_server):
+            return self._deep_copy_by_entity(server)
+        mesh = MeshedRegion(
+            num_nodes=self.nodes.n_nodes, num_elements=self.elements.n_elements, server=server
+        )
+        # the coordinates define the nodes, and the connectivity the elements
+        property_names = [nodal_properties.coordinates, elemental_properties.connectivity]
+        property_names += [
+            name for name in self.available_property_fields if name not in property_names
+        ]
+        for name in property_names:
+            mesh.set_property_field(name, _copy_field(self.property_field(name), server))
+        for name in self.available_named_selections:
+            mesh.set_named_selection_scoping(name, self.named_selection(name).deep_copy(server))
+        mesh.unit = self.unit
+        return mesh
+
+    def _deep_copy_by_entity(self, server=None):
+        """Copy the nodes and elements one at a time, for servers older than 3.0."""
         node_ids = self.nodes.scoping.ids
         element_ids = self.elements.scoping.ids
         mesh = MeshedRegion(num_nodes=len(node_ids), num_elements=len(element_ids), server=server)
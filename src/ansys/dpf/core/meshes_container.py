@@ -75,8 +75,8 @@ class MeshesContainer(Collection):
         pl = DpfPlotter(**kwargs)
         # If a fields' container is given
         if fields_container is not None:
-            for i in range(len(fields_container)):
-                label_space = fields_container.get_label_space(i)
+            label_spaces = fields_container.get_label_spaces()
+            for label_space, field in zip(label_spaces, fields_container):
                 mesh_to_send = self.get_mesh(label_space)
                 if mesh_to_send is None:
                     raise dpf_errors.DpfValueError(
@@ -84,7 +84,6 @@ class MeshesContainer(Collection):
                         "container do not have the same scope. "
                         "Plotting can not proceed. "
                     )
-                field = fields_container[i]
                 if deform_by:
                     from ansys.dpf.core.operators import scoping
 
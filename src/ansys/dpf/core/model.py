@@ -439,6 +439,7 @@ class Metadata:
         if self._meshed_region is None:
             self._meshed_region = self.mesh_provider.get_output(0, types.meshed_region)
             self._meshed_region._set_stream_provider(self._stream_provider)
+            self._meshed_region._set_origin_data_sources(self._data_sources)
 
         return self._meshed_region
 
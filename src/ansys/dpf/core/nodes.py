@@ -7,7 +7,7 @@ Nodes
 import numpy as np
 from ansys.dpf.core.common import nodal_properties, locations
 from ansys.dpf.core.check_version import version_requires
-from ansys.dpf.core.check_version import version_requires
+from ansys.dpf.core._id_index import _IdIndex
 
 
 class Node:
@@ -25,8 +25,10 @@ class Node:
         ID of the node.
     index : int
         Index of the node.
-    coordinates : list
-        List of ``[x, y, z]`` coordinates for the node.
+    coordinates : list, optional
+        List of ``[x, y, z]`` coordinates for the node. The default is ``None``,
+        in which case the coordinates are read lazily from the mesh's cached
+        coordinates array.
 
     Examples
     --------
@@ -45,7 +47,7 @@ class Node:
 
     """
 
-    def __init__(self, mesh, nodeid, index, coordinates):
+    def __init__(self, mesh, nodeid, index, coordinates=None):
         self._id = nodeid
         self._index = index
         self._coordinates = coordinates
@@ -76,6 +78,8 @@ class Node:
         [0.015, 0.045, 0.015]
 
         """
+        if self._coordinates is None:
+            self._coordinates = self._mesh.nodes._coordinates_array[self._index].tolist()
         return self._coordinates
 
     @property
@@ -120,7 +124,12 @@ class Nodes:
     def __init__(self, mesh):
         self._mesh = mesh
         self._server = mesh._server
-        self._mapping_id_to_index = None
+
+    def _clear_cache(self):
+        """Clear the arrays cached from the server when the nodes of the mesh change."""
+        self._mesh._nodes_arrays.clear()
+        # the mesh no longer matches the result files it was read from
+        self._mesh._origin_data_sources = None
 
     def __str__(self):
         return f"DPF Node collection with {len(self)} nodes\n"
@@ -133,8 +142,8 @@ class Nodes:
         return self.n_nodes
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        for index, node_id in enumerate(self._ids_array.tolist()):
+            yield Node(self._mesh, node_id, index)
 
     def node_by_id(self, id):
         """Array of node coordinates ordered by ID."""
@@ -163,13 +172,77 @@ class Nodes:
         if nodeindex is None:
             nodeindex = self._mesh._api.meshed_region_get_node_index(self._mesh, nodeid)
         elif nodeid is None:
-            nodeid = self._mesh._api.meshed_region_get_node_id(self._mesh, nodeindex)
-        node_coordinates = [
-            self._mesh._api.meshed_region_get_node_coord(self._mesh, index=nodeindex, coordinate=0),
-            self._mesh._api.meshed_region_get_node_coord(self._mesh, index=nodeindex, coordinate=1),
-            self._mesh._api.meshed_region_get_node_coord(self._mesh, index=nodeindex, coordinate=2),
-        ]
-        return Node(self._mesh, nodeid, nodeindex, node_coordinates)
+            nodeid = int(self._ids_array[nodeindex])
+        return Node(self._mesh, nodeid, nodeindex)
+
+    @property
+    def _ids_array(self):
+        """Array of the node IDs, retrieved once from the server and cached on the mesh."""
+        arrays = self._mesh._nodes_arrays
+        if "ids" not in arrays:
+            node_scoping = self.scoping
+            if node_scoping is None:
+                arrays["ids"] = np.empty(0, dtype=np.int32)
+            else:
+                arrays["ids"] = node_scoping._get_ids(np_array=True)
+        return arrays["ids"]
+
+    @property
+    def _coordinates_array(self):
+        """Array of the node coordinates, retrieved once from the server and cached on the mesh."""
+        arrays = self._mesh._nodes_arrays
+        if "coordinates" not in arrays:
+            # keep the field alive as long as its data is used
+            arrays["coordinates_field"] = self._get_coordinates_field()
+            arrays["coordinates"] = arrays["coordinates_field"].data
+        return arrays["coordinates"]
+
+    @property
+    def _id_index(self):
+        """Vectorized ID to index map, built once and cached on the mesh."""
+        arrays = self._mesh._nodes_arrays
+        if "id_index" not in arrays:
+            arrays["id_index"] = _IdIndex(self._ids_array)
+        return arrays["id_index"]
+
+    def _indices_by_ids(self, ids):
+        """Retrieve the indices of the given node IDs."""
+        ids = np.asarray(ids)
+        indices = self._id_index.indices(ids)
+        missing = indices < 0
+        if missing.any():
+            raise ValueError(f"Node ID {ids.reshape(-1)[missing][0]} is not in the mesh.")
+        return indices
+
+    def coordinates_by_ids(self, ids):
+        """
+        Coordinates of several nodes retrieved in bulk.
+
+        The coordinates of all the nodes are transferred once from the server and
+        cached, so that this method does not make a server call per node.
+
+        Parameters
+        ----------
+        ids : list[int], numpy.ndarray
+            IDs of the nodes.
+
+        Returns
+        -------
+        coordinates : numpy.ndarray
+            Array of shape ``(len(ids), 3)`` with the coordinates of the nodes.
+
+        Examples
+        --------
+        >>> import ansys.dpf.core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_static_rst())
+        >>> nodes = model.metadata.meshed_region.nodes
+        >>> coordinates = nodes.coordinates_by_ids([1, 2])
+        >>> coordinates.shape
+        (2, 3)
+
+        """
+        return np.asarray(self._coordinates_array)[self._indices_by_ids(ids)]
 
     @property
     def scoping(self):
@@ -273,13 +346,14 @@ class Nodes:
 
     def _build_mapping_id_to_index(self):
         """Retrieve a mapping between IDs and indices of the entity."""
-        return {eid: i for i, eid in enumerate(self.scoping.ids)}
+        return dict(zip(self._ids_array.tolist(), range(len(self._ids_array))))
 
     @property
     def mapping_id_to_index(self):
-        if self._mapping_id_to_index is None:
-            self._mapping_id_to_index = self._build_mapping_id_to_index()
-        return self._mapping_id_to_index
+        arrays = self._mesh._nodes_arrays
+        if "mapping_id_to_index" not in arrays:
+            arrays["mapping_id_to_index"] = self._build_mapping_id_to_index()
+        return arrays["mapping_id_to_index"]
 
     def map_scoping(self, external_scope):
         """
@@ -320,10 +394,9 @@ class Nodes:
         """
         if external_scope.location in ["Elemental", "NodalElemental"]:
             raise ValueError('Input scope location must be "Nodal"')
-        arr = np.array(list(map(self.mapping_id_to_index.get, external_scope.ids)))
-        mask = arr != None
-        ind = arr[mask].astype(np.int32)
-        return ind, mask
+        indices = self._id_index.indices(external_scope.ids)
+        mask = indices >= 0
+        return indices[mask], mask
 
     def add_node(self, id, coordinates):
         """
@@ -338,6 +411,7 @@ class Nodes:
             List of ``[x, y, z]`` coordinates for the node.
         """
         self._mesh._api.meshed_region_add_node(self._mesh, coordinates, id)
+        self._clear_cache()
 
     def add_nodes(self, num):
         """
@@ -368,6 +442,7 @@ class Nodes:
             add = NodeAdder()
             yield add
             self._mesh._api.meshed_region_add_node(self._mesh, add.coordinates, add.id)
+            self._clear_cache()
 
 
 class NodeAdder:
@@ -405,6 +405,97 @@ class Specification(SpecificationBase):
         return self._config_specification
 
 
+def _get_specification(operator_name, server=None):
+    """Retrieve the ``Specification`` of an operator from the cache of its server.
+
+    The specification is only queried from the server the first time an operator
+    with this name is instantiated on this server. Its pins, description and
+    configuration options are then shared by all the following operators.
+
+    Parameters
+    ----------
+    operator_name : str
+        Name of the operator.
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+
+    Returns
+    -------
+    Specification
+    """
+    server = server_module.get_or_create_server(server)
+    specifications = server._operator_specifications
+    spec = specifications.get(operator_name)
+    if spec is None:
+        spec = Specification(operator_name=operator_name, server=server)
+        specifications[operator_name] = spec
+    return spec
+
+
+def _get_available_operator_names(server=None):
+    """Retrieve the names of the operators available on a server from the cache of
+    the server.
+
+    Parameters
+    ----------
+    server : server.DPFServer, optional
+        Server with channel connected to the remote or local instance. When
+        ``None``, attempts to use the global server.
+
+    Returns
+    -------
+    frozenset, None
+        Names of the available operators, or ``None`` if the server cannot list
+        its operators.
+    """
+    from ansys.dpf.core.dpf_operator import available_operator_names
+
+    server = server_module.get_or_create_server(server)
+    names = server._available_operator_names
+    if names is None:
+        try:
+            names = frozenset(available_operator_names(server))
+        except Exception:
+            # the server is too old or its type does not list the operators
+            names = False
+        server._available_operator_names = names
+    return names or None
+
+
+def clear_specification_cache(server=None):
+    """Clear the cached operator specifications and names of the available operators.
+
+    This is required when the operators available on a server change, which is
+    done automatically when a library of operators is loaded.
+
+    Parameters
+    ----------
+    server : server.DPFServer, optional
+        Server for which to clear the cache. When ``None``, the caches of all
+        the servers of this Python session are cleared.
+
+    Examples
+    --------
+    >>> from ansys.dpf.core.operator_specification import clear_specification_cache
+    >>> clear_specification_cache()
+
+    """
+    if server is not None:
+        server._operator_specifications.clear()
+        server._available_operator_names = None
+        return
+    from ansys.dpf import core
+
+    servers = [server_ref() for server_ref in core._server_instances]
+    if core.SERVER is not None:
+        servers.append(core.SERVER)
+    for server in servers:
+        if server is not None:
+            server._operator_specifications.clear()
+            server._available_operator_names = None
+
+
 class CustomConfigOptionSpec(ConfigOptionSpec):
     def __init__(self, option_name: str, default_value, document: str):
         type_names = [mapping_types.map_types_to_cpp[type(default_value).__name__]]
@@ -1,14 +1,23 @@
-from . import math
-from . import utility
-from . import result
-from . import min_max
-from . import scoping
-from . import filter
-from . import logic
-from . import metadata
-from . import mesh
-from . import serialization
-from . import averaging
-from . import geo
-from . import invariant
-from . import mapping
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "averaging",
+        "filter",
+        "geo",
+        "invariant",
+        "logic",
+        "mapping",
+        "math",
+        "mesh",
+        "metadata",
+        "min_max",
+        "result",
+        "scoping",
+        "serialization",
+        "utility",
+    ],
+    classes=False,
+)
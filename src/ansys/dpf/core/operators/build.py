@@ -8,6 +8,7 @@ import black
 import chevron
 from ansys.dpf import core as dpf
 from ansys.dpf.core import common
+from ansys.dpf.core._lazy_operators import write_init_files
 from ansys.dpf.core.dpf_operator import available_operator_names
 from ansys.dpf.core.outputs import _make_printable_type
 from ansys.dpf.core.mapping_types import map_types_to_python
@@ -225,6 +226,8 @@ def build_operators():
                     error_file.write(f"Class: {operator_str}")
                 print(error_message)
 
+    write_init_files(this_path)
+
     print(f"Generated {succeeded} out of {len(available_operators)}")
     if succeeded == len(available_operators):
         print("Success")
@@ -1,12 +1,20 @@
-from .field_signed_high_pass import field_signed_high_pass 
-from .field_band_pass_fc import field_band_pass_fc 
-from .scoping_low_pass import scoping_low_pass 
-from .field_high_pass import field_high_pass 
-from .scoping_high_pass import scoping_high_pass 
-from .field_high_pass_fc import field_high_pass_fc 
-from .field_low_pass import field_low_pass 
-from .field_low_pass_fc import field_low_pass_fc 
-from .field_band_pass import field_band_pass 
-from .scoping_band_pass import scoping_band_pass 
-from .signed_scoping_high_pass import signed_scoping_high_pass 
-from .abc_weightings import abc_weightings 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "abc_weightings",
+        "field_band_pass",
+        "field_band_pass_fc",
+        "field_high_pass",
+        "field_high_pass_fc",
+        "field_low_pass",
+        "field_low_pass_fc",
+        "field_signed_high_pass",
+        "scoping_band_pass",
+        "scoping_high_pass",
+        "scoping_low_pass",
+        "signed_scoping_high_pass",
+    ],
+)
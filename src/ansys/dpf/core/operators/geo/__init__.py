@@ -1,17 +1,25 @@
-from .rotate_in_cylindrical_cs_fc import rotate_in_cylindrical_cs_fc 
-from .rotate import rotate 
-from .rotate_in_cylindrical_cs import rotate_in_cylindrical_cs 
-from .rotate_fc import rotate_fc 
-from .to_polar_coordinates import to_polar_coordinates 
-from .spherical_to_cartesian_fc import spherical_to_cartesian_fc 
-from .spherical_to_cartesian import spherical_to_cartesian 
-from .cartesian_to_spherical_fc import cartesian_to_spherical_fc 
-from .cartesian_to_spherical import cartesian_to_spherical 
-from .normals_provider_nl import normals_provider_nl 
-from .elements_volumes_over_time import elements_volumes_over_time 
-from .elements_facets_surfaces_over_time import elements_facets_surfaces_over_time 
-from .gauss_to_node import gauss_to_node 
-from .elements_volume import elements_volume 
-from .element_nodal_contribution import element_nodal_contribution 
-from .integrate_over_elements import integrate_over_elements 
-from .normals import normals 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "cartesian_to_spherical",
+        "cartesian_to_spherical_fc",
+        "element_nodal_contribution",
+        "elements_facets_surfaces_over_time",
+        "elements_volume",
+        "elements_volumes_over_time",
+        "gauss_to_node",
+        "integrate_over_elements",
+        "normals",
+        "normals_provider_nl",
+        "rotate",
+        "rotate_fc",
+        "rotate_in_cylindrical_cs",
+        "rotate_in_cylindrical_cs_fc",
+        "spherical_to_cartesian",
+        "spherical_to_cartesian_fc",
+        "to_polar_coordinates",
+    ],
+)
@@ -1,14 +1,22 @@
-from .eigen_values import eigen_values 
-from .principal_invariants import principal_invariants 
-from .von_mises_eqv import von_mises_eqv 
-from .segalman_von_mises_eqv import segalman_von_mises_eqv 
-from .von_mises_eqv_fc import von_mises_eqv_fc 
-from .segalman_von_mises_eqv_fc import segalman_von_mises_eqv_fc 
-from .invariants import invariants 
-from .eigen_values_fc import eigen_values_fc 
-from .invariants_fc import invariants_fc 
-from .principal_invariants_fc import principal_invariants_fc 
-from .convertnum_bcs_to_nod import convertnum_bcs_to_nod 
-from .eigen_vectors_fc import eigen_vectors_fc 
-from .eigen_vectors import eigen_vectors 
-from .convertnum_nod_to_bcs import convertnum_nod_to_bcs 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "convertnum_bcs_to_nod",
+        "convertnum_nod_to_bcs",
+        "eigen_values",
+        "eigen_values_fc",
+        "eigen_vectors",
+        "eigen_vectors_fc",
+        "invariants",
+        "invariants_fc",
+        "principal_invariants",
+        "principal_invariants_fc",
+        "segalman_von_mises_eqv",
+        "segalman_von_mises_eqv_fc",
+        "von_mises_eqv",
+        "von_mises_eqv_fc",
+    ],
+)
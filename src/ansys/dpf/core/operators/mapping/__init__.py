@@ -1,7 +1,15 @@
-from .solid_to_skin import solid_to_skin 
-from .scoping_on_coordinates import scoping_on_coordinates 
-from .find_reduced_coordinates import find_reduced_coordinates 
-from .on_reduced_coordinates import on_reduced_coordinates 
-from .on_coordinates import on_coordinates 
-from .solid_to_skin_fc import solid_to_skin_fc 
-from .prepare_mapping_workflow import prepare_mapping_workflow 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "find_reduced_coordinates",
+        "on_coordinates",
+        "on_reduced_coordinates",
+        "prepare_mapping_workflow",
+        "scoping_on_coordinates",
+        "solid_to_skin",
+        "solid_to_skin_fc",
+    ],
+)
@@ -1,80 +1,89 @@
-from .conjugate import conjugate 
-from .real_part import real_part 
-from .img_part import img_part 
-from .cplx_multiply import cplx_multiply 
-from .unit_convert import unit_convert 
-from .norm import norm 
-from .sqrt import sqrt 
-from .unit_convert_fc import unit_convert_fc 
-from .norm_fc import norm_fc 
-from .sqrt_fc import sqrt_fc 
-from .accumulate_min_over_label_fc import accumulate_min_over_label_fc 
-from .add import add 
-from .time_freq_interpolation import time_freq_interpolation 
-from .add_fc import add_fc 
-from .sin_fc import sin_fc 
-from .add_constant import add_constant 
-from .component_wise_divide import component_wise_divide 
-from .add_constant_fc import add_constant_fc 
-from .cross_product_fc import cross_product_fc 
-from .minus import minus 
-from .minus_fc import minus_fc 
-from .accumulate import accumulate 
-from .pow import pow 
-from .scale import scale 
-from .pow_fc import pow_fc 
-from .scale_fc import scale_fc 
-from .centroid import centroid 
-from .sweeping_phase import sweeping_phase 
-from .centroid_fc import centroid_fc 
-from .sweeping_phase_fc import sweeping_phase_fc 
-from .sqr import sqr 
-from .sin import sin 
-from .cos import cos 
-from .cos_fc import cos_fc 
-from .linear_combination import linear_combination 
-from .sqr_fc import sqr_fc 
-from .exponential import exponential 
-from .exponential_fc import exponential_fc 
-from .ln import ln 
-from .ln_fc import ln_fc 
-from .cross_product import cross_product 
-from .component_wise_divide_fc import component_wise_divide_fc 
-from .kronecker_prod import kronecker_prod 
-from .amplitude import amplitude 
-from .cplx_dot import cplx_dot 
-from .cplx_divide import cplx_divide 
-from .cplx_derive import cplx_derive 
-from .polar_to_cplx import polar_to_cplx 
-from .amplitude_fc import amplitude_fc 
-from .generalized_inner_product_fc import generalized_inner_product_fc 
-from .phase import phase 
-from .phase_fc import phase_fc 
-from .modulus import modulus 
-from .accumulate_fc import accumulate_fc 
-from .generalized_inner_product import generalized_inner_product 
-from .outer_product import outer_product 
-from .overall_dot import overall_dot 
-from .relative_error import relative_error 
-from .dot import dot 
-from .scale_by_field_fc import scale_by_field_fc 
-from .invert_fc import invert_fc 
-from .accumulate_level_over_label_fc import accumulate_level_over_label_fc 
-from .accumulate_over_label_fc import accumulate_over_label_fc 
-from .average_over_label_fc import average_over_label_fc 
-from .dot_tensor import dot_tensor 
-from .scale_by_field import scale_by_field 
-from .invert import invert 
-from .make_one_on_comp import make_one_on_comp 
-from .correlation import correlation 
-from .entity_extractor import entity_extractor 
-from .modal_superposition import modal_superposition 
-from .modal_participation import modal_participation 
-from .accumulation_per_scoping import accumulation_per_scoping 
-from .matrix_inverse import matrix_inverse 
-from .fft_eval import fft_eval 
-from .qr_solve import qr_solve 
-from .fft_gradient_eval import fft_gradient_eval 
-from .fft_approx import fft_approx 
-from .fft_multi_harmonic_minmax import fft_multi_harmonic_minmax 
-from .svd import svd 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "accumulate",
+        "accumulate_fc",
+        "accumulate_level_over_label_fc",
+        "accumulate_min_over_label_fc",
+        "accumulate_over_label_fc",
+        "accumulation_per_scoping",
+        "add",
+        "add_constant",
+        "add_constant_fc",
+        "add_fc",
+        "amplitude",
+        "amplitude_fc",
+        "average_over_label_fc",
+        "centroid",
+        "centroid_fc",
+        "component_wise_divide",
+        "component_wise_divide_fc",
+        "conjugate",
+        "correlation",
+        "cos",
+        "cos_fc",
+        "cplx_derive",
+        "cplx_divide",
+        "cplx_dot",
+        "cplx_multiply",
+        "cross_product",
+        "cross_product_fc",
+        "dot",
+        "dot_tensor",
+        "entity_extractor",
+        "exponential",
+        "exponential_fc",
+        "fft_approx",
+        "fft_eval",
+        "fft_gradient_eval",
+        "fft_multi_harmonic_minmax",
+        "generalized_inner_product",
+        "generalized_inner_product_fc",
+        "img_part",
+        "invert",
+        "invert_fc",
+        "kronecker_prod",
+        "linear_combination",
+        "ln",
+        "ln_fc",
+        "make_one_on_comp",
+        "matrix_inverse",
+        "min_max_over_time",
+        "minus",
+        "minus_fc",
+        "modal_participation",
+        "modal_superposition",
+        "modulus",
+        "norm",
+        "norm_fc",
+        "outer_product",
+        "overall_dot",
+        "phase",
+        "phase_fc",
+        "polar_to_cplx",
+        "pow",
+        "pow_fc",
+        "qr_solve",
+        "real_part",
+        "relative_error",
+        "scale",
+        "scale_by_field",
+        "scale_by_field_fc",
+        "scale_fc",
+        "sin",
+        "sin_fc",
+        "sqr",
+        "sqr_fc",
+        "sqrt",
+        "sqrt_fc",
+        "svd",
+        "sweeping_phase",
+        "sweeping_phase_fc",
+        "time_freq_interpolation",
+        "unit_convert",
+        "unit_convert_fc",
+    ],
+)
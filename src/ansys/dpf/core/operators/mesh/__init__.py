@@ -1,28 +1,37 @@
-from .node_coordinates import node_coordinates 
-from .from_field import from_field 
-from .mesh_provider import mesh_provider 
-from .meshes_provider import meshes_provider 
-from .beam_properties import beam_properties 
-from .mesh_get_attribute import mesh_get_attribute 
-from .points_from_coordinates import points_from_coordinates 
-from .change_cs import change_cs 
-from .from_scoping import from_scoping 
-from .split_fields import split_fields 
-from .split_mesh import split_mesh 
-from .mesh_clip import mesh_clip 
-from .make_sphere_levelset import make_sphere_levelset 
-from .tri_mesh_skin import tri_mesh_skin 
-from .mesh_cut import mesh_cut 
-from .combine_levelset import combine_levelset 
-from .external_layer import external_layer 
-from .skin import skin 
-from .stl_export import stl_export 
-from .mesh_plan_clip import mesh_plan_clip 
-from .mesh_to_graphics import mesh_to_graphics 
-from .mesh_to_graphics_edges import mesh_to_graphics_edges 
-from .make_plane_levelset import make_plane_levelset 
-from .exclude_levelset import exclude_levelset 
-from .mesh_extraction import mesh_extraction 
-from .wireframe import wireframe 
-from .decimate_mesh import decimate_mesh 
-from .mesh_to_pyvista import mesh_to_pyvista 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "acmo_mesh_provider",
+        "beam_properties",
+        "change_cs",
+        "combine_levelset",
+        "decimate_mesh",
+        "exclude_levelset",
+        "external_layer",
+        "from_field",
+        "from_scoping",
+        "make_plane_levelset",
+        "make_sphere_levelset",
+        "mesh_clip",
+        "mesh_cut",
+        "mesh_extraction",
+        "mesh_get_attribute",
+        "mesh_plan_clip",
+        "mesh_provider",
+        "mesh_to_graphics",
+        "mesh_to_graphics_edges",
+        "mesh_to_pyvista",
+        "meshes_provider",
+        "node_coordinates",
+        "points_from_coordinates",
+        "skin",
+        "split_fields",
+        "split_mesh",
+        "stl_export",
+        "tri_mesh_skin",
+        "wireframe",
+    ],
+)
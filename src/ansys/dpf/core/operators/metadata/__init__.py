@@ -1,16 +1,24 @@
-from .mesh_support_provider import mesh_support_provider 
-from .mesh_property_provider import mesh_property_provider 
-from .result_info_provider import result_info_provider 
-from .time_freq_provider import time_freq_provider 
-from .material_provider import material_provider 
-from .streams_provider import streams_provider 
-from .datasources_provider import datasources_provider 
-from .mesh_selection_manager_provider import mesh_selection_manager_provider 
-from .boundary_condition_provider import boundary_condition_provider 
-from .is_cyclic import is_cyclic 
-from .material_support_provider import material_support_provider 
-from .property_field_provider_by_name import property_field_provider_by_name 
-from .time_freq_support_get_attribute import time_freq_support_get_attribute 
-from .integrate_over_time_freq import integrate_over_time_freq 
-from .cyclic_mesh_expansion import cyclic_mesh_expansion 
-from .cyclic_support_provider import cyclic_support_provider 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "boundary_condition_provider",
+        "cyclic_mesh_expansion",
+        "cyclic_support_provider",
+        "datasources_provider",
+        "integrate_over_time_freq",
+        "is_cyclic",
+        "material_provider",
+        "material_support_provider",
+        "mesh_property_provider",
+        "mesh_selection_manager_provider",
+        "mesh_support_provider",
+        "property_field_provider_by_name",
+        "result_info_provider",
+        "streams_provider",
+        "time_freq_provider",
+        "time_freq_support_get_attribute",
+    ],
+)
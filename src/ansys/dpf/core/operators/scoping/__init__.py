@@ -1,15 +1,23 @@
-from .elemental_from_mesh import elemental_from_mesh 
-from .intersect import intersect 
-from .on_property import on_property 
-from .transpose import transpose 
-from .rescope_fc import rescope_fc 
-from .nodal_from_mesh import nodal_from_mesh 
-from .scoping_get_attribute import scoping_get_attribute 
-from .rescope import rescope 
-from .reduce_sampling import reduce_sampling 
-from .on_named_selection import on_named_selection 
-from .split_on_property_type import split_on_property_type 
-from .connectivity_ids import connectivity_ids 
-from .change_fc import change_fc 
-from .on_mesh_property import on_mesh_property 
-from .from_mesh import from_mesh 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "change_fc",
+        "connectivity_ids",
+        "elemental_from_mesh",
+        "from_mesh",
+        "intersect",
+        "nodal_from_mesh",
+        "on_mesh_property",
+        "on_named_selection",
+        "on_property",
+        "reduce_sampling",
+        "rescope",
+        "rescope_fc",
+        "scoping_get_attribute",
+        "split_on_property_type",
+        "transpose",
+    ],
+)
@@ -1,21 +1,29 @@
-from .mechanical_csv_to_field import mechanical_csv_to_field 
-from .serializer import serializer 
-from .field_to_csv import field_to_csv 
-from .csv_to_field import csv_to_field 
-from .txt_to_data_tree import txt_to_data_tree 
-from .string_deserializer import string_deserializer 
-from .data_tree_to_txt import data_tree_to_txt 
-from .import_symbolic_workflow import import_symbolic_workflow 
-from .export_symbolic_workflow import export_symbolic_workflow 
-from .serializer_to_string import serializer_to_string 
-from .deserializer import deserializer 
-from .data_tree_to_json import data_tree_to_json 
-from .json_to_data_tree import json_to_data_tree 
-from .vtk_export import vtk_export 
-from .vtk_to_fields import vtk_to_fields 
-from .migrate_file_to_vtk import migrate_file_to_vtk 
-from .serialize_to_hdf5 import serialize_to_hdf5 
-from .workflow_import_json import workflow_import_json 
-from .workflow_export_json import workflow_export_json 
-from .vtu_export import vtu_export 
-from .migrate_to_vtu import migrate_to_vtu 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "csv_to_field",
+        "data_tree_to_json",
+        "data_tree_to_txt",
+        "deserializer",
+        "export_symbolic_workflow",
+        "field_to_csv",
+        "import_symbolic_workflow",
+        "json_to_data_tree",
+        "mechanical_csv_to_field",
+        "migrate_file_to_vtk",
+        "migrate_to_vtu",
+        "serialize_to_hdf5",
+        "serializer",
+        "serializer_to_string",
+        "string_deserializer",
+        "txt_to_data_tree",
+        "vtk_export",
+        "vtk_to_fields",
+        "vtu_export",
+        "workflow_export_json",
+        "workflow_import_json",
+    ],
+)
@@ -1,62 +1,71 @@
-from .html_doc import html_doc 
-from .merge_result_infos import merge_result_infos 
-from .make_label_space import make_label_space 
-from .make_for_each_range import make_for_each_range 
-from .remove_unnecessary_labels import remove_unnecessary_labels 
-from .change_location import change_location 
-from .field_to_fc import field_to_fc 
-from .unitary_field import unitary_field 
-from .extract_field import extract_field 
-from .bind_support import bind_support 
-from .scalars_to_field import scalars_to_field 
-from .ints_to_scoping import ints_to_scoping 
-from .set_property import set_property 
-from .forward_field import forward_field 
-from .forward_fields_container import forward_fields_container 
-from .forward_meshes_container import forward_meshes_container 
-from .forward import forward 
-from .delegate_to_operator import delegate_to_operator 
-from .txt_file_to_dpf import txt_file_to_dpf 
-from .bind_support_fc import bind_support_fc 
-from .fc_get_attribute import fc_get_attribute 
-from .assemble_scalars_to_vectors import assemble_scalars_to_vectors 
-from .assemble_scalars_to_vectors_fc import assemble_scalars_to_vectors_fc 
-from .assemble_scalars_to_matrices import assemble_scalars_to_matrices 
-from .assemble_scalars_to_matrices_fc import assemble_scalars_to_matrices_fc 
-from .default_value import default_value 
-from .extract_sub_fc import extract_sub_fc 
-from .extract_sub_mc import extract_sub_mc 
-from .extract_sub_sc import extract_sub_sc 
-from .compute_time_scoping import compute_time_scoping 
-from .python_generator import python_generator 
-from .make_overall import make_overall 
-from .merge_weighted_fields_containers import merge_weighted_fields_containers 
-from .merge_fields_containers import merge_fields_containers 
-from .merge_scopings import merge_scopings 
-from .merge_materials import merge_materials 
-from .merge_scopings_containers import merge_scopings_containers 
-from .merge_supports import merge_supports 
-from .extract_scoping import extract_scoping 
-from .for_each import for_each 
-from .merge_property_fields import merge_property_fields 
-from .remote_workflow_instantiate import remote_workflow_instantiate 
-from .remote_operator_instantiate import remote_operator_instantiate 
-from .merge_time_freq_supports import merge_time_freq_supports 
-from .overlap_fields import overlap_fields 
-from .merge_meshes import merge_meshes 
-from .merge_weighted_fields import merge_weighted_fields 
-from .merge_fields import merge_fields 
-from .merge_fields_by_label import merge_fields_by_label 
-from .weighted_merge_fields_by_label import weighted_merge_fields_by_label 
-from .merge_meshes_containers import merge_meshes_containers 
-from .split_in_for_each_range import split_in_for_each_range 
-from .incremental_concatenate_as_fc import incremental_concatenate_as_fc 
-from .make_producer_consumer_for_each_iterator import make_producer_consumer_for_each_iterator 
-from .producer_consumer_for_each import producer_consumer_for_each 
-from .set_attribute import set_attribute 
-from .strain_from_voigt import strain_from_voigt 
-from .extract_time_freq import extract_time_freq 
-from .change_shell_layers import change_shell_layers 
-from .python_script_exec import python_script_exec 
-from .hdf5dpf_custom_read import hdf5dpf_custom_read 
-from .hdf5dpf_workglow_provider import hdf5dpf_workglow_provider 
+"""Lazily loaded operators, see ``ansys.dpf.core._lazy_operators``."""
+from ansys.dpf.core._lazy_operators import make_lazy
+
+make_lazy(
+    __name__,
+    [
+        "assemble_scalars_to_matrices",
+        "assemble_scalars_to_matrices_fc",
+        "assemble_scalars_to_vectors",
+        "assemble_scalars_to_vectors_fc",
+        "bind_support",
+        "bind_support_fc",
+        "change_location",
+        "change_shell_layers",
+        "compute_time_scoping",
+        "default_value",
+        "delegate_to_operator",
+        "extract_field",
+        "extract_scoping",
+        "extract_sub_fc",
+        "extract_sub_mc",
+        "extract_sub_sc",
+        "extract_time_freq",
+        "fc_get_attribute",
+        "field_to_fc",
+        "for_each",
+        "forward",
+        "forward_field",
+        "forward_fields_container",
+        "forward_meshes_container",
+        "hdf5dpf_custom_read",
+        "hdf5dpf_workglow_provider",
+        "html_doc",
+        "incremental_concatenate_as_fc",
+        "ints_to_scoping",
+        "make_for_each_range",
+        "make_label_space",
+        "make_overall",
+        "make_producer_consumer_for_each_iterator",
+        "make_time_chunk_for_each",
+        "merge_fields",
+        "merge_fields_by_label",
+        "merge_fields_containers",
+        "merge_materials",
+        "merge_meshes",
+        "merge_meshes_containers",
+        "merge_property_fields",
+        "merge_result_infos",
+        "merge_scopings",
+        "merge_scopings_containers",
+        "merge_supports",
+        "merge_time_freq_supports",
+        "merge_weighted_fields",
+        "merge_weighted_fields_containers",
+        "overlap_fields",
+        "producer_consumer_for_each",
+        "python_generator",
+        "python_script_exec",
+        "remote_operator_instantiate",
+        "remote_workflow_instantiate",
+        "remove_unnecessary_labels",
+        "scalars_to_field",
+        "set_attribute",
+        "set_property",
+        "split_in_for_each_range",
+        "strain_from_voigt",
+        "txt_file_to_dpf",
+        "unitary_field",
+        "weighted_merge_fields_by_label",
+    ],
+)
@@ -152,9 +152,7 @@ class _PyVistaPlotter:
             else:
                 grid = meshed_region.grid
         else:
-            grid = meshed_region._as_vtk(
-                meshed_region.deform_by(deform_by, scale_factor), as_linear=as_linear
-            )
+            grid = meshed_region._deformed_grid(deform_by, scale_factor, as_linear=as_linear)
 
         # show axes
         show_axes = kwargs.pop("show_axes", None)
@@ -239,43 +237,18 @@ class _PyVistaPlotter:
         as_linear=True,
         **kwargs,
     ):
-        # Get the field name
-        name = field.name.split("_")[0]
-        unit = field.unit
-        kwargs.setdefault("stitle", f"{name} ({unit})")
-
-        kwargs = self._set_scalar_bar_title(kwargs)
-
-        kwargs.setdefault("show_edges", True)
-        kwargs.setdefault("nan_color", "grey")
-
-        # show axes
-        show_axes = kwargs.pop("show_axes", None)
-        if show_axes:
-            self._plotter.add_axes()
+        kwargs = self._set_field_kwargs(field, kwargs)
 
         # get the meshed region location
         if meshed_region is None:
             meshed_region = field.meshed_region
 
-        location = field.location
-        if location == locations.nodal:
-            mesh_location = meshed_region.nodes
-        elif location == locations.elemental:
-            mesh_location = meshed_region.elements
-            if show_max or show_min:
-                warnings.warn("`show_max` and `show_min` is only supported for Nodal results.")
-                show_max = False
-                show_min = False
-        else:
-            raise ValueError("Only elemental or nodal location are supported for plotting.")
-        component_count = field.component_count
-        if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
-        else:
-            overall_data = np.full(len(mesh_location), np.nan)
-        ind, mask = mesh_location.map_scoping(field.scoping)
-        overall_data[ind] = field.data[mask]
+        mesh_location = self._get_mesh_location(field, meshed_region)
+        if field.location == locations.elemental and (show_max or show_min):
+            warnings.warn("`show_max` and `show_min` is only supported for Nodal results.")
+            show_max = False
+            show_min = False
+        overall_data = self._map_field_data(field, mesh_location)
 
         # Filter kwargs for add_mesh
         kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.add_mesh, **kwargs)
@@ -285,9 +258,7 @@ class _PyVistaPlotter:
         if not deform_by:
             grid = meshed_region.grid
         else:
-            grid = meshed_region._as_vtk(
-                meshed_region.deform_by(deform_by, scale_factor), as_linear
-            )
+            grid = meshed_region._deformed_grid(deform_by, scale_factor, as_linear=as_linear)
         grid.set_active_scalars(None)
         self._plotter.add_mesh(grid, scalars=overall_data, **kwargs_in)
 
@@ -358,6 +329,45 @@ class _PyVistaPlotter:
         kwargs_in = _sort_supported_kwargs(bound_method=self._plotter.show, **kwargs)
         return self._plotter.show(**kwargs_in)
 
+    def _set_field_kwargs(self, field, kwargs):
+        # Get the field name
+        name = field.name.split("_")[0]
+        unit = field.unit
+        kwargs.setdefault("stitle", f"{name} ({unit})")
+
+        kwargs = self._set_scalar_bar_title(kwargs)
+
+        kwargs.setdefault("show_edges", True)
+        kwargs.setdefault("nan_color", "grey")
+
+        # show axes
+        show_axes = kwargs.pop("show_axes", None)
+        if show_axes:
+            self._plotter.add_axes()
+        return kwargs
+
+    @staticmethod
+    def _get_mesh_location(field, meshed_region):
+        location = field.location
+        if location == locations.nodal:
+            return meshed_region.nodes
+        elif location == locations.elemental:
+            return meshed_region.elements
+        raise ValueError("Only elemental or nodal location are supported for plotting.")
+
+    @staticmethod
+    def _map_field_data(field, mesh_location):
+        """Return the data of a field ordered as the nodes or elements of the mesh,
+        with NaN where the field is not defined."""
+        component_count = field.component_count
+        if component_count > 1:
+            overall_data = np.full((len(mesh_location), component_count), np.nan)
+        else:
+            overall_data = np.full(len(mesh_location), np.nan)
+        ind, mask = mesh_location.map_scoping(field.scoping)
+        overall_data[ind] = field.data[mask]
+        return overall_data
+
     @staticmethod
     def _set_scalar_bar_title(kwargs):
         stitle = kwargs.pop("stitle", None)
@@ -732,6 +742,73 @@ class Plotter:
             pyplot.show(block=True)
         return f
 
+    @staticmethod
+    def _fetch_fields_data(fields_container, check_shell_layers):
+        """Fetch the data and scoping IDs of each field once, or ``None`` for the
+        fields with several shell layers.
+
+        The fields are only read concurrently on a ``LegacyGrpcServer``, the only
+        thread-safe server type, see ``Collection._map_requests``.
+        """
+
+        def fetch(field):
+            if check_shell_layers and field.shell_layers in [
+                eshell_layers.topbottom,
+                eshell_layers.topbottommid,
+            ]:
+                return None
+            data = field.data
+            if len(data) == 0:
+                return field, data, None
+            return field, data, field.scoping._get_ids(np_array=True)
+
+        return fields_container._map_requests(fetch, fields_container)
+
+    @staticmethod
+    def _merge_fields_data(fields_container, mesh, shell_layers=None):
+        """Merge the data of the fields of a container into a single array ordered as
+        the nodes or elements of the mesh, with NaN where no field is defined.
+
+        Returns
+        -------
+        overall_data : numpy.ndarray
+        field : Field
+            First field with data, describing the location and unit of the data.
+        """
+        fetched = Plotter._fetch_fields_data(fields_container, check_shell_layers=True)
+        if any(entry is None for entry in fetched):
+            # set the shell layers of all the fields, the top layers by default
+            sl = eshell_layers.top
+            if shell_layers is not None:
+                if not isinstance(shell_layers, eshell_layers):
+                    raise TypeError("shell_layer attribute must be a core.shell_layers instance.")
+                sl = shell_layers
+            change_op = core.Operator("change_shellLayers", server=fields_container._server)
+            change_op.inputs.fields_container.connect(fields_container)
+            change_op.inputs.e_shell_layer.connect(sl.value)
+            fields_container = change_op.get_output(0, core.types.fields_container)
+            fetched = Plotter._fetch_fields_data(fields_container, check_shell_layers=False)
+
+        fetched = [entry for entry in fetched if entry[2] is not None]
+        if not fetched:
+            raise ValueError("Only elemental or nodal location are supported for plotting.")
+        field = fetched[0][0]
+        mesh_location = _PyVistaPlotter._get_mesh_location(field, mesh)
+        component_count = field.component_count
+
+        ids = np.concatenate([entry[2] for entry in fetched])
+        if component_count > 1:
+            shape = (-1, component_count)
+            overall_data = np.full((len(mesh_location), component_count), np.nan)
+        else:
+            shape = -1
+            overall_data = np.full(len(mesh_location), np.nan)
+        data = np.concatenate([np.reshape(entry[1], shape) for entry in fetched])
+        indices = mesh_location._id_index.indices(ids)
+        mask = indices >= 0
+        overall_data[indices[mask]] = data[mask]
+        return overall_data, field
+
     def plot_contour(
         self,
         field_or_fields_container,
@@ -781,13 +858,13 @@ class Plotter:
             raise TypeError("Only field or fields_container can be plotted.")
 
         # pre-loop to check if the there are several time steps
-        labels = fields_container.get_label_space(0)
+        label_spaces = fields_container.get_label_spaces()
+        labels = label_spaces[0]
         if DefinitionLabels.complex in labels.keys():
             raise dpf_errors.ComplexPlottingError
         if DefinitionLabels.time in labels.keys():
             first_time = labels[DefinitionLabels.time]
-            for i in range(1, len(fields_container)):
-                label = fields_container.get_label_space(i)
+            for label in label_spaces[1:]:
                 if label[DefinitionLabels.time] != first_time:
                     raise dpf_errors.FieldContainerPlottingError
 
@@ -796,56 +873,9 @@ class Plotter:
         else:
             mesh = self._mesh
 
-        # get mesh scoping
-        location = None
-        component_count = None
-        name = None
-
-        # pre-loop to get location and component count
-        for field in fields_container:
-            if len(field.data) != 0:
-                location = field.location
-                component_count = field.component_count
-                name = field.name.split("_")[0]
-                unit = field.unit
-                break
-
-        if location == locations.nodal:
-            mesh_location = mesh.nodes
-        elif location == locations.elemental:
-            mesh_location = mesh.elements
-        else:
-            raise ValueError("Only elemental or nodal location are supported for plotting.")
-
-        # pre-loop: check if shell layers for each field, if yes, set the shell layers
-        changeOp = core.Operator("change_shellLayers")
-        for field in fields_container:
-            shell_layer_check = field.shell_layers
-            if shell_layer_check in [
-                eshell_layers.topbottom,
-                eshell_layers.topbottommid,
-            ]:
-                changeOp.inputs.fields_container.connect(fields_container)
-                sl = eshell_layers.top
-                if shell_layers is not None:
-                    if not isinstance(shell_layers, eshell_layers):
-                        raise TypeError(
-                            "shell_layer attribute must be a core.shell_layers instance."
-                        )
-                    sl = shell_layers
-                changeOp.inputs.e_shell_layer.connect(sl.value)  # top layers taken
-                fields_container = changeOp.get_output(0, core.types.fields_container)
-                break
-
-        # Merge field data into a single array
-        if component_count > 1:
-            overall_data = np.full((len(mesh_location), component_count), np.nan)
-        else:
-            overall_data = np.full(len(mesh_location), np.nan)
-
-        for field in fields_container:
-            ind, mask = mesh_location.map_scoping(field.scoping)
-            overall_data[ind] = field.data[mask]
+        overall_data, field = self._merge_fields_data(fields_container, mesh, shell_layers)
+        name = field.name.split("_")[0]
+        unit = field.unit
 
         # create the plotter and add the meshes
 
@@ -874,7 +904,7 @@ class Plotter:
         )
         as_linear = True
         if deform_by:
-            grid = mesh._as_vtk(mesh.deform_by(deform_by, scale_factor), as_linear=as_linear)
+            grid = mesh._deformed_grid(deform_by, scale_factor, as_linear=as_linear)
             self._internal_plotter.add_scale_factor_legend(scale_factor, **kwargs)
         else:
             if as_linear != mesh.as_linear:
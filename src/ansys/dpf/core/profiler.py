@@ -0,0 +1,313 @@
+"""
+Profiler
+========
+Contains the client-side profiler of the requests sent to the DPF servers.
+
+While a profile is active, the API functions of ``ansys.dpf.gate`` returned by
+``get_api_for_type`` are instrumented to measure the number of calls, the wall time
+and an estimate of the bytes moved, per API function and per calling Python frame.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+# active profiles
+_profiles = []
+_lock = threading.Lock()
+# original static methods of the instrumented API classes, by (class, name)
+_originals = {}
+# depth of API calls of each thread, only the outermost call is recorded
+_local = threading.local()
+
+_MAX_STACK_DEPTH = 64
+
+
+def _payload_size(obj):
+    """Estimate the number of bytes of an argument or result of an API function."""
+    if obj is None:
+        return 0
+    if isinstance(obj, (bool, int, float)):
+        return 8
+    if isinstance(obj, (bytes, bytearray, str)):
+        return len(obj)
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], (int, float)):
+            return 8 * len(obj)
+        return sum(_payload_size(item) for item in obj)
+    # protobuf messages
+    byte_size = getattr(obj, "ByteSize", None)
+    if callable(byte_size):
+        try:
+            return byte_size()
+        except Exception:
+            return 0
+    return 0
+
+
+def _frame_name(frame):
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def _record(name, caller, elapsed, n_bytes):
+    stack = []
+    frame = caller
+    while frame is not None and len(stack) < _MAX_STACK_DEPTH:
+        stack.append(_frame_name(frame))
+        frame = frame.f_back
+    stack.reverse()
+    for profile in list(_profiles):
+        profile._record(name, stack, elapsed, n_bytes)
+
+
+def _wrap(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "depth", 0) or not _profiles:
+            return function(*args, **kwargs)
+        caller = sys._getframe(1)
+        _local.depth = 1
+        result = None
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            _local.depth = 0
+            n_bytes = sum(_payload_size(arg) for arg in args) + _payload_size(result)
+            _record(name, caller, elapsed, n_bytes)
+
+    return wrapper
+
+
+def _instrument(api):
+    """Instrument the static methods of an API class, until the last profile stops."""
+    with _lock:
+        if not _profiles:
+            return
+        for name, member in list(vars(api).items()):
+            if isinstance(member, staticmethod) and (api, name) not in _originals:
+                _originals[(api, name)] = member
+                setattr(api, name, staticmethod(_wrap(name, member.__func__)))
+
+
+def _loaded_api_classes():
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not module_name.startswith("ansys.dpf.gate"):
+            continue
+        for value in list(vars(module).values()):
+            if (
+                isinstance(value, type)
+                and value.__module__ == module_name
+                and value.__name__.endswith(("CAPI", "GRPCAPI"))
+            ):
+                yield value
+
+
+class Profile:
+    """Client-side profile of the requests sent to the DPF servers.
+
+    The API functions are counted, timed and the bytes of their arguments and
+    results are estimated, from all threads, while the profile is active.
+    Only the outermost API function is recorded when API functions call each other.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> model = dpf.Model(examples.find_simple_bar())
+    >>> with dpf.profile() as profile:
+    ...     coordinates = [node.coordinates for node in model.metadata.meshed_region.nodes]
+    >>> calls = profile.stats()
+    >>> json_profile = profile.to_json()
+    >>> folded_stacks = profile.to_folded()
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._functions = {}
+        self._callers = {}
+        self._stacks = {}
+        self._start = None
+        self.elapsed = 0.0
+
+    def start(self):
+        """Start recording the API calls."""
+        with _lock:
+            _profiles.append(self)
+        for api in _loaded_api_classes():
+            _instrument(api)
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """Stop recording the API calls, and restore the API functions after the last
+        active profile stops."""
+        with _lock:
+            if self in _profiles:
+                _profiles.remove(self)
+            if not _profiles:
+                for (api, name), member in _originals.items():
+                    setattr(api, name, member)
+                _originals.clear()
+        if self._start is not None:
+            self.elapsed += time.perf_counter() - self._start
+            self._start = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _record(self, name, stack, elapsed, n_bytes):
+        caller = stack[-1] if stack else ""
+        folded = ";".join(stack + [name])
+        with self._lock:
+            for stats, key in (
+                (self._functions, name),
+                (self._callers, (name, caller)),
+                (self._stacks, folded),
+            ):
+                entry = stats.get(key)
+                if entry is None:
+                    stats[key] = [1, elapsed, n_bytes]
+                else:
+                    entry[0] += 1
+                    entry[1] += elapsed
+                    entry[2] += n_bytes
+
+    @property
+    def n_calls(self):
+        """Total number of API calls recorded.
+
+        Returns
+        -------
+        n_calls : int
+        """
+        return sum(entry[0] for entry in self._functions.values())
+
+    def stats(self, by="function"):
+        """Statistics of the API calls, sorted by decreasing time.
+
+        Parameters
+        ----------
+        by : str, optional
+            ``"function"`` to aggregate by API function, or ``"caller"`` to aggregate by
+            API function and calling Python frame. The default is ``"function"``.
+
+        Returns
+        -------
+        stats : list[dict]
+            Dictionaries with the ``"function"``, ``"caller"`` (when aggregated by
+            caller), ``"calls"``, ``"time"`` (in seconds) and ``"bytes"`` keys.
+        """
+        if by == "function":
+            items = [({"function": name}, entry) for name, entry in self._functions.items()]
+        elif by == "caller":
+            items = [
+                ({"function": name, "caller": caller}, entry)
+                for (name, caller), entry in self._callers.items()
+            ]
+        else:
+            raise ValueError(f"Statistics can be aggregated by 'function' or 'caller', not {by}.")
+        stats = [dict(key, calls=entry[0], time=entry[1], bytes=entry[2]) for key, entry in items]
+        stats.sort(key=lambda stat: stat["time"], reverse=True)
+        return stats
+
+    def to_json(self, path=None):
+        """Export the profile in JSON.
+
+        Parameters
+        ----------
+        path : str or os.PathLike, optional
+            File to write the profile to.
+
+        Returns
+        -------
+        json_profile : str
+        """
+        json_profile = json.dumps(
+            {
+                "elapsed": self.elapsed,
+                "calls": self.n_calls,
+                "functions": self.stats("function"),
+                "callers": self.stats("caller"),
+            },
+            indent=2,
+        )
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(json_profile)
+        return json_profile
+
+    def to_folded(self, path=None, metric="time"):
+        """Export the profile as folded stacks, the input format of flame graph tools
+        such as ``flamegraph.pl`` or speedscope.
+
+        Each line holds the Python frames calling an API function, separated by ``;``,
+        followed by the metric.
+
+        Parameters
+        ----------
+        path : str or os.PathLike, optional
+            File to write the folded stacks to.
+        metric : str, optional
+            ``"time"`` for the time in microseconds, ``"calls"`` for the number of calls
+            or ``"bytes"`` for the bytes moved. The default is ``"time"``.
+
+        Returns
+        -------
+        folded_stacks : str
+        """
+        metrics = {"calls": 0, "time": 1, "bytes": 2}
+        if metric not in metrics:
+            raise ValueError(f"metric must be one of {list(metrics)}, not {metric}.")
+        lines = []
+        for stack, entry in self._stacks.items():
+            value = entry[metrics[metric]]
+            if metric == "time":
+                value = int(value * 1e6)
+            lines.append(f"{stack} {value}")
+        folded_stacks = "\n".join(lines) + "\n"
+        if path is not None:
+            with open(path, "w") as file:
+                file.write(folded_stacks)
+        return folded_stacks
+
+    def __str__(self):
+        lines = [
+            f"DPF client profile: {self.n_calls} API calls in {self.elapsed:.3f} s",
+            f"{'calls':>10} {'time (s)':>10} {'bytes':>12}  function",
+        ]
+        for stat in self.stats()[:20]:
+            lines.append(
+                f"{stat['calls']:>10} {stat['time']:>10.4f} {stat['bytes']:>12}  {stat['function']}"
+            )
+        return "\n".join(lines)
+
+
+def profile():
+    """Profile the requests sent to the DPF servers, to use in a ``with`` statement.
+
+    Returns
+    -------
+    profile : Profile
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> with dpf.profile() as profile:
+    ...     field = dpf.fields_factory.create_3d_vector_field(10)
+    >>> print(profile)  # doctest: +SKIP
+
+    """
+    return Profile()
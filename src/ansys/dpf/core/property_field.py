@@ -256,10 +256,8 @@ class PropertyField(_FieldBase):
                     f"shape {data.shape} was input"
                 )
 
-            if data.dtype != np.int32:
-                copy = np.empty_like(data, shape=data.shape, dtype=np.int32)
-                copy[:] = data
-                data = copy
+            # the buffer is passed as is when it is already C-contiguous int32
+            data = np.ascontiguousarray(data, dtype=np.int32)
         return self._api.csproperty_field_set_data(self, _get_size_of_list(data), data)
 
     def as_local_field(self):
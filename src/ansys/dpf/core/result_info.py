@@ -55,6 +55,18 @@ class analysis_types(Enum):
     unknown_analysis = 9
 
 
+def _default_location(name):
+    if name in available_result._result_properties:
+        return available_result._result_properties[name]["location"]
+    return ""
+
+
+def _default_scripting_name(name, physic_name):
+    if name in available_result._result_properties:
+        return available_result._result_properties[name]["scripting_name"]
+    return available_result._remove_spaces(physic_name)
+
+
 class ResultInfo:
     """Represents the result information.
 
@@ -110,6 +122,17 @@ class ResultInfo:
         elif result_info is None:
             raise Exception("Result_info given is None")
 
+        # the result info is read-only: the properties and available results are
+        # only requested once from the server
+        self._snapshot = {}
+
+    def _cached(self, key, getter, *args):
+        try:
+            return self._snapshot[key]
+        except KeyError:
+            value = self._snapshot[key] = getter(*args)
+            return value
+
     def __str__(self):
         try:
             txt = (
@@ -134,7 +157,7 @@ class ResultInfo:
 
     @property
     def _names(self):
-        return [item.name for item in self.available_results]
+        return [item.name for item in self._available_results]
 
     def __contains__(self, value):
         return value in self._names
@@ -159,7 +182,7 @@ class ResultInfo:
         'static'
 
         """
-        return self._api.result_info_get_analysis_type_name(self)
+        return self._cached("analysis_type", self._api.result_info_get_analysis_type_name, self)
 
     @property
     def physics_type(self):
@@ -187,17 +210,17 @@ class ResultInfo:
         physics_type : str
             Type of the physics, such as mechanical or electric.
         """
-        return self._api.result_info_get_physics_type_name(self)
+        return self._cached("physics_type", self._api.result_info_get_physics_type_name, self)
 
     @property
     def n_results(self):
         """Number of results."""
-        return self._api.result_info_get_number_of_results(self)
+        return self._cached("n_results", self._api.result_info_get_number_of_results, self)
 
     @property
     def unit_system(self):
         """Unit system of the result."""
-        return self._api.result_info_get_unit_system_name(self)
+        return self._cached("unit_system", self._api.result_info_get_unit_system_name, self)
 
     @property
     def cyclic_symmetry_type(self):
@@ -209,7 +232,9 @@ class ResultInfo:
             Cyclic symmetry type of the results. Options are ``"single_stage"``,
             ``"multi_stage"``, and ``"not_cyclic"``.
         """
-        return self._api.result_info_get_cyclic_symmetry_type(self)
+        return self._cached(
+            "cyclic_symmetry_type", self._api.result_info_get_cyclic_symmetry_type, self
+        )
 
     @property
     def has_cyclic(self):
@@ -220,7 +245,7 @@ class ResultInfo:
         has_cyclic : bool
             Returns ``True`` if the result file has cyclic symmetry or is multistage.
         """
-        return self._api.result_info_has_cyclic_symmetry(self)
+        return self._cached("has_cyclic", self._api.result_info_has_cyclic_symmetry, self)
 
     @property
     def cyclic_support(self):
@@ -242,58 +267,61 @@ class ResultInfo:
         >>> cyc_support = result_info.cyclic_support
 
         """
-        if self._api.result_info_has_cyclic_symmetry(self):
+        if self.has_cyclic:
             cyclic_support = self._api.result_info_get_cyclic_support(self)
             return CyclicSupport(cyclic_support=cyclic_support, server=self._server)
 
     @property
     def unit_system_name(self):
         """Name of the unit system."""
-        return self._api.result_info_get_unit_system_name(self)
+        return self._cached("unit_system", self._api.result_info_get_unit_system_name, self)
 
     @property
     def solver_version(self):
         """Version of the solver."""
+        return self._cached("solver_version", self._get_solver_version)
+
+    def _get_solver_version(self):
         major = integral_types.MutableInt32()
         minor = integral_types.MutableInt32()
-        res = self._api.result_info_get_solver_version(self, major, minor)
+        self._api.result_info_get_solver_version(self, major, minor)
         return str(int(major)) + "." + str(int(minor))
 
     @property
     def solver_date(self):
         """Date of the solver."""
-        date = integral_types.MutableInt32()
-        time = integral_types.MutableInt32()
-        self._api.result_info_get_solve_date_and_time(self, date, time)
-        return int(date)
+        return self._cached("solve_date_and_time", self._get_solve_date_and_time)[0]
 
     @property
     def solver_time(self):
         """Time of the solver."""
+        return self._cached("solve_date_and_time", self._get_solve_date_and_time)[1]
+
+    def _get_solve_date_and_time(self):
         date = integral_types.MutableInt32()
         time = integral_types.MutableInt32()
         self._api.result_info_get_solve_date_and_time(self, date, time)
-        return int(time)
+        return int(date), int(time)
 
     @property
     def user_name(self):
         """Name of the user."""
-        return self._api.result_info_get_user_name(self)
+        return self._cached("user_name", self._api.result_info_get_user_name, self)
 
     @property
     def job_name(self):
         """Name of the job."""
-        return self._api.result_info_get_job_name(self)
+        return self._cached("job_name", self._api.result_info_get_job_name, self)
 
     @property
     def product_name(self):
         """Name of the product."""
-        return self._api.result_info_get_product_name(self)
+        return self._cached("product_name", self._api.result_info_get_product_name, self)
 
     @property
     def main_title(self):
         """Main title."""
-        return self._api.result_info_get_main_title(self)
+        return self._cached("main_title", self._api.result_info_get_main_title, self)
 
     @property
     def available_results(self):
@@ -304,10 +332,17 @@ class ResultInfo:
         -------
         available_result : list[AvailableResult]
         """
-        out = []
-        for i in range(len(self)):
-            out.append(self._get_result(i))
-        return out
+        return list(self._available_results)
+
+    @property
+    def _available_results(self):
+        return self._cached("available_results", self._load_available_results)
+
+    def _load_available_results(self):
+        if hasattr(self._api, "list_result"):
+            # a single request per result with the gRPC API
+            return tuple(self._load_listed_result(i) for i in range(len(self)))
+        return tuple(self._load_result(i) for i in range(len(self)))
 
     @property
     def _data_processing_core_api(self):
@@ -333,7 +368,40 @@ class ResultInfo:
             raise IndexError("There are only %d results" % len(self))
         elif numres < 0:
             raise IndexError("Result index must be greater than 0")
+        return self._available_results[numres]
 
+    def _load_listed_result(self, numres):
+        res = self._api.list_result(self, numres)
+        name = res.name
+        if "location" in res.properties:
+            loc_name = res.properties["location"]
+        else:
+            loc_name = _default_location(name)
+        if "scripting_name" in res.properties:
+            scripting_name = res.properties["scripting_name"]
+        else:
+            scripting_name = _default_scripting_name(name, res.physicsname)
+        sub_res = {sub.name: [sub.op_name, sub.description] for sub in res.sub_res}
+        qualifiers = []
+        if self._server.meet_version("5.0"):
+            qualifiers = [
+                LabelSpace(label_space=label_space, obj=self, server=self._server)
+                for label_space in res.qualifiers
+            ]
+        availableresult = SimpleNamespace(
+            name=name,
+            physicsname=res.physicsname,
+            ncomp=res.ncomp,
+            dimensionality=res.dimensionality,
+            homogeneity=res.homogeneity,
+            unit=res.unit,
+            sub_res=sub_res,
+            properties={"loc_name": loc_name, "scripting_name": scripting_name},
+            qualifiers=qualifiers,
+        )
+        return available_result.AvailableResult(availableresult)
+
+    def _load_result(self, numres):
         name = self._api.result_info_get_result_name(self, numres)
         physic_name = self._api.result_info_get_result_physics_name(self, numres)
         dimensionality = self._api.result_info_get_result_dimensionality_nature(self, numres)
@@ -345,17 +413,11 @@ class ResultInfo:
             self._api.result_info_get_result_location(self, numres, loc_name)
             loc_name = str(loc_name)
         except AttributeError:
-            if name in available_result._result_properties:
-                loc_name = available_result._result_properties[name]["location"]
-            else:
-                loc_name = ""
+            loc_name = _default_location(name)
         try:
             scripting_name = self._api.result_info_get_result_scripting_name(self, numres)
         except AttributeError:
-            if name in available_result._result_properties:
-                scripting_name = available_result._result_properties[name]["scripting_name"]
-            else:
-                scripting_name = available_result._remove_spaces(physic_name)
+            scripting_name = _default_scripting_name(name, physic_name)
         num_sub_res = self._api.result_info_get_number_of_sub_results(self, numres)
         sub_res = {}
         for ires in range(num_sub_res):
@@ -448,8 +510,7 @@ class ResultInfo:
             return 0
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        return iter(self._available_results)
 
     def __getitem__(self, key):
         if isinstance(key, int):
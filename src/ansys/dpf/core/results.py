@@ -5,17 +5,62 @@ Results
 ========
 This module contains the Results and Result classes that are created by the model
 to easily access results in result files."""
-import functools
-
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core.common import types
+from ansys.dpf.core.operator_specification import (
+    _get_available_operator_names,
+    _get_specification,
+)
 from ansys.dpf.core.scoping import Scoping
+from ansys.dpf.core.server_types import LegacyGrpcServer
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
     BodyFieldsContainer,
 )
 
 
+def _result_doc(result_info, server):
+    """Documentation of the result provider of an available result, read from its
+    generated operator class or from its cached specification."""
+    from ansys.dpf.core import operators
+
+    op_class = getattr(getattr(operators, "result", None), result_info.name, None)
+    if op_class is not None and op_class.__doc__:
+        return op_class.__doc__
+    try:
+        return _get_specification(result_info.operator_name, server=server).description
+    except errors.DPFServerException:
+        return ""
+
+
+class _ResultDoc:
+    """Documentation of the result provider, only computed when it is read."""
+
+    def __init__(self, doc=None):
+        self._doc = doc
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self._doc
+        return _result_doc(instance._result_info, instance._server)
+
+
+class _ResultAccessor:
+    # attribute of ``Results`` creating a ``Result`` when it is read, documented
+    # with its result provider
+    __doc__ = _ResultDoc()
+
+    def __init__(self, result_info, server):
+        self._result_info = result_info
+        self._server = server
+
+    def __get__(self, results, owner=None):
+        if results is None:
+            return self
+        return results.__result__(self._result_info)
+
+
 class Results:
     """Organizes the results from DPF into accessible methods.
 
@@ -124,34 +169,36 @@ class Results:
         """
         if result_info is None:
             return
-        # dynamically add function based on input type
+        # list the available operators at once instead of creating an operator
+        # per result, the result providers are only created when used
+        available_names = _get_available_operator_names(self._server)
         self._op_map_rev = {}
         for result_type in result_info:
-            try:
-                doc = Operator(result_type.operator_name, server=self._server).__str__()
-                bound_method = self.__result__
-                method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
-
-                self._op_map_rev[result_type.name] = result_type.name
-            except errors.DPFServerException:
-                pass
-            except Exception as e:
-                print(result_type.name)
-                raise e
+            if available_names is None:
+                # the server cannot list its operators, query the specification of
+                # the result provider instead, which is kept for its documentation
+                try:
+                    _get_specification(result_type.operator_name, self._server)
+                except errors.DPFServerException:
+                    continue
+            elif result_type.operator_name not in available_names:
+                continue
+            accessor = _ResultAccessor(result_type, self._server)
+            setattr(self.__class__, result_type.name, accessor)
+            self._op_map_rev[result_type.name] = result_type.name
 
     def __str__(self):
         return self._str
 
     def __iter__(self):
         for key in self._op_map_rev:
-            yield self.__class__.__dict__[key].fget()
+            yield getattr(self, key)
 
     def __getitem__(self, val):
         n = 0
         for key in self._op_map_rev:
             if n == val:
-                return self.__class__.__dict__[key].fget()
+                return getattr(self, key)
             n += 1
 
     def __len__(self):
@@ -192,6 +239,9 @@ class Result:
 
     """
 
+    # the documentation of the instances is the one of their result provider
+    __doc__ = _ResultDoc(__doc__)
+
     def __init__(self, connector, mesh_by_default, result_info, server):
         self._server = server
         self._connector = connector
@@ -206,29 +256,32 @@ class Result:
         else:
             self._result_info = result_info
         self._specific_fc_type = None
+        self._operator_instance = None
+
+    @property
+    def _operator(self):
+        """Result provider, created on first use."""
+        if self._operator_instance is None:
+            op = self._create_operator()
+            op._add_sub_res_operators(self._result_info.sub_results)
+            self._operator_instance = op
+        return self._operator_instance
+
+    def _create_operator(self):
+        """Create the result provider, connected to the streams and mesh of the model."""
         from ansys.dpf.core import operators
 
-        try:
-            # create the operator to read its documentation
-            # if the operator doesn't exist, the method will not be added
-            doc = Operator(self._result_info.operator_name, server=self._server).__str__()
-            self.__doc__ = doc
-            if hasattr(operators, "result") and hasattr(operators.result, self._result_info.name):
-                self._operator = getattr(operators.result, self._result_info.name)(
-                    server=self._server
-                )
-            else:
-                self._operator = Operator(self._result_info.operator_name, server=self._server)
-            self._connector.__connect_op__(self._operator, self._mesh_by_default)
-            self._operator._add_sub_res_operators(self._result_info.sub_results)
-        except errors.DPFServerException:
-            pass
-        except Exception as e:
-            print(self._result_info.name)
-            raise e
+        if hasattr(operators, "result") and hasattr(operators.result, self._result_info.name):
+            op = getattr(operators.result, self._result_info.name)(server=self._server)
+        else:
+            op = Operator(self._result_info.operator_name, server=self._server)
+        self._connector.__connect_op__(op, self._mesh_by_default)
+        return op
 
     def __call__(self, time_scoping=None, mesh_scoping=None):
-        op = self._operator
+        return self._connect_inputs(self._operator, time_scoping, mesh_scoping)
+
+    def _connect_inputs(self, op, time_scoping=None, mesh_scoping=None):
         if time_scoping:
             op.inputs.time_scoping(time_scoping)
         elif self._time_scoping:
@@ -263,13 +316,96 @@ class Result:
         >>> fc = disp.on_all_time_freqs.eval()
 
         """
-        fc = self.__call__().outputs.fields_container()
+        return self._as_specific_fields_container(self.__call__().outputs.fields_container())
+
+    def _as_specific_fields_container(self, fc):
         if self._specific_fc_type == "shape":
             fc = ElShapeFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
         elif self._specific_fc_type == "body":
             fc = BodyFieldsContainer(fields_container=fc._get_ownership(), server=fc._server)
         return fc
 
+    def _time_scoping_chunks(self, chunk_size):
+        time_scoping = self._time_scoping
+        if time_scoping is None:
+            n_sets = len(self._connector.time_freq_support.time_frequencies)
+            time_scoping = list(range(1, n_sets + 1))
+        elif isinstance(time_scoping, (int, float)):
+            time_scoping = [time_scoping]
+        if isinstance(time_scoping, Scoping):
+            ids = time_scoping.ids.tolist()
+            return [
+                Scoping(
+                    ids=ids[start : start + chunk_size],
+                    location=time_scoping.location,
+                    server=self._server,
+                )
+                for start in range(0, len(ids), chunk_size)
+            ]
+        time_scoping = list(time_scoping)
+        return [
+            time_scoping[start : start + chunk_size]
+            for start in range(0, len(time_scoping), chunk_size)
+        ]
+
+    def iter_chunks(self, chunk_size=50, prefetch=True):
+        """Evaluate the result provider by chunks of time or frequency sets.
+
+        Only one chunk is held at a time, plus the next one while it is prefetched,
+        so that results with many time steps can be processed with bounded memory.
+        The time scoping is the one previously specified, or all the time
+        frequencies by default. Each chunk is evaluated by a new result provider
+        connected to the model's cached streams and mesh, with the other inputs
+        previously specified.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            Number of time or frequency sets per chunk. The default is ``50``.
+        prefetch : bool, optional
+            Whether to evaluate the next chunk on the server's executor while the
+            current one is processed. The default is ``True``. Only a
+            ``LegacyGrpcServer``, which is thread safe, prefetches the chunks.
+
+        Yields
+        ------
+        fields_container : FieldsContainer, ElShapeFieldsContainer, BodyFieldsContainer
+            Result on the time or frequency sets of each chunk.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> from ansys.dpf.core import examples
+        >>> model = dpf.Model(examples.find_msup_transient())
+        >>> stress = model.results.stress
+        >>> for fc in stress.iter_chunks(chunk_size=8):
+        ...     print(len(fc))
+        8
+        8
+        4
+
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a strictly positive integer.")
+        chunks = self._time_scoping_chunks(chunk_size)
+
+        def connect(time_scoping):
+            return self._connect_inputs(self._create_operator(), time_scoping=time_scoping)
+
+        def evaluate_async(time_scoping):
+            return connect(time_scoping).get_output_async(0, types.fields_container)
+
+        if not prefetch or not isinstance(self._server, LegacyGrpcServer):
+            for chunk in chunks:
+                fc = connect(chunk).get_output(0, types.fields_container)
+                yield self._as_specific_fields_container(fc)
+            return
+        future = evaluate_async(chunks[0]) if chunks else None
+        for index in range(len(chunks)):
+            fc = future.result()
+            future = evaluate_async(chunks[index + 1]) if index + 1 < len(chunks) else None
+            yield self._as_specific_fields_container(fc)
+
     @property
     def on_all_time_freqs(self):
         """Sets the time scoping to all the time frequencies of the time frequency support.
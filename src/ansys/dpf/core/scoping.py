@@ -16,6 +16,8 @@ from ansys.dpf.core.common import locations
 from ansys.dpf.core import server as server_module
 from ansys.dpf.core import server_types
 from ansys.dpf.core.cache import _setter
+from ansys.dpf.core._growable_array import _GrowableArray
+from ansys.dpf.core._id_index import _IdIndex
 from ansys.dpf.gate import (
     scoping_capi,
     scoping_grpcapi,
@@ -142,6 +144,8 @@ class Scoping:
         -----
         Print a progress bar.
         """
+        # the APIs read the IDs as a buffer of int32, converted once here
+        ids = np.ascontiguousarray(ids, dtype=np.int32).reshape(-1)
         if isinstance(self._server, server_types.InProcessServer):
             self._api.scoping_resize(self, len(ids))
             ids_ptr = self._api.scoping_get_ids(self, len(ids))
@@ -150,6 +154,9 @@ class Scoping:
                 utils.to_int32_ptr(ids),
                 len(ids) * ctypes.sizeof(ctypes.c_int32()),
             )
+        elif isinstance(self._server, server_types.LegacyGrpcServer):
+            # numpy arrays are converted to lists before being streamed, buffers are not
+            self._api.scoping_set_ids(self, memoryview(ids), len(ids))
         else:
             self._api.scoping_set_ids(self, ids, len(ids))
 
@@ -411,12 +418,15 @@ class _LocalScoping(Scoping):
         self.__cache_data__(scoping)
 
     def __cache_data__(self, owner_scoping):
-        self._scoping_ids_copy = owner_scoping._get_ids(False)
+        self._scoping_ids_copy = _GrowableArray(owner_scoping._get_ids(True), dtype=np.int32)
         self._location = owner_scoping.location
         self.__init_map__()
 
     def __init_map__(self):
-        self._mapper = dict(zip(self._scoping_ids_copy, np.arange(self._count())))
+        # the vectorized ID index is built lazily on the first lookup, the IDs appended
+        # after that are looked up in a dictionary until the index is rebuilt
+        self._id_index = None
+        self._appended_ids = {}
 
     def _count(self):
         """
@@ -461,13 +471,7 @@ class _LocalScoping(Scoping):
         -----
         Print a progress bar.
         """
-        # must convert to a list for gRPC
-        if isinstance(ids, range):
-            ids = list(ids)
-        elif isinstance(ids, (np.ndarray, np.generic)):
-            ids = ids.tolist()
-
-        self._scoping_ids_copy = ids
+        self._scoping_ids_copy.assign(ids)
         self.__init_map__()
 
     def _get_ids(self, np_array=False):
@@ -482,9 +486,9 @@ class _LocalScoping(Scoping):
         Print a progress bar.
         """
         if np_array:
-            return np.ndarray(self._scoping_ids_copy, dtype=np.int32)
+            return self._scoping_ids_copy.view
         else:
-            return self._scoping_ids_copy
+            return self._scoping_ids_copy.tolist()
 
     @_setter
     def set_id(self, index, scopingid):
@@ -497,17 +501,18 @@ class _LocalScoping(Scoping):
         scopingid : int
             ID of the scoping.
         """
-        init_size = self._count()
-        if init_size <= index:
-            for i in range(init_size, index + 1):
-                self._scoping_ids_copy.append(-1)
-        self._scoping_ids_copy[index] = scopingid
-        self._mapper[scopingid] = index
+        if self._count() <= index:
+            self._scoping_ids_copy.resize(index + 1, fill_value=-1)
+        self._scoping_ids_copy.view[index] = scopingid
+        self.__init_map__()
 
     @_setter
     def append(self, id):
         self._scoping_ids_copy.append(id)
-        self._mapper[id] = len(self) - 1
+        if self._id_index is not None:
+            self._appended_ids[id] = len(self) - 1
+            if len(self._appended_ids) > len(self._id_index):
+                self.__init_map__()
 
     def _get_id(self, index):
         """Retrieve the index that the scoping ID is located on.
@@ -522,7 +527,7 @@ class _LocalScoping(Scoping):
         id : int
             ID of the scoping's index.
         """
-        return self._scoping_ids_copy[index]
+        return int(self._scoping_ids_copy.view[index])
 
     def _get_index(self, scopingid):
         """Retrieve an ID corresponding to an ID in the scoping.
@@ -535,14 +540,19 @@ class _LocalScoping(Scoping):
         Returns
         -------
         index : int
-            Index of the ID.
+            Index of the ID, ``-1`` if the ID is not in the scoping.
         """
-        return self._mapper[scopingid]
+        index = self._appended_ids.get(scopingid)
+        if index is not None:
+            return index
+        if self._id_index is None:
+            self._id_index = _IdIndex(self._scoping_ids_copy.view)
+        return self._id_index.index(scopingid)
 
     def release_data(self):
         """Release the data."""
         if hasattr(self, "_is_set") and self._is_set:
-            super()._set_ids(self._scoping_ids_copy)
+            super()._set_ids(self._scoping_ids_copy.view)
             super()._set_location(self._location)
 
     def __enter__(self):
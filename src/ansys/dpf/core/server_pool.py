@@ -0,0 +1,609 @@
+"""
+ServerPool
+==========
+Contains the pool of servers used to run a workflow on several result files in parallel,
+and the pool of servers started in advance to be handed out to successive jobs.
+"""
+import contextlib
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ansys import dpf
+from ansys.dpf.core import server as server_module
+from ansys.dpf.core.common import types
+from ansys.dpf.core.data_sources import DataSources
+from ansys.dpf.core.fields_container import FieldsContainer
+from ansys.dpf.core.server_factory import AvailableServerConfigs
+from ansys.dpf.core.server_types import DPF_DEFAULT_PORT, LOCALHOST, LegacyGrpcServer
+
+
+def _is_alive(server):
+    try:
+        server.info
+        return True
+    except Exception:
+        return False
+
+
+def _free_ports(n_ports, reserved=()):
+    used_ports = [
+        srv().port for srv in dpf.core._server_instances if srv() and hasattr(srv(), "port")
+    ]
+    ports = []
+    port = DPF_DEFAULT_PORT
+    while len(ports) < n_ports:
+        if port not in used_ports and port not in reserved and not server_module.port_in_use(port):
+            ports.append(port)
+        port += 1
+    return ports
+
+
+def _starts_in_parallel(config):
+    # only the servers using the Python gRPC stubs can be started and used from
+    # several threads at once
+    return config.legacy
+
+
+def _shutdown(server):
+    try:
+        server.shutdown()
+    except Exception:
+        pass
+
+
+class ServerPool:
+    """Pool of DPF servers running copies of a workflow in parallel.
+
+    The pool starts local gRPC servers with :func:`start_local_server
+    <ansys.dpf.core.server.start_local_server>`, or reuses servers given at
+    creation, for example with :func:`connect_to_server
+    <ansys.dpf.core.server.connect_to_server>`. The servers are checked before
+    each use and the ones which stopped answering are replaced.
+    The servers started by the pool are shut down by :func:`shutdown` or
+    when leaving a ``with`` statement.
+
+    Parameters
+    ----------
+    n_servers : int, optional
+        Number of servers of the pool. The default is the number of CPUs, or the
+        number of ``servers`` given.
+    servers : list[BaseServer], optional
+        Running servers to add to the pool, which are not shut down by the pool.
+    ansys_path : str or os.PathLike, optional
+        Root path for the Ansys installation directory of the servers started by the pool.
+    config : ServerConfig, optional
+        Type of the servers started by the pool. It must be a gRPC configuration.
+        The default is ``AvailableServerConfigs.GrpcServer``. Only the servers of
+        the thread-safe ``AvailableServerConfigs.LegacyGrpcServer`` configuration
+        are started in parallel, the others are started one after another.
+    ip : str, optional
+        IP address of the servers started by the pool. The default is ``"LOCALHOST"``.
+    timeout : float, optional
+        Maximum number of seconds to start each server. The default is ``20``.
+    context : ServerContext, optional
+        Settings used to load DPF's plugins on the servers started by the pool.
+
+    Examples
+    --------
+    Compute the displacement of several result files on four servers.
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> disp_op = dpf.operators.result.displacement()
+    >>> workflow = dpf.Workflow()
+    >>> workflow.add_operator(disp_op)
+    >>> workflow.set_input_name("data_sources", disp_op.inputs.data_sources)
+    >>> workflow.set_output_name("displacement", disp_op.outputs.fields_container)
+    >>> files = [examples.find_static_rst(), examples.find_msup_transient()]
+    >>> #with dpf.ServerPool(n_servers=4) as pool:
+    >>> #    displacements = pool.map(workflow, files, label="file")
+
+    """
+
+    def __init__(
+        self,
+        n_servers=None,
+        servers=None,
+        ansys_path=None,
+        config=None,
+        ip=LOCALHOST,
+        timeout=20.0,
+        context=None,
+    ):
+        self._owned_servers = []
+        self._external_servers = list(servers) if servers else []
+        if n_servers is None:
+            n_servers = len(self._external_servers) or os.cpu_count() or 1
+        self._n_servers = n_servers
+        self._start_kwargs = dict(
+            ansys_path=ansys_path,
+            ip=ip,
+            as_global=False,
+            config=config if config is not None else AvailableServerConfigs.GrpcServer,
+            timeout=timeout,
+            context=context,
+        )
+        self.start()
+
+    @property
+    def servers(self):
+        """Servers of the pool.
+
+        Returns
+        -------
+        servers : list[BaseServer]
+        """
+        return self._external_servers + self._owned_servers
+
+    def __len__(self):
+        return len(self.servers)
+
+    def start(self):
+        """Start servers until the pool has ``n_servers`` servers."""
+        n_missing = self._n_servers - len(self)
+        if n_missing <= 0:
+            return
+
+        def start_server(port):
+            return server_module.start_local_server(port=port, **self._start_kwargs)
+
+        ports = _free_ports(n_missing)
+        if not _starts_in_parallel(self._start_kwargs["config"]):
+            for port in ports:
+                self._owned_servers.append(start_server(port))
+            return
+        # the first server loads the client libraries, which is not thread safe
+        self._owned_servers.append(start_server(ports[0]))
+        if n_missing > 1:
+            with ThreadPoolExecutor(max_workers=n_missing - 1) as executor:
+                self._owned_servers.extend(executor.map(start_server, ports[1:]))
+
+    def check_health(self):
+        """Remove the servers which stopped answering and replace them.
+
+        Returns
+        -------
+        n_servers : int
+            Number of servers in the pool.
+        """
+        self._external_servers = [srv for srv in self._external_servers if _is_alive(srv)]
+        alive_servers = []
+        for srv in self._owned_servers:
+            if _is_alive(srv):
+                alive_servers.append(srv)
+            else:
+                _shutdown(srv)
+        self._owned_servers = alive_servers
+        self.start()
+        return len(self)
+
+    def shutdown(self):
+        """Shut down the servers started by the pool."""
+        for srv in self._owned_servers:
+            _shutdown(srv)
+        self._owned_servers = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def __del__(self):
+        self.shutdown()
+
+    @staticmethod
+    def _data_sources_on_server(data_sources, server):
+        if not isinstance(data_sources, DataSources):
+            return DataSources(data_sources, server=server)
+        if data_sources._server == server:
+            return data_sources
+        if not data_sources._paths_only:
+            raise ValueError(
+                "Data sources with upstreams, domains, files added for a specified result "
+                "or created on the server cannot be copied to the servers of the pool, "
+                "create them on each server instead."
+            )
+        copy = DataSources(server=server)
+        result_key = data_sources.result_key
+        result_file_set = False
+        for key, path in data_sources._paths_by_key():
+            if key == result_key and not result_file_set:
+                copy.set_result_file_path(path, key)
+                result_file_set = True
+            else:
+                copy.add_file_path(path, key)
+        return copy
+
+    def map(
+        self,
+        workflow,
+        data_sources_list,
+        input_name="data_sources",
+        output_name=None,
+        label=None,
+        server=None,
+    ):
+        """Run a workflow on each data sources of a list, in parallel on the servers of the pool.
+
+        The workflow is copied on each server with
+        :func:`Workflow.create_on_other_server
+        <ansys.dpf.core.workflow.Workflow.create_on_other_server>`, and each
+        copy evaluates the data sources one after another. The servers are only
+        used in parallel when they all are ``LegacyGrpcServer``, as well as the
+        server gathering the results, which are thread safe. The result files must
+        be reachable by the servers, see :func:`upload_file_in_tmp_folder
+        <ansys.dpf.core.core.upload_file_in_tmp_folder>` for remote servers.
+
+        Parameters
+        ----------
+        workflow : Workflow
+            Workflow with an input receiving the data sources and a
+            ``FieldsContainer`` output.
+        data_sources_list : list[str, os.PathLike, DataSources]
+            Paths of the result files or data sources to run the workflow on.
+        input_name : str, optional
+            Name of the workflow input receiving the data sources.
+            The default is ``"data_sources"``.
+        output_name : str, optional
+            Name of the workflow output to gather. The default is the only output
+            of the workflow.
+        label : str, optional
+            When given, the fields of all the results are gathered in a
+            ``FieldsContainer`` with this additional label, whose value is the index
+            of the data sources in ``data_sources_list``. By default, the results
+            are merged with the ``merge_fields_containers`` operator, which suits
+            the domains of a distributed result.
+        server : BaseServer, optional
+            Server on which the results are gathered. The default is the global server.
+
+        Returns
+        -------
+        fields_container : FieldsContainer
+        """
+        if output_name is None:
+            if len(workflow.output_names) != 1:
+                raise ValueError(
+                    "output_name is required for a workflow with several outputs "
+                    f"({workflow.output_names})."
+                )
+            output_name = workflow.output_names[0]
+        self.check_health()
+        if not len(self):
+            raise ValueError("The pool has no server.")
+
+        servers = self.servers
+        free_servers = queue.Queue()
+        for index in range(len(servers)):
+            free_servers.put(index)
+        workflow_copies = [None] * len(servers)
+        server = server_module.get_or_create_server(server)
+
+        def run(data_sources):
+            index = free_servers.get()
+            try:
+                # only the thread holding a server uses its copy of the workflow
+                if workflow_copies[index] is None:
+                    workflow_copies[index] = workflow.create_on_other_server(server=servers[index])
+                copy = workflow_copies[index]
+                copy.connect(input_name, self._data_sources_on_server(data_sources, servers[index]))
+                result = copy.get_output(output_name, types.fields_container)
+                # copied while the server is held, no other thread uses it
+                return result.deep_copy(server=server)
+            finally:
+                free_servers.put(index)
+
+        # the servers given to the pool may be of any type: only the thread safe
+        # LegacyGrpcServers, gathering server included, are used from several threads
+        if all(isinstance(srv, LegacyGrpcServer) for srv in servers + [server]):
+            with ThreadPoolExecutor(max_workers=len(servers)) as executor:
+                futures = [executor.submit(run, ds) for ds in data_sources_list]
+                results = [future.result() for future in futures]
+        else:
+            results = [run(data_sources) for data_sources in data_sources_list]
+
+        if not results:
+            return FieldsContainer(server=server)
+        if label is None:
+            merge = dpf.core.operators.utility.merge_fields_containers(server=server)
+            for pin, result in enumerate(results):
+                merge.connect(pin, result)
+            return merge.outputs.merged_fields_container()
+
+        gathered = FieldsContainer(server=server)
+        labels = []
+        for result in results:
+            labels += [name for name in result.labels if name not in labels]
+        gathered.labels = labels + [label]
+        for index, result in enumerate(results):
+            for label_space, field in zip(result.get_label_spaces(), result):
+                gathered.add_field({**label_space, label: index}, field)
+        return gathered
+
+
+class WarmServerPool:
+    """Pool of local servers started in advance and handed out to successive jobs.
+
+    Starting a server launches the DPF executable, waits for its connection and
+    loads its plugins, which takes several seconds. The pool keeps ``size``
+    servers started, with their plugins loaded and their context applied, and
+    hands them out one at a time with :func:`server`. A returned server is handed
+    out again, until it was used ``max_uses`` times or stopped answering: it is
+    then shut down and a new server is started. Only the servers of the
+    thread-safe ``AvailableServerConfigs.LegacyGrpcServer`` configuration are
+    started in the background. With the other configurations, only the first
+    server is started on creation, and the missing servers are started one at a
+    time by :func:`release`, once the server is given back, or by :func:`acquire`
+    when no server is ready.
+    The servers are shut down by :func:`shutdown` or when leaving a ``with`` statement.
+
+    Parameters
+    ----------
+    size : int, optional
+        Number of servers kept started. The default is ``2``.
+    max_uses : int, optional
+        Number of jobs a server is handed out to before being restarted.
+        The default is ``None``, in which case the servers are only restarted
+        when they stop answering.
+    ansys_path : str or os.PathLike, optional
+        Root path for the Ansys installation directory of the servers.
+    config : ServerConfig, optional
+        Type of the servers. It must be a gRPC configuration.
+        The default is ``AvailableServerConfigs.GrpcServer``.
+    ip : str, optional
+        IP address of the servers. The default is ``"LOCALHOST"``.
+    timeout : float, optional
+        Maximum number of seconds to start each server. The default is ``20``.
+    context : ServerContext, optional
+        Settings used to load DPF's plugins on the servers.
+
+    Examples
+    --------
+    Run each job on a server started in advance.
+
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> #with dpf.WarmServerPool(size=2, max_uses=10) as pool:
+    >>> #    for path in [examples.find_static_rst(), examples.find_msup_transient()]:
+    >>> #        with pool.server() as server:
+    >>> #            model = dpf.Model(path, server=server)
+    >>> #            displacement = model.results.displacement().eval()
+
+    """
+
+    def __init__(
+        self,
+        size=2,
+        max_uses=None,
+        ansys_path=None,
+        config=None,
+        ip=LOCALHOST,
+        timeout=20.0,
+        context=None,
+    ):
+        if size < 1:
+            raise ValueError(f"size must be at least 1, not {size}.")
+        self._size = size
+        self._max_uses = max_uses
+        self._start_kwargs = dict(
+            ansys_path=ansys_path,
+            ip=ip,
+            as_global=False,
+            config=config if config is not None else AvailableServerConfigs.GrpcServer,
+            timeout=timeout,
+            context=context,
+        )
+        self._closed = False
+        self._lock = threading.Lock()
+        self._reserved_ports = set()
+        # [server, number of uses] ready to be handed out, or the error of a failed start
+        self._ready = queue.Queue()
+        self._in_use = []
+        # number of servers to start by release or acquire, without background starts
+        self._n_missing = 0
+        if _starts_in_parallel(self._start_kwargs["config"]):
+            self._executor = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="dpf-warm-pool"
+            )
+            self._start_lock = contextlib.nullcontext()
+        else:
+            self._executor = None
+            self._start_lock = threading.Lock()
+        # the first server loads the client libraries, which is not thread safe
+        self._ready.put(self._start_server())
+        for _ in range(size - 1):
+            self._schedule_refill()
+
+    @property
+    def size(self):
+        """Number of servers kept started.
+
+        Returns
+        -------
+        size : int
+        """
+        return self._size
+
+    @property
+    def n_ready(self):
+        """Number of servers started and not handed out.
+
+        Returns
+        -------
+        n_ready : int
+        """
+        return self._ready.qsize()
+
+    def _start_server(self):
+        with self._lock:
+            port = _free_ports(1, self._reserved_ports)[0]
+            self._reserved_ports.add(port)
+        try:
+            with self._start_lock:
+                server = server_module.start_local_server(port=port, **self._start_kwargs)
+                # the first request is answered once the server is ready
+                server.info
+        finally:
+            with self._lock:
+                self._reserved_ports.discard(port)
+        return [server, 0]
+
+    def _refill(self):
+        try:
+            entry = self._start_server()
+        except Exception as e:
+            # raised to the next job waiting for a server
+            self._ready.put(e)
+            return
+        if self._closed:
+            _shutdown(entry[0])
+        else:
+            self._ready.put(entry)
+
+    def _schedule_refill(self):
+        if self._executor is None:
+            # the servers which are not thread safe are started later by the
+            # calling threads, see _start_missing
+            with self._lock:
+                self._n_missing += 1
+        else:
+            self._executor.submit(self._refill)
+
+    def _take_missing(self):
+        with self._lock:
+            if self._n_missing == 0 or self._closed:
+                return False
+            self._n_missing -= 1
+            return True
+
+    def _start_missing(self):
+        while self._take_missing():
+            self._refill()
+
+    def _retire(self, entry):
+        _shutdown(entry[0])
+        if not self._closed:
+            self._schedule_refill()
+
+    def acquire(self, timeout=None):
+        """Take a server out of the pool, which must be given back with :func:`release`.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for a server. The default is ``None``,
+            in which case the call blocks until a server is ready.
+
+        Returns
+        -------
+        server : BaseServer
+
+        Notes
+        -----
+        Without background starts, when no server is ready and some are missing,
+        the call blocks while a server is started.
+        """
+        if self._closed:
+            raise ValueError("The pool is shut down.")
+        while True:
+            try:
+                if self._executor is None and self._ready.empty() and self._take_missing():
+                    self._refill()
+                entry = self._ready.get(timeout=timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No server was ready in {timeout} seconds.")
+            if isinstance(entry, Exception):
+                self._schedule_refill()
+                raise entry
+            if _is_alive(entry[0]):
+                break
+            self._retire(entry)
+        entry[1] += 1
+        with self._lock:
+            self._in_use.append(entry)
+        return entry[0]
+
+    def release(self, server):
+        """Give a server back to the pool.
+
+        Parameters
+        ----------
+        server : BaseServer
+            Server returned by :func:`acquire`.
+
+        Notes
+        -----
+        Without background starts, the call blocks while the missing servers,
+        including the replacement of this server when it is retired, are started
+        once the server is given back.
+        """
+        with self._lock:
+            for index, entry in enumerate(self._in_use):
+                if entry[0] is server:
+                    del self._in_use[index]
+                    break
+            else:
+                raise ValueError("The server was not acquired from this pool.")
+        if self._closed:
+            _shutdown(server)
+        elif (self._max_uses is None or entry[1] < self._max_uses) and _is_alive(server):
+            self._ready.put(entry)
+        else:
+            self._retire(entry)
+        if self._executor is None:
+            self._start_missing()
+
+    @contextlib.contextmanager
+    def server(self, timeout=None):
+        """Hand out a server of the pool, to use in a ``with`` statement.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait for a server. The default is ``None``,
+            in which case the call blocks until a server is ready.
+
+        Yields
+        ------
+        server : BaseServer
+
+        Notes
+        -----
+        Without background starts, see :func:`acquire` and :func:`release` for
+        the calls blocking while servers are started.
+        """
+        server = self.acquire(timeout)
+        try:
+            yield server
+        finally:
+            self.release(server)
+
+    def shutdown(self):
+        """Shut down the servers of the pool. The servers handed out are shut down when
+        they are given back."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        while True:
+            try:
+                entry = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(entry, Exception):
+                _shutdown(entry[0])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
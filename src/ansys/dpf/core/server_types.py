@@ -6,6 +6,7 @@ servers available for the factory.
 """
 import abc
 import io
+import itertools
 import os
 import socket
 import subprocess
@@ -14,12 +15,13 @@ import warnings
 import traceback
 from threading import Thread, Lock
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 
 import psutil
 
 import ansys.dpf.core as core
 from ansys.dpf.core.check_version import server_meet_version
-from ansys.dpf.core import errors, server_factory
+from ansys.dpf.core import errors, server_factory, profiler
 from ansys.dpf.core._version import (
     server_to_ansys_grpc_dpf_version,
     server_to_ansys_version,
@@ -371,6 +373,9 @@ def check_ansys_grpc_dpf_version(server, timeout):
 class BaseServer(abc.ABC):
     """Abstract class for servers"""
 
+    # number of threads of the default executor of the asynchronous requests
+    _default_executor_workers = 1
+
     @abc.abstractmethod
     def __init__(self):
         """Base class for all types of servers: grpc, in process..."""
@@ -379,6 +384,9 @@ class BaseServer(abc.ABC):
         self._session_instance = None
         self._base_service_instance = None
         self._context = None
+        self._operator_specifications = {}
+        self._available_operator_names = None
+        self._executor = None
         self._docker_config = server_factory.RunningDockerConfig()
 
     def set_as_global(self, as_global=True):
@@ -398,6 +406,37 @@ class BaseServer(abc.ABC):
     def has_client(self):
         return not (self.client is None)
 
+    @property
+    def executor(self):
+        """Executor running the asynchronous requests to the server.
+
+        It is used by :func:`Operator.eval_async
+        <ansys.dpf.core.dpf_operator.Operator.eval_async>` and
+        :func:`Workflow.get_output_async
+        <ansys.dpf.core.workflow.Workflow.get_output_async>`. By default, a thread
+        pool running the requests one after another, or concurrently for the
+        servers using thread-safe gRPC stubs (``LegacyGrpcServer``).
+
+        Returns
+        -------
+        executor : concurrent.futures.Executor
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._default_executor_workers, thread_name_prefix="dpf-server"
+            )
+        return self._executor
+
+    @executor.setter
+    def executor(self, executor):
+        """Set the executor running the asynchronous requests to the server.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor
+        """
+        self._executor = executor
+
     @property
     @abc.abstractmethod
     def client(self):
@@ -618,6 +657,8 @@ class CServer(BaseServer, ABC):
         return "c_api"
 
     def get_api_for_type(self, capi, grpcapi):
+        if profiler._profiles:
+            profiler._instrument(capi)
         return capi
 
     def __del__(self):
@@ -941,6 +982,129 @@ class InProcessServer(CServer):
         return server_factory.AvailableServerConfigs.InProcessServer
 
 
+class _CountingMultiCallable:
+    """Count the calls in flight on a channel of a :class:`_GrpcChannelPool`."""
+
+    def __init__(self, multi_callable, pool, index):
+        self._multi_callable = multi_callable
+        self._pool = pool
+        self._index = index
+
+    def __call__(self, *args, **kwargs):
+        self._pool._add_in_flight(self._index, 1)
+        try:
+            return self._multi_callable(*args, **kwargs)
+        finally:
+            self._pool._add_in_flight(self._index, -1)
+
+    def __getattr__(self, name):
+        # future, with_call... are not counted
+        return getattr(self._multi_callable, name)
+
+
+class _CountingStub:
+    def __init__(self, stub, pool, index):
+        self._stub = stub
+        self._pool = pool
+        self._index = index
+
+    def __getattr__(self, name):
+        return _CountingMultiCallable(getattr(self._stub, name), self._pool, self._index)
+
+
+class _GrpcChannelPool:
+    """Channels to a gRPC server, with their stubs, one of which is selected by request.
+
+    The Python gRPC stubs are thread-safe, so that concurrent requests from several
+    threads can be sent on different connections instead of being multiplexed on one.
+    """
+
+    SELECTIONS = ("round_robin", "least_busy")
+
+    def __init__(self, address, channel):
+        self.address = address
+        self.main_channel = channel
+        self.channels = [channel]
+        self.selection = "round_robin"
+        self._stub_types = {}
+        self._stubs = [{}]
+        self._in_flight = [0]
+        self._in_flight_lock = Lock()
+        self._counter = itertools.count()
+
+    def configure(self, n_channels, selection, keepalive_time_ms):
+        import grpc
+
+        if n_channels < 1:
+            raise ValueError(f"n_channels must be at least 1, not {n_channels}.")
+        if selection not in self.SELECTIONS:
+            raise ValueError(f"selection must be one of {self.SELECTIONS}, not {selection}.")
+        self.close()
+        if n_channels == 1 and keepalive_time_ms is None:
+            channels = [self.main_channel]
+        else:
+            # each channel opens its own connection instead of sharing the global one
+            options = [("grpc.use_local_subchannel_pool", 1)]
+            if keepalive_time_ms is not None:
+                options += [
+                    ("grpc.keepalive_time_ms", keepalive_time_ms),
+                    ("grpc.keepalive_permit_without_calls", 1),
+                    ("grpc.http2.max_pings_without_data", 0),
+                ]
+            channels = [
+                grpc.insecure_channel(self.address, options=options) for _ in range(n_channels)
+            ]
+        self.selection = selection
+        self._in_flight = [0] * n_channels
+        self._stubs = [{} for _ in channels]
+        self.channels = channels
+        for stub_name, stub_type in self._stub_types.items():
+            self._create_stubs(stub_name, stub_type)
+
+    def close(self):
+        """Close the channels opened by ``configure``, only the main one is used again."""
+        for channel in self.channels:
+            if channel is not self.main_channel:
+                channel.close()
+        self.channels = [self.main_channel]
+        self._in_flight = [0]
+        self._stubs = [{}]
+        for stub_name, stub_type in self._stub_types.items():
+            self._create_stubs(stub_name, stub_type)
+
+    def _create_stubs(self, stub_name, stub_type):
+        counted = self.selection == "least_busy" and len(self.channels) > 1
+        for index, (channel, stubs) in enumerate(zip(self.channels, self._stubs)):
+            stub = stub_type(channel)
+            stubs[stub_name] = _CountingStub(stub, self, index) if counted else stub
+
+    def _add_in_flight(self, index, count):
+        with self._in_flight_lock:
+            self._in_flight[index] += count
+
+    def create_stub_if_necessary(self, stub_name, stub_type):
+        if stub_name not in self._stub_types:
+            self._stub_types[stub_name] = stub_type
+            self._create_stubs(stub_name, stub_type)
+
+    def get_stub(self, stub_name):
+        stubs = self._stubs
+        n_channels = len(stubs)
+        if n_channels == 1:
+            return stubs[0].get(stub_name)
+        start = next(self._counter)
+        if self.selection == "round_robin":
+            index = start % n_channels
+        else:
+            in_flight = self._in_flight
+            index = min(range(n_channels), key=lambda i: (in_flight[i], (i - start) % n_channels))
+        return stubs[index].get(stub_name)
+
+    @property
+    def stubs(self):
+        return self._stubs[0]
+
+
 class LegacyGrpcServer(BaseServer):
     """Provides an instance of the DPF server using InProcess gRPC.
     Kept for backward-compatibility with dpf servers <0.5.0.
@@ -975,6 +1139,9 @@ class LegacyGrpcServer(BaseServer):
         Defaults to True.
     """
 
+    # the Python gRPC stubs are thread-safe
+    _default_executor_workers = 8
+
     def __init__(
         self,
         ansys_path=None,
@@ -1044,7 +1211,7 @@ class LegacyGrpcServer(BaseServer):
         self._input_port = port
         self.live = True
         self.ansys_path = ansys_path
-        self._stubs = {}
+        self._channel_pool = _GrpcChannelPool(address, self.channel)
 
         self._create_shutdown_funcs()
 
@@ -1067,20 +1234,62 @@ class LegacyGrpcServer(BaseServer):
 
     @property
     def available_api_types(self):
-        return list(self._stubs.values())
+        return list(self._channel_pool.stubs.values())
 
     def get_api_for_type(self, capi, grpcapi):
+        if profiler._profiles:
+            profiler._instrument(grpcapi)
         return grpcapi
 
     def create_stub_if_necessary(self, stub_name, stub_type):
-        if not (stub_name in self._stubs.keys()):
-            self._stubs[stub_name] = stub_type(self.channel)
+        self._channel_pool.create_stub_if_necessary(stub_name, stub_type)
 
     def get_stub(self, stub_name):
-        if not (stub_name in self._stubs.keys()):
-            return None
-        else:
-            return self._stubs[stub_name]
+        return self._channel_pool.get_stub(stub_name)
+
+    @property
+    def n_channels(self):
+        """Number of gRPC channels used to send requests to the server.
+
+        Returns
+        -------
+        n_channels : int
+        """
+        return len(self._channel_pool.channels)
+
+    def set_channels(self, n_channels, selection="round_robin", keepalive_time_ms=None):
+        """Open several gRPC channels to the server, to send the requests of concurrent
+        threads on separate connections.
+
+        Each request is sent on one of the channels. With one channel, the default,
+        the requests of all the threads share a single connection. The DPF objects
+        do not depend on the channel, so that objects created before remain valid.
+        This method must be called while no request is being sent to the server.
+
+        Parameters
+        ----------
+        n_channels : int
+            Number of channels.
+        selection : str, optional
+            ``"round_robin"`` to use the channels one after the other, or
+            ``"least_busy"`` to use the channel with the fewest requests being sent.
+            The default is ``"round_robin"``.
+        keepalive_time_ms : int, optional
+            Period in milliseconds of the keepalive pings sent on the channels, to keep
+            idle connections open through proxies and load balancers. gRPC servers
+            refuse pings more frequent than every 5 minutes by default. The default is
+            ``None``, in which case no keepalive ping is sent.
+
+        Examples
+        --------
+        >>> from ansys.dpf import core as dpf
+        >>> server = dpf.start_local_server(
+        ...     config=dpf.AvailableServerConfigs.LegacyGrpcServer, as_global=False
+        ... ) # doctest: +SKIP
+        >>> server.set_channels(4, selection="least_busy") # doctest: +SKIP
+
+        """
+        self._channel_pool.configure(n_channels, selection, keepalive_time_ms)
 
     @property
     def ip(self):
@@ -1176,6 +1385,8 @@ class LegacyGrpcServer(BaseServer):
         self._local_server = val
 
     def shutdown(self):
+        if hasattr(self, "_channel_pool"):
+            self._channel_pool.close()
         if self._own_process and self.live:
             try:
                 if hasattr(self, "_preparing_shutdown_func"):
@@ -10,6 +10,8 @@ from ansys.dpf.core.server import set_server_configuration  # noqa: F401
 from ansys.dpf.core.server_context import set_default_server_context  # noqa: F401
 from ansys.dpf.core.server_factory import ServerConfig  # noqa: F401
 from ansys.dpf.core import core
+from ansys.dpf.core import _grid_cache
+from ansys.dpf.core import _operator_cache
 
 
 def disable_off_screen_rendering() -> None:
@@ -88,6 +90,95 @@ def set_dynamic_available_results_capability(value) -> None:
     misc.DYNAMIC_RESULTS = value
 
 
+def enable_grid_cache(directory=None, max_size=_grid_cache.DEFAULT_MAX_SIZE) -> None:
+    """Enable the persistent on-disk cache of the PyVista grids of meshes.
+
+    The grids of the meshes read from result files, for example with
+    ``model.metadata.meshed_region.grid``, are stored in ``directory`` and are
+    memory-mapped instead of being converted again in the following Python
+    sessions. An entry is identified by the path, size and modification time of
+    the result files, the linearization of the elements and the size of the mesh.
+    Only result files which are reachable from the client are cached.
+
+    Parameters
+    ----------
+    directory : str, os.PathLike, optional
+        Directory of the cache. The default is ``~/.cache/ansys-dpf-core/grids``.
+    max_size : int, optional
+        Maximum size of the cache in bytes. The least recently used grids are
+        evicted beyond it. The default is 1 GiB.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> dpf.settings.enable_grid_cache()
+    >>> dpf.settings.disable_grid_cache()
+
+    """
+    _grid_cache.enable(directory, max_size)
+
+
+def disable_grid_cache() -> None:
+    """Disable the persistent on-disk cache of the PyVista grids of meshes.
+
+    The cached grids are kept on disk, see :func:`enable_grid_cache`.
+    """
+    _grid_cache.disable()
+
+
+def enable_operator_cache(max_size=_operator_cache.DEFAULT_MAX_SIZE) -> None:
+    """Enable the in-memory cache of the outputs of operators.
+
+    The outputs returned by :func:`Operator.get_output
+    <ansys.dpf.core.dpf_operator.Operator.get_output>`, and by ``eval`` and the
+    outputs of the operators, are kept and returned again to the operators with the
+    same name, configuration and inputs, without evaluating them. The inputs are
+    identified by their values for the primitive types, by the key, path, size and
+    modification time of their files for the data sources, by their IDs for the
+    scopings and by their inputs for the upstream operators. Operators with other
+    inputs, such as fields, meshes or data sources with upstreams, and the operators
+    added to a workflow are always evaluated. Streams are never cached.
+    The cached outputs are shared and must not be modified.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum estimated size in bytes of the cached outputs. The least recently
+        used outputs are evicted beyond it. The default is 1 GiB.
+
+    Examples
+    --------
+    >>> from ansys.dpf import core as dpf
+    >>> from ansys.dpf.core import examples
+    >>> dpf.settings.enable_operator_cache()
+    >>> model = dpf.Model(examples.find_simple_bar())
+    >>> first = model.results.displacement().eval()
+    >>> second = model.results.displacement().eval()
+    >>> dpf.settings.get_operator_cache_stats()["hits"]
+    1
+    >>> dpf.settings.disable_operator_cache()
+
+    """
+    _operator_cache.enable(max_size)
+
+
+def disable_operator_cache() -> None:
+    """Disable the in-memory cache of the outputs of operators and release them."""
+    _operator_cache.disable()
+
+
+def get_operator_cache_stats() -> dict:
+    """Statistics of the in-memory cache of the outputs of operators.
+
+    Returns
+    -------
+    stats : dict
+        Number of ``"hits"`` and ``"misses"`` since the cache was enabled, number of
+        ``"entries"``, estimated ``"size"`` and ``"max_size"`` in bytes.
+    """
+    return _operator_cache.stats()
+
+
 def _forward_to_gate():
     from ansys.dpf.gate import settings
     from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
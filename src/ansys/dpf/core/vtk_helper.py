@@ -158,14 +158,150 @@ def dpf_mesh_to_vtk_op(mesh, nodes, as_linear):
     if VTK9:
         grid = pv.UnstructuredGrid(cells_pv, celltypes_pv, nodes_pv)
         setattr(grid, "_dpf_cache_op", [cells_pv, celltypes_pv, nodes_pv])
+        setattr(grid, "_dpf_cells", (cells_pv, celltypes_pv, None))
         return grid
     else:
         offsets_pv = mesh_to_pyvista.outputs.offsets()
         grid = pv.UnstructuredGrid(offsets_pv, cells_pv, celltypes_pv, nodes_pv)
         setattr(grid, "_dpf_cache_op", [cells_pv, celltypes_pv, nodes_pv, offsets_pv])
+        setattr(grid, "_dpf_cells", (cells_pv, celltypes_pv, offsets_pv))
         return grid
 
 
+def _concatenated_ranges(starts, lengths):
+    """Return the concatenation of ``range(start, start + length)`` for each start and length."""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    ends = np.cumsum(lengths)
+    shifts = np.repeat(np.asarray(starts, dtype=np.int64) - (ends - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shifts
+
+
+def _sizes_from_data_pointer(data_pointer, data_size, count):
+    """Return the number of values of each of the ``count`` entities of a data pointer."""
+    bounds = np.append(np.asarray(data_pointer, dtype=np.int64)[:count], data_size)
+    return np.diff(bounds)
+
+
+def _build_vtk_cells(
+    etypes, connectivity, data_pointer, elements_faces=None, faces_nodes=None, as_linear=True
+):
+    """Build the VTK cells array of a DPF mesh in a single vectorized pass.
+
+    Parameters
+    ----------
+    etypes : numpy.ndarray
+        DPF element type of each element.
+    connectivity : numpy.ndarray
+        Concatenated node indices of the elements.
+    data_pointer : numpy.ndarray
+        Index of the first value of each element in ``connectivity``.
+    elements_faces : tuple(numpy.ndarray, numpy.ndarray), optional
+        Data and data pointer of the ``"elements_faces_connectivity"`` property
+        field, required for polyhedrons.
+    faces_nodes : tuple(numpy.ndarray, numpy.ndarray), optional
+        Data and data pointer of the ``"faces_nodes_connectivity"`` property
+        field, required for polyhedrons.
+    as_linear : bool, optional
+        Export quadratic surface elements as linear.
+
+    Returns
+    -------
+    cells : numpy.ndarray
+        Cells in VTK format, polyhedrons being written as
+        ``[NValuesToFollow, NFaces, Face1NPoints, Face1Point1, ..., FaceNNPoints, ...]``.
+    vtk_cell_type : numpy.ndarray
+        VTK cell type of each element.
+    offsets : numpy.ndarray
+        Index of each cell in ``cells``.
+    """
+    etypes = np.asarray(etypes)
+    connectivity = np.asarray(connectivity)
+    n_elements = etypes.size
+    elem_size = _sizes_from_data_pointer(data_pointer, connectivity.size, n_elements)
+    cell_size = elem_size + 1
+
+    poly_mask = etypes == element_types.Polyhedron.value
+    if poly_mask.any():
+        faces_data, faces_dp = (np.asarray(array) for array in elements_faces)
+        nodes_data, nodes_dp = (np.asarray(array) for array in faces_nodes)
+        poly_indices = np.flatnonzero(poly_mask)
+        n_faces = _sizes_from_data_pointer(faces_dp, faces_data.size, n_elements)[poly_indices]
+        faces = faces_data[_concatenated_ranges(np.asarray(faces_dp)[poly_indices], n_faces)]
+        face_sizes = _sizes_from_data_pointer(nodes_dp, nodes_data.size, nodes_dp.size)[faces]
+        face_poly = np.repeat(np.arange(poly_indices.size), n_faces)
+        n_face_values = np.bincount(
+            face_poly, weights=face_sizes, minlength=poly_indices.size
+        ).astype(np.int64)
+        cell_size[poly_indices] = 2 + n_faces + n_face_values
+
+    offsets = np.zeros(n_elements, dtype=np.int64)
+    np.cumsum(cell_size[:-1], out=offsets[1:])
+    cells = np.empty(int(cell_size.sum()), dtype=connectivity.dtype)
+
+    # standard cells: [NPoints, Point1, ..., PointN]
+    standard = ~poly_mask
+    cells[offsets[standard]] = elem_size[standard]
+    values = _concatenated_ranges(np.asarray(data_pointer)[standard], elem_size[standard])
+    cells[_concatenated_ranges(offsets[standard] + 1, elem_size[standard])] = connectivity[values]
+
+    if poly_mask.any():
+        poly_offsets = offsets[poly_indices]
+        cells[poly_offsets] = cell_size[poly_indices] - 1
+        cells[poly_offsets + 1] = n_faces
+        # each face takes its number of points followed by its points
+        face_records = face_sizes + 1
+        first_face = np.cumsum(n_faces) - n_faces
+        records_end = np.cumsum(face_records)
+        records_start = records_end - face_records
+        face_offsets = (
+            poly_offsets[face_poly] + 2 + records_start - records_start[first_face[face_poly]]
+        )
+        cells[face_offsets] = face_sizes
+        values = _concatenated_ranges(np.asarray(nodes_dp)[faces], face_sizes)
+        cells[_concatenated_ranges(face_offsets + 1, face_sizes)] = nodes_data[values]
+
+    # quad8 (kAnsQuad8 = 6) and tri6 (kAnsTri6 = 4) can be exported as linear by
+    # dropping their mid-side nodes
+    quadratic_surfaces = ((6, 8), (4, 6))
+    if as_linear:
+        vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
+        to_linearize = [
+            (offsets[etypes == etype], n_nodes) for etype, n_nodes in quadratic_surfaces
+        ]
+    else:
+        vtk_cell_type = VTK_MAPPING[etypes]
+        # semi-parabolic elements have -1 for their missing mid-side nodes
+        to_linearize = []
+        semi_mask = cells == -1
+        if semi_mask.any():
+            cell_indices = np.repeat(np.arange(n_elements), cell_size)
+            semi_elements = np.zeros(n_elements, dtype=bool)
+            semi_elements[cell_indices[semi_mask]] = True
+            for etype, n_nodes in quadratic_surfaces:
+                semi_of_type = semi_elements & (elem_size == n_nodes) & ~poly_mask
+                to_linearize.append((offsets[semi_of_type], n_nodes))
+                vtk_cell_type[semi_of_type & (etypes == etype)] = VTK_LINEAR_MAPPING[etype]
+
+    mask = None
+    for linear_offsets, n_nodes in to_linearize:
+        if linear_offsets.size == 0:
+            continue
+        if mask is None:
+            mask = np.ones(cells.size, dtype=bool)
+        mid_nodes = np.arange(n_nodes // 2 + 1, n_nodes + 1)
+        mask[(linear_offsets[:, np.newaxis] + mid_nodes).ravel()] = False
+        cells[linear_offsets] //= 2
+    if mask is not None:
+        removed = np.cumsum(~mask)
+        # removed values are always after the first value of their cell
+        offsets = offsets - np.concatenate(([0], removed))[offsets]
+        cells = cells[mask]
+    return cells, vtk_cell_type, offsets
+
+
 def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
     """Return a pyvista unstructured grid given DPF node and element
     definitions in pure Python (server <= 6.2)
@@ -195,134 +331,26 @@ def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
         coordinates_field = nodes
         node_coordinates = nodes.data
 
-    elem_size = np.ediff1d(np.append(connectivity._data_pointer, connectivity.shape))
-
-    faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
-    faces_nodes_connectivity_dp = np.append(
-        faces_nodes_connectivity._data_pointer, len(faces_nodes_connectivity)
-    )
-    elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
-    elements_faces_connectivity_dp = np.append(
-        elements_faces_connectivity._data_pointer, len(elements_faces_connectivity)
-    )
-
-    insert_ind = np.cumsum(elem_size)
-    insert_ind = np.hstack(([0], insert_ind))[:-1]
-
-    # if not as_linear:
-    #     # Pre-handle semi-parabolic elements
-    #     semi_mask = connectivity.data == -1
-    #     if semi_mask.any():
-    #         # Modify -1 connectivity values
-    #         repeated_data_pointers = connectivity._data_pointer.repeat(repeats=elem_size)
-    #         connectivity.data[semi_mask] = connectivity.data[repeated_data_pointers[semi_mask]]
-
-    # partition cells in vtk format
-    cells = np.insert(connectivity.data, insert_ind, elem_size)
-
+    elements_faces = None
+    faces_nodes = None
     # Check if polyhedrons are present
     if element_types.Polyhedron.value in etypes:
-        cells = np.array(cells)
-        nodes = np.array(node_coordinates)
-        insert_ind = insert_ind + np.asarray(list(range(len(insert_ind))))
-        # Replace in cells values for polyhedron format
-        # [NValuesToFollow,
-        # NFaces, Face1NPoints, Face1Point1, Face1Point2..., Face1PointN, FaceNNPoints,...]]
-        for i, ind in reversed(list(enumerate(insert_ind))):
-            # Check if this is a polyhedron
-            if etypes[i] == element_types.Polyhedron.value:
-                # Construct the connectivity for the poly element
-                poly_connectivity = []
-                faces = elements_faces_connectivity.data[
-                    elements_faces_connectivity_dp[i] : elements_faces_connectivity_dp[i + 1]
-                ]
-                for face in faces:
-                    face_connectivity = faces_nodes_connectivity.data[
-                        faces_nodes_connectivity_dp[face] : faces_nodes_connectivity_dp[face + 1]
-                    ]
-                    face_fmt = [len(face_connectivity)] + list(face_connectivity)
-                    poly_connectivity += face_fmt
-                polyhedron = [len(faces)] + poly_connectivity
-                polyhedron = [len(polyhedron)] + polyhedron
-                # Replace the whole sequence between this index and the next
-                r = list(range(ind, ind + elem_size[i] + 1))
-                cells = np.delete(cells, r)
-                cells = np.insert(cells, ind, polyhedron)
-
-    def compute_offset():
-        """Return the starting point of a cell in the cells array"""
-        return insert_ind + np.arange(insert_ind.size)
-
-    cells_insert_ind = compute_offset()
-    # convert kAns to VTK cell type
-    offset = None
-    if as_linear:
-        # Map the vtk_cell_type to linear versions of the initial elements types
-        vtk_cell_type = VTK_LINEAR_MAPPING[etypes]
-
-        # Create a global mask of connectivity values to take
-        mask = np.full(cells.shape, True)
-
-        # Get a mask of quad8 elements in etypes
-        quad8_mask = etypes == 6
-        # If any quad8
-        if np.any(quad8_mask):  # kAnsQuad8
-            # Get the starting indices of quad8 elements in cells
-            insert_ind_quad8 = cells_insert_ind[quad8_mask]
-            # insert_ind_quad8 += np.arange(insert_ind_quad8.size)
-            mask[insert_ind_quad8 + 5] = False
-            mask[insert_ind_quad8 + 6] = False
-            mask[insert_ind_quad8 + 7] = False
-            mask[insert_ind_quad8 + 8] = False
-            cells[insert_ind_quad8] //= 2
-
-        tri6_mask = etypes == 4  # kAnsTri6 = 4
-        if np.any(tri6_mask):
-            insert_ind_tri6 = cells_insert_ind[tri6_mask]
-            # insert_ind_tri6 += np.arange(insert_ind_tri6.size)
-            mask[insert_ind_tri6 + 4] = False
-            mask[insert_ind_tri6 + 5] = False
-            mask[insert_ind_tri6 + 6] = False
-            cells[insert_ind_tri6] //= 2
-        cells = cells[mask]
-
-    else:
-        vtk_cell_type = VTK_MAPPING[etypes]
-
-        # Handle semi-parabolic elements
-        semi_mask = cells == -1
-        if semi_mask.any():
-            cells_insert_ind = compute_offset()
-            # Create a global mask of connectivity values to take
-            mask = np.full(cells.shape, True)
-            # Build a map of size cells with repeated element beginning index
-            repeated_insert_ind = cells_insert_ind.repeat(repeats=elem_size + 1)
-            # Apply the semi-mask to get a unique set of indices of semi-parabolic elements in cells
-            semi_indices_in_cells = np.array(list(set(repeated_insert_ind[semi_mask])))
-            semi_sizes = cells[semi_indices_in_cells]
-            semi_quad8 = semi_sizes == 8
-            if semi_quad8.any():
-                mask[semi_indices_in_cells[semi_quad8] + 5] = False
-                mask[semi_indices_in_cells[semi_quad8] + 6] = False
-                mask[semi_indices_in_cells[semi_quad8] + 7] = False
-                mask[semi_indices_in_cells[semi_quad8] + 8] = False
-                cells[semi_indices_in_cells[semi_quad8]] //= 2
-
-                quad8_mask = etypes == 6
-                semi_quad8_mask = (cells[cells_insert_ind] == 4) & quad8_mask
-                vtk_cell_type[semi_quad8_mask] = VTK_LINEAR_MAPPING[6]
-            semi_tri6 = semi_sizes == 6
-            if semi_tri6.any():
-                mask[semi_indices_in_cells[semi_tri6] + 4] = False
-                mask[semi_indices_in_cells[semi_tri6] + 5] = False
-                mask[semi_indices_in_cells[semi_tri6] + 6] = False
-                cells[semi_indices_in_cells[semi_tri6]] //= 2
-
-                tri6_mask = etypes == 4
-                semi_tri6_mask = (cells[cells_insert_ind] == 3) & tri6_mask
-                vtk_cell_type[semi_tri6_mask] = VTK_LINEAR_MAPPING[4]
-            # Update cells with the mask
-            cells = cells[mask]
+        elements_faces_connectivity = mesh.property_field("elements_faces_connectivity")
+        elements_faces = (
+            elements_faces_connectivity.data,
+            elements_faces_connectivity._data_pointer,
+        )
+        faces_nodes_connectivity = mesh.property_field("faces_nodes_connectivity")
+        faces_nodes = (faces_nodes_connectivity.data, faces_nodes_connectivity._data_pointer)
+
+    cells, vtk_cell_type, offset = _build_vtk_cells(
+        etypes,
+        connectivity.data,
+        connectivity._data_pointer,
+        elements_faces,
+        faces_nodes,
+        as_linear,
+    )
 
     # different treatment depending on the version of vtk
     if VTK9:
@@ -332,14 +360,13 @@ def dpf_mesh_to_vtk_py(mesh, nodes, as_linear):
         # Quick fix required to hold onto the data as PyVista does not make a copy.
         # All of those now return DPFArrays
         setattr(grid, "_dpf_cache", [node_coordinates, coordinates_field])
+        setattr(grid, "_dpf_cells", (cells, vtk_cell_type, None))
 
         return grid
 
-    # might be computed when checking for VTK quadratic bug
-    if offset is None:
-        offset = compute_offset()
-
-    return pv.UnstructuredGrid(offset, cells, vtk_cell_type, node_coordinates)
+    grid = pv.UnstructuredGrid(offset, cells, vtk_cell_type, node_coordinates)
+    setattr(grid, "_dpf_cells", (cells, vtk_cell_type, offset))
+    return grid
 
 
 def dpf_mesh_to_vtk(mesh, nodes=None, as_linear=True):
@@ -368,7 +395,38 @@ def dpf_mesh_to_vtk(mesh, nodes=None, as_linear=True):
         return dpf_mesh_to_vtk_py(mesh, nodes, as_linear)
 
 
+def _grid_to_arrays(grid):
+    """Return the arrays needed to rebuild a grid created by ``dpf_mesh_to_vtk``."""
+    cells, celltypes, offsets = grid._dpf_cells
+    return {
+        "cells": np.asarray(cells, dtype=pv.ID_TYPE),
+        "celltypes": np.asarray(celltypes, dtype=np.uint8),
+        "points": np.asarray(grid.points),
+        "offsets": None if offsets is None else np.asarray(offsets, dtype=pv.ID_TYPE),
+    }
+
+
+def _grid_from_arrays(arrays):
+    """Build a grid from the arrays returned by ``_grid_to_arrays``."""
+    cells, celltypes, points = arrays["cells"], arrays["celltypes"], arrays["points"]
+    if VTK9:
+        grid = pv.UnstructuredGrid(cells, celltypes, points)
+    else:
+        grid = pv.UnstructuredGrid(arrays["offsets"], cells, celltypes, points)
+    # PyVista may not copy the memory-mapped arrays
+    setattr(grid, "_dpf_cache", list(arrays.values()))
+    setattr(grid, "_dpf_cells", (cells, celltypes, arrays.get("offsets")))
+    return grid
+
+
 def vtk_update_coordinates(vtk_grid, coordinates_array):
     from copy import copy
 
     vtk_grid.points = copy(coordinates_array)
+
+
+def vtk_deformed_copy(vtk_grid, coordinates_array):
+    """Return a shallow copy of a grid, sharing its cells but not its points."""
+    grid = vtk_grid.copy(deep=False)
+    grid.SetPoints(pv.vtk_points(coordinates_array))
+    return grid
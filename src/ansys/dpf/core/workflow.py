@@ -4,6 +4,7 @@
 Workflow
 ========
 """
+import asyncio
 import logging
 import traceback
 import warnings
@@ -365,6 +366,45 @@ class Workflow:
             return out
         raise TypeError(f"{output_type} is not an implemented Operator's output")
 
+    def get_output_async(self, pin_name, output_type):
+        """Retrieve the output of the workflow without blocking the calling thread.
+
+        The request runs on the :attr:`executor <ansys.dpf.core.server_types.BaseServer.executor>`
+        of the workflow's server. The inputs of the workflow must not be modified before
+        the request completes. Cancelling the future only prevents a request which
+        has not started yet.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to retrieve. This name should be
+            exposed before with wf.set_output_name
+        output_type : core.type enum
+            Type of the requested output.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future of the output returned by :func:`get_output`, or raising its exception.
+        """
+        return self._server.executor.submit(self.get_output, pin_name, output_type)
+
+    async def aget_output(self, pin_name, output_type):
+        """Retrieve the output of the workflow, awaitable from asyncio code.
+
+        The request runs as in :func:`get_output_async`. Cancelling the awaiting task
+        cancels the request if it has not started yet.
+
+        Parameters
+        ----------
+        pin_name : str
+            Name of the pin to retrieve. This name should be
+            exposed before with wf.set_output_name
+        output_type : core.type enum
+            Type of the requested output.
+        """
+        return await asyncio.wrap_future(self.get_output_async(pin_name, output_type))
+
     def set_input_name(self, name, *args):
         """Set the name of the input pin of the workflow to expose it for future connection.
 
@@ -400,6 +440,8 @@ class Workflow:
                 operator = arg
             elif isinstance(arg, int):
                 pin = arg
+        if operator is not None:
+            operator._unrecord_inputs()
         return self._api.work_flow_set_name_input_pin(self, operator, pin, name)
 
     def set_output_name(self, name, *args):
@@ -483,6 +525,7 @@ class Workflow:
         >>> workflow.add_operator(disp_op)
 
         """
+        operator._unrecord_inputs()
         self._api.work_flow_add_operator(self, operator)
 
     def record(self, identifier="", transfer_ownership=True):
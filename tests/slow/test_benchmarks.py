@@ -0,0 +1,174 @@
+"""Benchmarks of the client side performance, run with ``pytest -s`` to print the timings."""
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from ansys.dpf.core import misc
+
+
+def _best_time(function, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_benchmark_import_time():
+    def import_dpf_core():
+        subprocess.run([sys.executable, "-c", "import ansys.dpf.core"], check=True)
+
+    def start_interpreter():
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+    import_time = _best_time(import_dpf_core) - _best_time(start_interpreter)
+    print(f"\nimport ansys.dpf.core: {import_time * 1000:.0f} ms")
+
+    # the generated operators must only be imported on access
+    code = (
+        "import sys, ansys.dpf.core;"
+        "print(len([m for m in sys.modules if m.startswith('ansys.dpf.core.operators.')]))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    assert int(out.stdout) < 5
+
+
+@pytest.mark.skipif(not misc.module_exists("pyvista"), reason="Please install pyvista")
+def test_benchmark_vtk_cells_polyhedrons():
+    from ansys.dpf.core.vtk_helper import _build_vtk_cells
+
+    # synthetic mesh of hexahedral-like polyhedrons with 6 quadrangular faces each
+    n_cells = 200_000
+    n_faces = 6 * n_cells
+    etypes = np.full(n_cells, 34)
+    connectivity = np.arange(8 * n_cells) % 100_000
+    data_pointer = np.arange(n_cells) * 8
+    elements_faces = (np.arange(n_faces), np.arange(n_cells) * 6)
+    faces_nodes = (np.arange(4 * n_faces) % 100_000, np.arange(n_faces) * 4)
+
+    def build():
+        return _build_vtk_cells(
+            etypes, connectivity, data_pointer, elements_faces, faces_nodes, as_linear=True
+        )
+
+    cells, _, offsets = build()
+    assert cells.size == n_cells * (2 + 6 * 5)
+    assert offsets[-1] == (n_cells - 1) * (2 + 6 * 5)
+    print(f"\nvtk cells of {n_cells} polyhedrons: {_best_time(build, repeat=3) * 1000:.0f} ms")
+
+
+def test_benchmark_mesh_deep_copy(allkindofcomplexity):
+    from ansys.dpf import core as dpf
+
+    mesh = dpf.Model(allkindofcomplexity).metadata.meshed_region
+    other_server = dpf.start_local_server(as_global=False)
+    try:
+        bulk = _best_time(lambda: mesh.deep_copy(server=other_server), repeat=3)
+        by_entity = _best_time(lambda: mesh._deep_copy_by_entity(server=other_server), repeat=3)
+    finally:
+        other_server.shutdown()
+    print(
+        f"\ndeep_copy of {mesh.nodes.n_nodes} nodes and {mesh.elements.n_elements} elements: "
+        f"{bulk * 1000:.0f} ms (bulk), {by_entity * 1000:.0f} ms (one entity at a time)"
+    )
+    assert bulk < by_entity
+
+
+def test_benchmark_field_from_array(server_type):
+    from ansys.dpf import core as dpf
+
+    data = np.random.rand(2_000_000, 3)
+
+    def from_array():
+        return dpf.fields_factory.field_from_array(data, server=server_type)
+
+    def from_list():
+        field = dpf.fields_factory.create_3d_vector_field(len(data), server=server_type)
+        field.data = data.tolist()
+
+    field = from_array()
+    assert np.allclose(field.data, data)
+    elapsed = _best_time(from_array, repeat=3)
+    print(
+        f"\nfield_from_array of {data.nbytes / 2**20:.0f} MiB: {elapsed * 1000:.0f} ms "
+        f"({data.nbytes / 2**30 / elapsed:.2f} GiB/s), "
+        f"{_best_time(from_list, repeat=1) * 1000:.0f} ms from a list"
+    )
+
+
+@pytest.mark.parametrize("n_channels", [1, 4])
+def test_benchmark_grpc_channels(n_channels):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ansys.dpf import core as dpf
+
+    server = dpf.start_local_server(
+        config=dpf.AvailableServerConfigs.LegacyGrpcServer, as_global=False
+    )
+    try:
+        server.set_channels(n_channels)
+        scopings = [dpf.Scoping(ids=[1, 2, 3], server=server) for _ in range(8)]
+        n_calls = 500
+
+        def small_calls(scoping):
+            for _ in range(n_calls):
+                scoping.location
+
+        def run():
+            with ThreadPoolExecutor(max_workers=len(scopings)) as executor:
+                list(executor.map(small_calls, scopings))
+
+        elapsed = _best_time(run, repeat=3)
+        print(
+            f"\n{len(scopings)} threads on {n_channels} gRPC channel(s): "
+            f"{len(scopings) * n_calls / elapsed:.0f} calls/s"
+        )
+    finally:
+        server.shutdown()
+
+
+def test_benchmark_scoping_set_ids(server_type):
+    from ansys.dpf import core as dpf
+
+    ids = np.arange(1, 5_000_001)
+    scoping = dpf.Scoping(server=server_type)
+
+    def set_ids():
+        scoping.ids = ids
+
+    set_ids()
+    assert np.array_equal(scoping.ids, ids)
+    elapsed = _best_time(set_ids, repeat=3)
+    print(f"\nScoping.ids of {len(ids)} ids: {elapsed * 1000:.0f} ms")
+
+
+@pytest.mark.skipif(not misc.module_exists("pyvista"), reason="Please install pyvista")
+def test_benchmark_plot_contour_split_by_body(allkindofcomplexity):
+    from ansys.dpf import core as dpf
+    from ansys.dpf.core.plotter import Plotter
+
+    model = dpf.Model(allkindofcomplexity)
+    mesh = model.metadata.meshed_region
+    fc = model.results.displacement.split_by_body.eval()
+
+    def merge_by_field():
+        overall_data = np.full((len(mesh.nodes), 3), np.nan)
+        for field in fc:
+            ind, mask = mesh.nodes.map_scoping(field.scoping)
+            overall_data[ind] = field.data[mask]
+
+    def merge():
+        Plotter._merge_fields_data(fc, mesh)
+
+    def render():
+        Plotter(mesh).plot_contour(fc, off_screen=True)
+
+    print(
+        f"\nplot_contour of {len(fc)} fields split by body: "
+        f"{_best_time(render, repeat=3) * 1000:.0f} ms, merging the data: "
+        f"{_best_time(merge) * 1000:.0f} ms ({_best_time(merge_by_field) * 1000:.0f} ms by field)"
+    )
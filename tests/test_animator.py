@@ -228,3 +228,29 @@ def test_animator_animate_fields_container_cpos(remove_gifs, displacement_fields
     )
     assert os.path.isfile(gif_name)
     assert os.path.getsize(gif_name) > 6000
+
+
+def test_animator_animate_fields_container_prefetch_frames(remove_gifs, displacement_fields):
+    for prefetch_frames in [0, 1]:
+        displacement_fields.animate(
+            scale_factor=[10.0, 20.0],
+            save_as=gif_name,
+            off_screen=True,
+            prefetch_frames=prefetch_frames,
+        )
+        assert os.path.isfile(gif_name)
+        assert os.path.getsize(gif_name) > 6000
+        os.remove(gif_name)
+
+
+def test_animator_prefetched_order():
+    from ansys.dpf.core.animator import _prefetched
+
+    evaluated = []
+
+    def evaluate(item):
+        evaluated.append(item)
+        return item * 2
+
+    assert list(_prefetched(evaluate, range(10), 3)) == [2 * i for i in range(10)]
+    assert evaluated == list(range(10))
@@ -185,6 +185,29 @@ def test_complex_fields_container():
     assert fim_result.component_count == 1
 
 
+def test_fields_container_builder(server_type):
+    data = np.arange(30, dtype=np.float64).reshape(10, 3)
+    offsets = [0, 4, 4, 10]
+    label_values = np.array([[1, 1], [1, 2], [2, 1]])
+    ids = np.arange(100, 110)
+    builder = fields_container_factory.FieldsContainerBuilder(["time", "body"], server=server_type)
+    builder.add_fields(data, offsets, label_values, ids=ids, location=locations.elemental)
+    scalar_field = fields_factory.create_scalar_field(3, server=server_type)
+    builder.add_field({"time": 2, "body": 2}, scalar_field)
+    assert len(builder) == 4
+    fc = builder.build()
+    assert len(fc) == 4
+    assert sorted(fc.labels) == ["body", "time"]
+    field = fc.get_field({"time": 2, "body": 1})
+    assert field.location == locations.elemental
+    assert np.allclose(field.data, data[4:])
+    assert np.allclose(field.scoping.ids, ids[4:])
+    assert len(fc.get_field({"time": 1, "body": 2}).data) == 0
+    assert fc.get_field({"time": 2, "body": 2}).component_count == 1
+    with pytest.raises(ValueError):
+        builder.add_fields(data, [0, 4, 9], label_values[:2])
+
+
 def test_scoping_by_set():
     scop = time_freq_scoping_factory.scoping_by_set(2)
     assert scop is not None
@@ -685,6 +685,33 @@ def test_local_elemental_nodal_get_entity_data():
         assert hasattr(f, "_is_set") is False
 
 
+def test_local_field_numpy_buffers():
+    num_entities = 1000
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(
+        num_entities, location=dpf.core.locations.elemental_nodal
+    )
+    with field_to_local.as_local_field() as f:
+        for i in range(1, num_entities + 1):
+            f.append(np.full((i % 3 + 1, 3), float(i)), i)
+        assert f._data_copy.capacity >= f.size
+        assert f._data_copy.capacity < 2 * f.size + 16
+        entity_data = f.get_entity_data(num_entities - 1)
+        assert np.shares_memory(entity_data, f.data)
+        assert np.allclose(entity_data, float(num_entities))
+        assert f.data.dtype == np.float64
+        assert f._data_pointer.dtype == np.int32
+    with field_to_local.as_local_field() as f:
+        for i in range(1, num_entities + 1):
+            assert f.get_entity_data_by_id(i).shape == (i % 3 + 1, 3)
+    assert np.allclose(field_to_local.scoping.ids, range(1, num_entities + 1))
+    # in place modifications of the views are sent to the server
+    with field_to_local.as_local_field() as f:
+        f.data[0] = [-1.0, -2.0, -3.0]
+        f.get_entity_data(1)[0, 0] = -4.0
+    assert np.allclose(field_to_local.data[0], [-1.0, -2.0, -3.0])
+    assert field_to_local.get_entity_data(1)[0, 0] == -4.0
+
+
 def test_auto_delete_field_local():
     num_entities = 1
     field_to_local = dpf.core.fields_factory.create_3d_vector_field(
@@ -831,6 +858,25 @@ def test_set_data_numpy_array_field(server_type):
     assert np.allclose(field_to_local.data, arr)
 
 
+def test_set_data_non_contiguous_array_field(server_type):
+    field_to_local = dpf.core.fields_factory.create_3d_vector_field(100, server=server_type)
+    arr = np.arange(600, dtype=np.float64).reshape(100, 6)[:, ::2]
+    field_to_local.data = arr
+    assert np.allclose(field_to_local.data, arr)
+    arr = np.asfortranarray(np.arange(300, dtype=np.int64).reshape(100, 3))
+    field_to_local.data = arr
+    assert np.allclose(field_to_local.data, arr)
+    field_to_local.data = tuple(range(300))
+    assert np.allclose(field_to_local.data.ravel(), np.arange(300))
+
+
+def test_fromarray_field_scoping_ids(server_type):
+    data = np.arange(30, dtype=np.float32).reshape(10, 3)
+    f = dpf.core.field_from_array(data, server=server_type)
+    assert np.allclose(f.data, data)
+    assert np.array_equal(f.scoping.ids, np.arange(1, 11))
+
+
 def test_set_data_numpy_array_property_field(server_type):
     field_to_local = dpf.core.PropertyField(server=server_type)
     arr = np.arange(300, dtype=np.int32)
@@ -131,6 +131,26 @@ def test_set_get_field_fields_container_new_label_default_value(server_type):
         assert fc.get_label_space(i) == {"time": i + 1, "complex": 0, "shape": 3}
 
 
+def test_get_fields_bulk_fields_container(server_type):
+    fc = FieldsContainer(server=server_type)
+    fc.labels = ["time", "complex"]
+    for i in range(0, 250):
+        mscop = {"time": i // 2 + 1, "complex": i % 2}
+        field = Field(nentities=1, server=server_type)
+        field.data = [float(i), 0.0, 0.0]
+        fc.add_field(mscop, field)
+    fields = fc.get_fields_bulk([3, 0, -1])
+    assert [f.data[0][0] for f in fields] == [3.0, 0.0, 249.0]
+    assert len(fc.get_fields_bulk({"time": 2})) == 2
+    assert [f.data[0][0] for f in fc] == [float(i) for i in range(250)]
+    assert fc.get_label_spaces([3, 0]) == [{"time": 2, "complex": 1}, {"time": 1, "complex": 0}]
+    assert fc.get_label_space(3) == {"time": 2, "complex": 1}
+    fc.add_field({"time": 200, "complex": 0}, Field(nentities=1, server=server_type))
+    assert fc.get_label_space(250) == {"time": 200, "complex": 0}
+    with pytest.raises(IndexError):
+        fc.get_fields_bulk([251])
+
+
 def test_get_item_field_fields_container(server_type):
     fc = FieldsContainer(server=server_type)
     fc.labels = ["time", "complex"]
@@ -37,6 +37,20 @@ def test_vtk_grid_from_model(simple_bar_model):
     assert all(grid.celltypes == vtk.VTK_HEXAHEDRON)
 
 
+def test_vtk_grid_persistent_cache(simple_bar, server_type, tmp_path):
+    dpf.core.settings.enable_grid_cache(tmp_path)
+    try:
+        grid = dpf.core.Model(simple_bar, server=server_type).metadata.meshed_region.grid
+        cached_grid = dpf.core.Model(simple_bar, server=server_type).metadata.meshed_region.grid
+    finally:
+        dpf.core.settings.disable_grid_cache()
+    if not conftest.running_docker:
+        assert len(list(tmp_path.iterdir())) == 1
+    assert np.allclose(cached_grid.points, grid.points)
+    assert np.array_equal(cached_grid.celltypes, grid.celltypes)
+    assert cached_grid.n_cells == grid.n_cells
+
+
 def test_meshed_region_available_property_fields(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     properties = ["connectivity", "elprops", "eltype", "apdl_element_type", "mat"]
@@ -87,6 +101,35 @@ def test_get_element_meshedregion(simple_bar_model):
     assert node.coordinates == [0.1, 1.6, 0.1]
 
 
+def test_bulk_nodes_elements_accessors_meshedregion(simple_bar_model):
+    mesh = simple_bar_model.metadata.meshed_region
+    node_ids = mesh.nodes.scoping.ids
+    coordinates = mesh.nodes.coordinates_field.data
+    assert np.allclose(mesh.nodes.coordinates_by_ids(node_ids[[5, 1]]), coordinates[[5, 1]])
+    with pytest.raises(ValueError):
+        mesh.nodes.coordinates_by_ids([-1])
+
+    element_ids = mesh.elements.scoping.ids
+    connectivities = mesh.elements.connectivity_by_ids(element_ids[:3])
+    for index, connectivity in enumerate(connectivities):
+        el = mesh.elements.element_by_index(index)
+        assert np.allclose(connectivity, el.connectivity)
+        assert np.allclose(
+            mesh.elements.connectivities_field.get_entity_data(index), el.connectivity
+        )
+
+    for i, node in enumerate(mesh.nodes):
+        assert node.index == i
+        assert node.id == node_ids[i]
+    assert np.allclose(node.coordinates, coordinates[-1])
+    n_elements = 0
+    for el in mesh.elements:
+        n_elements += 1
+        assert el.type == dpf.core.element_types.Hex8
+    assert n_elements == 3000
+    assert el.node_ids == [n.id for n in el.nodes]
+
+
 def test_get_coordinates_field_meshedregion(simple_bar_model):
     mesh = simple_bar_model.metadata.meshed_region
     nodescoping = mesh.nodes.scoping
@@ -308,6 +351,21 @@ def test_id_indeces_mapping_on_elements_2(allkindofcomplexity, server_type):
     assert mapping[4520] == 2011
 
 
+def test_map_scoping_nodes_elements(allkindofcomplexity, server_type):
+    model = dpf.core.Model(allkindofcomplexity, server=server_type)
+    mesh = model.metadata.meshed_region
+    for entities, location in [
+        (mesh.nodes, dpf.core.locations.nodal),
+        (mesh.elements, dpf.core.locations.elemental),
+    ]:
+        mapping = entities.mapping_id_to_index
+        ids = list(entities.scoping.ids[::7]) + [-1, 10**8]
+        scoping = dpf.core.Scoping(ids=ids, location=location, server=server_type)
+        ind, mask = entities.map_scoping(scoping)
+        assert np.allclose(mask, [i in mapping for i in ids])
+        assert np.allclose(ind, [mapping[i] for i in ids if i in mapping])
+
+
 def test_named_selection_mesh(allkindofcomplexity, server_type):
     model = dpf.core.Model(allkindofcomplexity, server=server_type)
     mesh = model.metadata.meshed_region
@@ -604,6 +662,24 @@ def test_mesh_deep_copy2(simple_bar_model, server_type):
     )
 
 
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_3_0,
+    reason="Copying property fields requires a server version higher than 3.0",
+)
+def test_mesh_deep_copy_named_selections_property_fields(allkindofcomplexity, server_type):
+    mesh = dpf.core.Model(allkindofcomplexity, server=server_type).metadata.meshed_region
+    copy = mesh.deep_copy()
+    assert sorted(copy.available_named_selections) == sorted(mesh.available_named_selections)
+    for name in mesh.available_named_selections:
+        assert np.array_equal(copy.named_selection(name).ids, mesh.named_selection(name).ids)
+    assert set(mesh.available_property_fields) <= set(copy.available_property_fields)
+    assert np.array_equal(copy.elements.materials_field.data, mesh.elements.materials_field.data)
+    assert np.array_equal(
+        copy.elements.connectivities_field._data_pointer,
+        mesh.elements.connectivities_field._data_pointer,
+    )
+
+
 @pytest.mark.skipif(
     not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
     reason="Bug in server version lower than 4.0",
@@ -115,6 +115,20 @@ def test_iterate_results_model(allkindofcomplexity):
         key()
 
 
+def test_results_created_on_first_use(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    results = model.results
+    stress = results.stress
+    assert stress._operator_instance is None
+    assert "stress" in stress.__doc__.lower()
+    assert "stress" in type(results).__dict__["stress"].__doc__.lower()
+    op = stress()
+    assert stress() is op
+    assert stress._operator_instance is op
+    assert len(op.outputs.fields_container()) > 0
+    assert len(list(results)) == len(results)
+
+
 def test_result_not_overrided(plate_msup):
     model1 = dpf.core.Model(examples.find_electric_therm())
     size = len(model1.results)
@@ -182,6 +196,18 @@ def test_result_time_scoping(plate_msup):
     assert np.allclose(fc.time_freq_support.time_frequencies.data, np.array([0.115, 0.125]))
 
 
+def test_result_iter_chunks(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    stress = model.results.stress
+    all_times = stress.on_all_time_freqs.eval()
+    for prefetch in [True, False]:
+        chunks = list(stress.iter_chunks(chunk_size=8, prefetch=prefetch))
+        assert [len(fc) for fc in chunks] == [8, 8, 4]
+        assert np.allclose(chunks[1][0].data, all_times[8].data)
+    chunks = list(stress.on_time_scoping([1, 2, 3, 19]).iter_chunks(chunk_size=3))
+    assert [fc.get_label_scoping("time").ids.tolist() for fc in chunks] == [[1, 2, 3], [19]]
+
+
 def test_result_split_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
@@ -11,7 +11,7 @@ from ansys import dpf
 from ansys.dpf.core import errors
 from ansys.dpf.core import operators as ops
 from ansys.dpf.core.misc import get_ansys_path
-from ansys.dpf.core.operator_specification import Specification
+from ansys.dpf.core.operator_specification import Specification, clear_specification_cache
 import conftest
 from conftest import (
     SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_3_0,
@@ -274,6 +274,84 @@ def test_eval_operator(server_type):
     op.run()
 
 
+def test_eval_async_operator(server_type):
+    import asyncio
+
+    op = dpf.core.Operator("min_max", server=server_type)
+    inpt = dpf.core.Field(nentities=3, server=server_type)
+    inpt.data = range(1, 10)
+    scop = dpf.core.Scoping(server=server_type)
+    scop.ids = [1, 2, 3]
+    inpt.scoping = scop
+    op.connect(0, inpt)
+
+    future = op.eval_async()
+    assert np.allclose(future.result().data, [1.0, 2.0, 3.0])
+    future = op.get_output_async(1, dpf.core.types.field)
+    assert np.allclose(future.result().data, [7.0, 8.0, 9.0])
+    out = asyncio.run(op.aget_output(1, dpf.core.types.field))
+    assert np.allclose(out.data, [7.0, 8.0, 9.0])
+
+    # errors are raised by the future
+    op_without_input = dpf.core.Operator("min_max", server=server_type)
+    with pytest.raises(Exception):
+        op_without_input.get_output_async(0, dpf.core.types.field).result()
+
+
+def test_operator_cache(allkindofcomplexity, server_type):
+    from ansys.dpf.core import settings
+
+    def norm_of_displacement(time_scoping):
+        data_sources = dpf.core.DataSources(allkindofcomplexity, server=server_type)
+        disp = dpf.core.operators.result.displacement(
+            data_sources=data_sources, time_scoping=time_scoping, server=server_type
+        )
+        return dpf.core.operators.math.norm_fc(disp, server=server_type)
+
+    settings.enable_operator_cache()
+    try:
+        norm = norm_of_displacement([1])
+        first = norm.outputs.fields_container()
+        assert settings.get_operator_cache_stats()["misses"] == 1
+        assert norm_of_displacement([1]).outputs.fields_container() is first
+        assert norm_of_displacement([2]).outputs.fields_container() is not first
+        stats = settings.get_operator_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["entries"] == 2
+        assert stats["size"] > 0
+
+        # reconnecting an input invalidates the outputs of the operator
+        norm.inputs.fields_container.connect(
+            dpf.core.operators.result.displacement(
+                data_sources=dpf.core.DataSources(allkindofcomplexity, server=server_type),
+                server=server_type,
+            )
+        )
+        assert settings.get_operator_cache_stats()["entries"] == 1
+
+        # operators with inputs without fingerprint are not cached
+        field = dpf.core.fields_factory.create_3d_vector_field(2, server=server_type)
+        dpf.core.operators.math.norm(field, server=server_type).outputs.field()
+        assert settings.get_operator_cache_stats()["entries"] == 1
+        data_sources = dpf.core.DataSources(allkindofcomplexity, server=server_type)
+        data_sources.add_upstream(dpf.core.DataSources(allkindofcomplexity, server=server_type))
+        dpf.core.operators.result.displacement(
+            data_sources=data_sources, server=server_type
+        ).outputs.fields_container()
+        assert settings.get_operator_cache_stats()["entries"] == 1
+
+        # the inputs of the operators of a workflow can be connected without being recorded
+        norm = norm_of_displacement([1])
+        workflow = dpf.core.Workflow(server=server_type)
+        workflow.add_operator(norm)
+        assert norm.outputs.fields_container() is not first
+        assert settings.get_operator_cache_stats()["entries"] == 1
+    finally:
+        settings.disable_operator_cache()
+    assert settings.get_operator_cache_stats()["entries"] == 0
+
+
 def test_inputs_outputs_1_operator(cyclic_lin_rst, cyclic_ds, tmpdir):
     data_sources = dpf.core.DataSources(cyclic_lin_rst)
     data_sources.add_file_path(cyclic_ds)
@@ -1205,6 +1283,18 @@ def test_operator_specification_simple(server_type):
     assert "field" in spec.outputs[0].type_names[0]
 
 
+def test_operator_specification_cached(server_type):
+    op1 = dpf.core.Operator("min_max", server=server_type)
+    op2 = dpf.core.Operator("min_max", server=server_type)
+    assert op1.specification is op2.specification
+    assert type(op1.inputs.field) is type(op2.inputs.field)
+    assert op1.inputs.field.__doc__ == op2.inputs.field.__doc__
+    clear_specification_cache(server_type)
+    op3 = dpf.core.Operator("min_max", server=server_type)
+    assert op3.specification is not op1.specification
+    assert op3.specification.inputs[0].name == op1.specification.inputs[0].name
+
+
 def test_operator_specification_none(server_type):
     op = dpf.core.Operator("mapdl::rst::thickness", server=server_type)
     assert op.specification.description == ""
@@ -1294,3 +1384,30 @@ def test_delete_auto_operator(server_type):
     op = None
     gc.collect()
     assert op_ref() is None
+
+
+def test_operators_lazy_import():
+    from ansys.dpf.core.operators.result import stress
+
+    assert ops.result.stress is stress
+    assert issubclass(stress, dpf.core.Operator)
+    assert "stress" in dir(ops.result)
+    assert "result" in dir(ops)
+    assert "displacement" in ops.result.__all__
+    with pytest.raises(AttributeError):
+        ops.result.not_an_operator
+
+
+def test_operators_lazy_init_files(tmpdir):
+    from ansys.dpf.core._lazy_operators import write_init_files
+
+    category = tmpdir.mkdir("category")
+    category.join("__init__.py").write("from .op import op\n")
+    category.join("op.py").write("")
+    tmpdir.mkdir("not_a_package").join("other.py").write("")
+    write_init_files(str(tmpdir))
+    assert '"op",' in category.join("__init__.py").read()
+    init = tmpdir.join("__init__.py").read()
+    assert '"category",' in init
+    assert "not_a_package" not in init
+    assert "classes=False" in init
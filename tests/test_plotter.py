@@ -119,6 +119,24 @@ def test_plotter_on_fields_container_nodal(allkindofcomplexity):
     cpos = pl.plot_contour(fc)
 
 
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_plotter_merge_fields_data_split_by_body(allkindofcomplexity):
+    import numpy as np
+
+    model = Model(allkindofcomplexity)
+    mesh = model.metadata.meshed_region
+    fc = model.results.displacement.split_by_body.eval()
+    overall_data, _ = Plotter._merge_fields_data(fc, mesh)
+    assert overall_data.shape == (len(mesh.nodes), 3)
+    expected = np.full((len(mesh.nodes), 3), np.nan)
+    for field in fc:
+        ind, mask = mesh.nodes.map_scoping(field.scoping)
+        expected[ind] = field.data[mask]
+    assert np.allclose(overall_data, expected, equal_nan=True)
+    pl = Plotter(mesh)
+    pl.plot_contour(fc, off_screen=True)
+
+
 @pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
 def test_plot_fieldscontainer_on_mesh(allkindofcomplexity):
     model = Model(allkindofcomplexity)
@@ -655,6 +673,27 @@ def test_plot_warped_mesh(multishells):
     meshes_cont.plot(disp_fc, deform_by=disp_result, scale_factor=scale_factor)
 
 
+@pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
+def test_deformed_grid_shares_cells(multishells):
+    import numpy as np
+
+    model = core.Model(multishells)
+    mesh = model.metadata.meshed_region
+    disp_field = model.results.displacement.on_time_scoping([1]).eval()[0]
+    points = mesh._deformed_points(disp_field, 0.001)
+    assert np.allclose(points, mesh.deform_by(disp_field, 0.001).data)
+    original_points = np.array(mesh.grid.points)
+    grid = mesh._deformed_grid(disp_field, 0.001)
+    assert np.allclose(grid.points, points)
+    assert np.allclose(mesh.grid.points, original_points)
+    assert grid.n_cells == mesh.grid.n_cells
+    # non-homogeneous scale factor
+    scale_field = dpf.core.fields_factory.field_from_array(np.full(len(mesh.nodes), 0.002))
+    scale_field.scoping = mesh.nodes.scoping
+    points = mesh._deformed_points(disp_field, scale_field)
+    assert np.allclose(points, mesh._deformed_points(disp_field, 0.002))
+
+
 @pytest.mark.skipif(not HAS_PYVISTA, reason="This test requires pyvista")
 @pytest.mark.skipif(
     not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_5_0,
@@ -733,3 +772,28 @@ def test_plot_polyhedron():
 
     # Plot the MeshedRegion
     mesh.plot()
+
+
+@pytest.mark.skipif(not HAS_PYVISTA, reason="Please install pyvista")
+def test_build_vtk_cells_polyhedron_quad8():
+    import numpy as np
+    from ansys.dpf.core.vtk_helper import _build_vtk_cells, VTK_LINEAR_MAPPING
+
+    # a quad8, a tetrahedron written as polyhedron and a tri3
+    etypes = np.array([6, 34, 14])
+    connectivity = np.array([0, 1, 2, 3, 4, 5, 6, 7, 0, 1, 2, 3, 4, 5, 6])
+    data_pointer = np.array([0, 8, 12])
+    elements_faces = (np.array([0, 1, 2, 3]), np.array([0, 0, 4]))
+    faces_nodes = (
+        np.array([0, 1, 2, 0, 1, 3, 1, 2, 3, 0, 2, 3]),
+        np.array([0, 3, 6, 9]),
+    )
+    cells, cell_types, offsets = _build_vtk_cells(
+        etypes, connectivity, data_pointer, elements_faces, faces_nodes, as_linear=True
+    )
+    expected = [4, 0, 1, 2, 3]
+    expected += [17, 4, 3, 0, 1, 2, 3, 0, 1, 3, 3, 1, 2, 3, 3, 0, 2, 3]
+    expected += [3, 4, 5, 6]
+    assert cells.tolist() == expected
+    assert offsets.tolist() == [0, 5, 23]
+    assert cell_types.tolist() == VTK_LINEAR_MAPPING[etypes].tolist()
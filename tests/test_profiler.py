@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from ansys.dpf import core as dpf
+from ansys.dpf.core import profiler
+
+
+def test_profile_counts_api_calls(simple_bar, server_type):
+    model = dpf.Model(simple_bar, server=server_type)
+    mesh = model.metadata.meshed_region
+    with dpf.profile() as profile:
+        for _ in range(5):
+            mesh.unit
+    stats = {stat["function"]: stat for stat in profile.stats()}
+    assert stats["meshed_region_get_unit"]["calls"] == 5
+    assert stats["meshed_region_get_unit"]["bytes"] > 0
+    callers = profile.stats(by="caller")
+    assert all(stat["caller"] for stat in callers)
+
+    json_profile = json.loads(profile.to_json())
+    assert json_profile["calls"] == profile.n_calls
+    folded = profile.to_folded(metric="calls").splitlines()
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in folded) == profile.n_calls
+    with pytest.raises(ValueError):
+        profile.stats(by="line")
+
+    # the API functions are restored once the profile stops
+    assert not profiler._originals
+    n_calls = profile.n_calls
+    mesh.unit
+    assert profile.n_calls == n_calls
+
+
+def test_profile_payload_size():
+    import numpy as np
+
+    assert profiler._payload_size(np.zeros(10)) == 80
+    assert profiler._payload_size([1, 2, 3]) == 24
+    assert profiler._payload_size("abc") == 3
+    assert profiler._payload_size(None) == 0
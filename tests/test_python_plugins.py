@@ -98,6 +98,29 @@ def test_property_field(server_type_remote_process, testfiles_dir):
     )
 
 
+def test_field_arrays(server_type_remote_process, testfiles_dir):
+    load_all_types_plugin_with_serv(server_type_remote_process, testfiles_dir)
+    f = dpf.fields_factory.create_3d_vector_field(3, "Elemental", server=server_type_remote_process)
+    f.data = np.arange(9, dtype=np.float64).reshape(3, 3)
+    f.scoping.ids = [4, 5, 6]
+    op = dpf.Operator("custom_double_field_array", server=server_type_remote_process)
+    op.connect(0, f)
+    out = op.get_output(0, dpf.types.field)
+    assert np.allclose(out.data, 2.0 * np.arange(9).reshape(3, 3))
+    assert out.location == "Elemental"
+    assert np.array_equal(out.scoping.ids, [4, 5, 6])
+    pf = dpf.PropertyField(server=server_type_remote_process)
+    pf.data = np.arange(9, dtype=np.int32)
+    op = dpf.Operator("custom_forward_property_field_array", server=server_type_remote_process)
+    op.connect(0, pf)
+    assert np.array_equal(op.get_output(0, dpf.types.property_field).data, np.arange(9))
+    # the number of components of a PropertyField cannot be set
+    op = dpf.Operator("custom_property_field_array_2d", server=server_type_remote_process)
+    op.connect(0, pf)
+    with pytest.raises(DPFServerException):
+        op.get_output(0, dpf.types.property_field)
+
+
 @conftest.raises_for_servers_version_under("5.0")
 def test_string_field(server_type_remote_process, testfiles_dir):
     load_all_types_plugin_with_serv(server_type_remote_process, testfiles_dir)
@@ -606,3 +606,43 @@ def test_distributed_workflows_integral_types():
         fwd2.inputs.connect(fwd1.outputs)
 
         fwd2.get_output(0, data["type"])
+
+
+@pytest.mark.skipif(
+    not conftest.SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_4_0,
+    reason="Copying workflows on other servers requires a server version higher than 4.0",
+)
+def test_server_pool_map_distributed_files():
+    files = examples.download_distributed_files()
+    wf = core.Workflow()
+    op = ops.result.displacement()
+    average = core.operators.math.norm_fc(op)
+    wf.add_operators([op, average])
+    wf.set_input_name("data_sources", op.inputs.data_sources)
+    wf.set_output_name("distrib", average.outputs.fields_container)
+
+    pool = core.ServerPool(servers=[local_servers[0], local_servers[1]])
+    assert len(pool) == 2
+    merged = pool.map(wf, [files[0], files[1]])
+    max_field = ops.min_max.min_max_fc(merged).outputs.field_max()
+    assert np.allclose(max_field.data, [10.03242272])
+
+    gathered = pool.map(wf, [files[0], files[1]], label="domain")
+    assert "domain" in gathered.labels
+    assert len(gathered.get_fields({"domain": 1})) == len(merged)
+    # the servers given to the pool are not shut down with it
+    pool.shutdown()
+    assert local_servers[0].info
+
+
+def test_server_pool_data_sources_on_server(simple_bar, cyclic_ds):
+    data_sources = core.DataSources(simple_bar)
+    data_sources.add_file_path(cyclic_ds, "ds")
+    copy = core.ServerPool._data_sources_on_server(data_sources, local_servers[0])
+    assert copy.result_key == data_sources.result_key
+    assert sorted(copy._paths_by_key()) == sorted(data_sources._paths_by_key())
+
+    # the upstreams cannot be read back to be copied
+    data_sources.add_upstream(core.DataSources(simple_bar))
+    with pytest.raises(ValueError):
+        core.ServerPool._data_sources_on_server(data_sources, local_servers[0])
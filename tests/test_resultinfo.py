@@ -71,6 +71,19 @@ def test_print_result_info(model):
     print(model.metadata.result_info)
 
 
+def test_result_info_snapshot(model):
+    res = model.metadata.result_info
+    txt = str(res)
+    names = [result.name for result in res]
+    with dpf.core.profile() as profile:
+        assert str(res) == txt
+        assert [result.name for result in res.available_results] == names
+        assert res["acceleration"].unit == "m/s^2"
+        assert len(res) == 14
+        assert res.analysis_type == "static"
+    assert profile.n_calls == 0
+
+
 @pytest.mark.skipif(True, reason="Used to test memory leaks")
 def test_result_info_memory_leaks(model):
     import gc
@@ -42,6 +42,17 @@ def test_set_get_ids_scoping(server_type):
     assert np.allclose(scop.ids, ids)
 
 
+def test_set_get_ids_array_types_scoping(server_type):
+    scop = Scoping(server=server_type)
+    ids = np.arange(1, 1001, dtype=np.int64)
+    scop.ids = ids
+    assert np.array_equal(scop.ids, ids)
+    scop.ids = ids[::2]
+    assert np.array_equal(scop.ids, ids[::2])
+    scop.ids = ids.astype(np.int32)
+    assert np.array_equal(scop.ids, ids)
+
+
 @pytest.mark.skipif(
     not SERVERS_VERSION_GREATER_THAN_OR_EQUAL_TO_2_0,
     reason="Requires server version higher than 2.0",
@@ -274,6 +285,21 @@ def test_as_local_scoping2():
         assert hasattr(loc, "_is_set") is False
 
 
+def test_as_local_scoping_sparse_ids_index():
+    scop = Scoping()
+    with scop.as_local_scoping() as loc:
+        loc.ids = [10 * i + 7 for i in range(50)]
+        assert loc.index(17) == 1
+        for i in range(50, 100):
+            loc.append(1000 * i)
+            assert loc.index(1000 * i) == i
+        loc.set_id(0, 3)
+        assert loc.index(3) == 0
+        assert loc.index(7) == -1
+        assert loc.index(-5) == -1
+        assert loc.index(497) == 49
+
+
 def test_auto_delete_scoping_local():
     scop = Scoping()
     s = scop.as_local_scoping()
@@ -286,3 +286,86 @@ def test_start_after_shutting_down_server():
     info = remote_server.info
     remote_server.shutdown()
     assert info is not None
+
+
+@pytest.mark.parametrize("selection", ["round_robin", "least_busy"])
+def test_legacy_grpc_server_channels(selection):
+    from concurrent.futures import ThreadPoolExecutor
+
+    server = start_local_server(
+        config=dpf.core.AvailableServerConfigs.LegacyGrpcServer, as_global=False
+    )
+    try:
+        field = dpf.core.fields_factory.create_3d_vector_field(10, server=server)
+        size = field.scoping.size
+        server.set_channels(4, selection=selection)
+        assert server.n_channels == 4
+
+        def get_size(_):
+            return field.scoping.size
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert set(executor.map(get_size, range(64))) == {size}
+        field.data = list(range(30))
+        assert field.data.shape == (10, 3)
+        server.set_channels(1)
+        assert server.n_channels == 1
+        assert field.component_count == 3
+        server.set_channels(2)
+    finally:
+        server.shutdown()
+    # the channels opened by set_channels are closed with the server
+    assert server.n_channels == 1
+
+
+def test_server_pool_owned_servers():
+    pool = dpf.core.ServerPool(n_servers=2)
+    try:
+        assert len(pool) == 2
+        assert all(server.info for server in pool.servers)
+        stopped = pool.servers[0]
+        stopped.shutdown()
+        # the server which stopped answering is replaced
+        assert pool.check_health() == 2
+        assert all(server is not stopped for server in pool.servers)
+        assert all(server.info for server in pool.servers)
+    finally:
+        pool.shutdown()
+    assert len(pool) == 0
+
+
+def test_warm_server_pool():
+    with dpf.core.WarmServerPool(size=2, max_uses=2) as pool:
+        assert pool.size == 2
+        with pool.server(timeout=60) as first:
+            assert first.info
+            field = dpf.core.fields_factory.create_scalar_field(3, server=first)
+            assert field._internal_obj is not None
+        used = [first]
+        for _ in range(3):
+            with pool.server(timeout=60) as server:
+                assert server.info
+                used.append(server)
+        # each server is handed out twice before being restarted
+        assert sum(server is first for server in used) == 2
+        with pytest.raises(ValueError):
+            pool.release(first)
+    with pytest.raises(ValueError):
+        pool.acquire()
+
+
+def test_warm_server_pool_restart_default_config():
+    with dpf.core.WarmServerPool(size=2, max_uses=1) as pool:
+        # without background starts, the first server only is started on creation
+        assert pool.n_ready == 1
+        with pool.server(timeout=60) as first:
+            assert first.info
+        # the retired server and the missing one are started once it is given back
+        assert pool.n_ready == 2
+        with pool.server(timeout=60) as second:
+            assert second is not first
+            second.shutdown()
+        assert pool.n_ready == 2
+        with pool.server(timeout=60) as third:
+            assert third is not second
+            assert third.info
@@ -43,6 +43,36 @@ def test_connect_field_workflow(server_type):
     assert np.allclose(f_out.data, [7.0, 8.0, 9.0])
 
 
+def test_get_output_async_workflow(server_type):
+    import asyncio
+
+    wf = dpf.core.Workflow(server=server_type)
+    op = dpf.core.Operator("min_max", server=server_type)
+    inpt = dpf.core.Field(nentities=3, server=server_type)
+    inpt.data = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    scop = dpf.core.Scoping(server=server_type)
+    scop.ids = [1, 2, 3]
+    inpt.scoping = scop
+    wf.add_operator(op)
+    wf.set_input_name("field", op.inputs.field)
+    wf.set_output_name("min", op.outputs.field_min)
+    wf.set_output_name("max", op.outputs.field_max)
+    wf.connect("field", inpt)
+
+    future = wf.get_output_async("min", dpf.core.types.field)
+    assert np.allclose(future.result().data, [1.0, 2.0, 3.0])
+
+    async def get_min_max():
+        return await asyncio.gather(
+            wf.aget_output("min", dpf.core.types.field),
+            wf.aget_output("max", dpf.core.types.field),
+        )
+
+    f_min, f_max = asyncio.run(get_min_max())
+    assert np.allclose(f_min.data, [1.0, 2.0, 3.0])
+    assert np.allclose(f_max.data, [7.0, 8.0, 9.0])
+
+
 def test_connect_list_workflow(velocity_acceleration, server_type):
     wf = dpf.core.Workflow(server=server_type)
     model = dpf.core.Model(velocity_acceleration, server=server_type)
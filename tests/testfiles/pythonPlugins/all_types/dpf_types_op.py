@@ -192,3 +192,49 @@ class ForwardDataTreeOperator(CustomOperatorBase):
     @property
     def name(self):
         return "custom_forward_data_tree"
+
+
+class DoubleFieldArrayOperator(CustomOperatorBase):
+    def run(self):
+        data = self.get_input_array(0)
+        f = self.get_input(0, field.Field)
+        self.set_output_array(0, data * 2.0, scoping=f.scoping, location=f.location)
+        self.set_succeeded()
+
+    @property
+    def specification(self):
+        return None
+
+    @property
+    def name(self):
+        return "custom_double_field_array"
+
+
+class ForwardPropertyFieldArrayOperator(CustomOperatorBase):
+    def run(self):
+        data = self.get_input_array(0, property_field.PropertyField)
+        self.set_output_array(0, data)
+        self.set_succeeded()
+
+    @property
+    def specification(self):
+        return None
+
+    @property
+    def name(self):
+        return "custom_forward_property_field_array"
+
+
+class PropertyFieldArray2DOperator(CustomOperatorBase):
+    def run(self):
+        data = self.get_input_array(0, property_field.PropertyField)
+        self.set_output_array(0, data.reshape(-1, 3))
+        self.set_succeeded()
+
+    @property
+    def specification(self):
+        return None
+
+    @property
+    def name(self):
+        return "custom_property_field_array_2d"
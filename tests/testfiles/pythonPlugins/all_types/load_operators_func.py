@@ -23,3 +23,6 @@ def load_operators(*args):
     record_operator(dpf_types_op.ForwardMeshesContainerOperator, *args)
     record_operator(dpf_types_op.ForwardWorkflowOperator, *args)
     record_operator(dpf_types_op.ForwardDataTreeOperator, *args)
+    record_operator(dpf_types_op.DoubleFieldArrayOperator, *args)
+    record_operator(dpf_types_op.ForwardPropertyFieldArrayOperator, *args)
+    record_operator(dpf_types_op.PropertyFieldArray2DOperator, *args)